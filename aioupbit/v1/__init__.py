@@ -1,8 +1,111 @@
 from __future__ import annotations
 
-from .aiohttp_client import *
-from .client import *
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple
+
+from . import constants, values
 from .constants import *
 from .values import *
 
-RestClient = AioHTTPRestClient
+if TYPE_CHECKING:
+    from .aggregation import *
+    from .aiohttp_client import *
+    from .cache import *
+    from .client import *
+    from .columnar import *
+    from .indicators import *
+    from .instrumentation import *
+    from .keepalive import *
+    from .latest import *
+    from .order_tracker import *
+    from .pipeline import *
+    from .polling import *
+    from .rate_limit import *
+    from .replay import *
+    from .shared_memory import *
+    from .sharding import *
+    from .sync_client import *
+    from .trade_tape import *
+    from .transport import *
+    from .websocket import *
+
+    RestClient = AioHTTPRestClient
+
+# `constants` and `values` are cheap to import. The other modules, which pull in aiohttp, PyJWT and asyncio,
+# are imported on the first access of one of their names (PEP 562), and each must be listed here.
+_LAZY_ATTRIBUTES: Dict[str, Tuple[str, str]] = {
+    'CandleAggregator': ('aggregation', 'CandleAggregator'),
+    'AioHTTPRestClient': ('aiohttp_client', 'AioHTTPRestClient'),
+    'RestClient': ('aiohttp_client', 'AioHTTPRestClient'),
+    'CacheEntry': ('cache', 'CacheEntry'),
+    'CacheBackend': ('cache', 'CacheBackend'),
+    'MemoryCacheBackend': ('cache', 'MemoryCacheBackend'),
+    'DiskCacheBackend': ('cache', 'DiskCacheBackend'),
+    'ResponseCache': ('cache', 'ResponseCache'),
+    'Client': ('client', 'Client'),
+    'BaseRestClient': ('client', 'BaseRestClient'),
+    'CandleBatch': ('columnar', 'CandleBatch'),
+    'CandleGrid': ('columnar', 'CandleGrid'),
+    'Indicator': ('indicators', 'Indicator'),
+    'SMA': ('indicators', 'SMA'),
+    'EMA': ('indicators', 'EMA'),
+    'RSI': ('indicators', 'RSI'),
+    'ATR': ('indicators', 'ATR'),
+    'VWAP': ('indicators', 'VWAP'),
+    'IndicatorEngine': ('indicators', 'IndicatorEngine'),
+    'RequestMetrics': ('instrumentation', 'RequestMetrics'),
+    'Instrument': ('instrumentation', 'Instrument'),
+    'TRACE_CONFIG': ('instrumentation', 'TRACE_CONFIG'),
+    'ConnectionWarmer': ('keepalive', 'ConnectionWarmer'),
+    'LatestValueStore': ('latest', 'LatestValueStore'),
+    'OrderTracker': ('order_tracker', 'OrderTracker'),
+    'Overflow': ('pipeline', 'Overflow'),
+    'SubscriptionClosed': ('pipeline', 'SubscriptionClosed'),
+    'Subscription': ('pipeline', 'Subscription'),
+    'Pipeline': ('pipeline', 'Pipeline'),
+    'poll_items': ('pipeline', 'poll_items'),
+    'TickPoller': ('polling', 'TickPoller'),
+    'REQUESTS_PER_SECOND': ('rate_limit', 'REQUESTS_PER_SECOND'),
+    'RateLimiter': ('rate_limit', 'RateLimiter'),
+    'Record': ('replay', 'Record'),
+    'RecordFile': ('replay', 'RecordFile'),
+    'FileRecordingTransport': ('replay', 'FileRecordingTransport'),
+    'TimedReplayTransport': ('replay', 'TimedReplayTransport'),
+    'ReplayFinished': ('replay', 'ReplayFinished'),
+    'ReplayClient': ('replay', 'ReplayClient'),
+    'SharedMarketTable': ('shared_memory', 'SharedMarketTable'),
+    'SharedMemoryPublisher': ('shared_memory', 'SharedMemoryPublisher'),
+    'ShardedClient': ('sharding', 'ShardedClient'),
+    'SyncRestClient': ('sync_client', 'SyncRestClient'),
+    'TradeStore': ('trade_tape', 'TradeStore'),
+    'MemoryTradeStore': ('trade_tape', 'MemoryTradeStore'),
+    'FileTradeStore': ('trade_tape', 'FileTradeStore'),
+    'TradeTapeSyncer': ('trade_tape', 'TradeTapeSyncer'),
+    'Response': ('transport', 'Response'),
+    'ResponseError': ('transport', 'ResponseError'),
+    'Transport': ('transport', 'Transport'),
+    'AioHTTPTransport': ('transport', 'AioHTTPTransport'),
+    'HTTPXTransport': ('transport', 'HTTPXTransport'),
+    'ReplayTransport': ('transport', 'ReplayTransport'),
+    'RecordingTransport': ('transport', 'RecordingTransport'),
+    'TransportRestClient': ('transport', 'TransportRestClient'),
+    'ExchangeEvent': ('websocket', 'ExchangeEvent'),
+    'ExchangeStream': ('websocket', 'ExchangeStream'),
+    'StreamError': ('websocket', 'StreamError'),
+}
+
+__all__ = (*constants.__all__, *values.__all__, *_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module, attribute = _LAZY_ATTRIBUTES[name]
+    except KeyError:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}') from None
+    value = getattr(importlib.import_module(f'.{module}', __name__), attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted({*globals(), *_LAZY_ATTRIBUTES})
@@ -0,0 +1,286 @@
+from __future__ import annotations
+
+import datetime
+from decimal import Decimal
+from enum import Enum
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from typing_extensions import TypeAlias
+
+from aioupbit.v1 import values
+
+__all__ = ('CandleAggregator',)
+
+
+class _Bar:
+    __slots__ = (
+        'start',
+        'opening_price',
+        'high_price',
+        'low_price',
+        'trade_price',
+        'latest_tick_timestamp',
+        'acc_trade_price',
+        'acc_trade_volume',
+        'prev_closing_price',
+        'dirty',
+    )
+
+    def __init__(self, start: datetime.datetime, price: Decimal, timestamp: datetime.datetime) -> None:
+        self.start = start
+        self.opening_price = self.high_price = self.low_price = self.trade_price = price
+        self.latest_tick_timestamp = timestamp
+        self.acc_trade_price = Decimal(0)
+        self.acc_trade_volume = Decimal(0)
+        self.prev_closing_price: Optional[Decimal] = None
+        self.dirty = False
+
+    @classmethod
+    def from_candle(cls, candle: values.BaseCandle) -> _Bar:
+        bar = cls(candle.date_time, candle.opening_price, candle.latest_tick_timestamp)
+        bar.high_price = candle.high_price
+        bar.low_price = candle.low_price
+        bar.trade_price = candle.trade_price
+        bar.acc_trade_price = candle.acc_trade_price
+        bar.acc_trade_volume = candle.acc_trade_volume
+        if isinstance(candle, values.DayCandle):
+            bar.prev_closing_price = candle.prev_closing_price
+        return bar
+
+    def add(self, trade: values.Trade) -> None:
+        price = trade.trade_price
+        if price > self.high_price:
+            self.high_price = price
+        if price < self.low_price:
+            self.low_price = price
+        self.trade_price = price
+        self.latest_tick_timestamp = trade.timestamp
+        self.acc_trade_price += price * trade.trade_volume
+        self.acc_trade_volume += trade.trade_volume
+        self.prev_closing_price = trade.prev_closing_price
+        self.dirty = True
+
+
+class CandleAggregator:
+    """
+    Builds candles incrementally from `values.Trade` of any number of markets.
+
+    Bars are aligned in UTC like the candles of the REST API.
+    (minute units from the epoch, days from 00:00, weeks from Monday and months from the first day)
+    A bar is closed when a trade of a later period arrives or `flush()` is called after its period,
+    and `on_close` is called with the closed candle.
+
+    Trades must be given in ascending order of `sequential_id` per market;
+    trades that are not newer than the last one seen are ignored, so overlapping polling results can be fed as is.
+    A trade arriving late for a period that `flush()` has already closed is dropped from that timeframe
+    and counted in `late_trades`, so a period is never emitted twice.
+    """
+
+    class Period(str, Enum):
+        DAY = 'day'
+        WEEK = 'week'
+        MONTH = 'month'
+
+    Timeframe: TypeAlias = Union[values.MinCandle.Unit, Period]
+
+    __slots__ = (
+        'timeframes',
+        'on_close',
+        'late_trades',
+        '_bars',
+        '_seeded_until',
+        '_closed_until',
+        '_last_sequential_ids',
+    )
+
+    def __init__(
+        self,
+        timeframes: Iterable[Timeframe] = (*values.MinCandle.Unit, *Period),
+        on_close: Optional[Callable[[values.BaseCandle], None]] = None,
+    ) -> None:
+        self.timeframes: Tuple[CandleAggregator.Timeframe, ...] = tuple(timeframes)
+        self.on_close = on_close
+        self.late_trades = 0
+        self._bars: Dict[Tuple[str, CandleAggregator.Timeframe], _Bar] = dict()
+        self._seeded_until: Dict[Tuple[str, CandleAggregator.Timeframe], datetime.datetime] = dict()
+        # end of the latest period closed by `flush()`
+        self._closed_until: Dict[Tuple[str, CandleAggregator.Timeframe], datetime.datetime] = dict()
+        self._last_sequential_ids: Dict[str, int] = dict()
+
+    @classmethod
+    def _period_start(cls, timeframe: Timeframe, at: datetime.datetime) -> datetime.datetime:
+        at = at.astimezone(datetime.timezone.utc)
+        if isinstance(timeframe, values.MinCandle.Unit):
+            seconds = int(at.timestamp())
+            return datetime.datetime.fromtimestamp(seconds - seconds % (timeframe * 60), datetime.timezone.utc)
+        day = datetime.datetime(at.year, at.month, at.day, tzinfo=datetime.timezone.utc)
+        if timeframe is cls.Period.DAY:
+            return day
+        if timeframe is cls.Period.WEEK:
+            return day - datetime.timedelta(days=day.weekday())
+        return day.replace(day=1)
+
+    @classmethod
+    def _next_period_start(cls, timeframe: Timeframe, start: datetime.datetime) -> datetime.datetime:
+        if isinstance(timeframe, values.MinCandle.Unit):
+            return start + datetime.timedelta(minutes=timeframe)
+        if timeframe is cls.Period.DAY:
+            return start + datetime.timedelta(days=1)
+        if timeframe is cls.Period.WEEK:
+            return start + datetime.timedelta(weeks=1)
+        if start.month == 12:
+            return start.replace(year=start.year + 1, month=1)
+        return start.replace(month=start.month + 1)
+
+    @classmethod
+    def _timeframe_of(cls, candle: values.BaseCandle) -> Timeframe:
+        if isinstance(candle, values.MinCandle):
+            return candle.unit
+        if isinstance(candle, values.DayCandle):
+            return cls.Period.DAY
+        if isinstance(candle, values.MonthCandle):
+            return cls.Period.MONTH
+        if isinstance(candle, values.WeekCandle):
+            return cls.Period.WEEK
+        raise TypeError(f'unsupported candle type: {type(candle).__name__}')
+
+    def _to_candle(self, ticker: str, timeframe: Timeframe, bar: _Bar) -> values.BaseCandle:
+        if isinstance(timeframe, values.MinCandle.Unit):
+            return values.MinCandle(
+                ticker=ticker,
+                date_time=bar.start,
+                opening_price=bar.opening_price,
+                high_price=bar.high_price,
+                low_price=bar.low_price,
+                trade_price=bar.trade_price,
+                latest_tick_timestamp=bar.latest_tick_timestamp,
+                acc_trade_price=bar.acc_trade_price,
+                acc_trade_volume=bar.acc_trade_volume,
+                unit=timeframe,
+            )
+        if timeframe is self.Period.DAY:
+            prev_closing_price = bar.opening_price if bar.prev_closing_price is None else bar.prev_closing_price
+            change_price = bar.trade_price - prev_closing_price
+            return values.DayCandle(
+                ticker=ticker,
+                date_time=bar.start,
+                opening_price=bar.opening_price,
+                high_price=bar.high_price,
+                low_price=bar.low_price,
+                trade_price=bar.trade_price,
+                latest_tick_timestamp=bar.latest_tick_timestamp,
+                acc_trade_price=bar.acc_trade_price,
+                acc_trade_volume=bar.acc_trade_volume,
+                prev_closing_price=prev_closing_price,
+                change_price=change_price,
+                change_rate=change_price / prev_closing_price if prev_closing_price else Decimal(0),
+                converted_trade_price=None,
+            )
+        candle_type = values.WeekCandle if timeframe is self.Period.WEEK else values.MonthCandle
+        return candle_type(
+            ticker=ticker,
+            date_time=bar.start,
+            opening_price=bar.opening_price,
+            high_price=bar.high_price,
+            low_price=bar.low_price,
+            trade_price=bar.trade_price,
+            latest_tick_timestamp=bar.latest_tick_timestamp,
+            acc_trade_price=bar.acc_trade_price,
+            acc_trade_volume=bar.acc_trade_volume,
+            first_day_of_period=bar.start.date(),
+        )
+
+    def _close(self, ticker: str, timeframe: Timeframe, bar: _Bar) -> Optional[values.BaseCandle]:
+        if not bar.dirty:
+            return None
+        candle = self._to_candle(ticker, timeframe, bar)
+        if self.on_close is not None:
+            self.on_close(candle)
+        return candle
+
+    def seed(self, candle: values.BaseCandle) -> None:
+        """
+        Starts the bar of `candle`'s period from the candle, typically the latest one from the REST API.
+        Trades up to its `latest_tick_timestamp` are treated as already included.
+        A seeded bar is not passed to `on_close` unless a trade is added to it.
+        """
+        key = (candle.ticker, self._timeframe_of(candle))
+        if key[1] not in self.timeframes:
+            return
+        current = self._bars.get(key)
+        if current is not None and current.start > candle.date_time:
+            return
+        closed_until = self._closed_until.get(key)
+        if closed_until is not None and candle.date_time < closed_until:
+            return
+        self._bars[key] = _Bar.from_candle(candle)
+        self._seeded_until[key] = candle.latest_tick_timestamp
+
+    def update(self, trade: values.Trade) -> None:
+        ticker = trade.ticker
+        last_sequential_id = self._last_sequential_ids.get(ticker)
+        if last_sequential_id is not None and trade.sequential_id <= last_sequential_id:
+            return
+        self._last_sequential_ids[ticker] = trade.sequential_id
+
+        late = False
+        for timeframe in self.timeframes:
+            key = (ticker, timeframe)
+            seeded_until = self._seeded_until.get(key)
+            if seeded_until is not None:
+                if trade.timestamp <= seeded_until:
+                    continue
+                del self._seeded_until[key]
+
+            start = self._period_start(timeframe, trade.timestamp)
+            closed_until = self._closed_until.get(key)
+            if closed_until is not None and start < closed_until:
+                late = True
+                continue
+            bar = self._bars.get(key)
+            if bar is not None and bar.start != start:
+                if bar.start > start:
+                    continue
+                self._close(ticker, timeframe, bar)
+                bar = None
+            if bar is None:
+                bar = self._bars[key] = _Bar(start, trade.trade_price, trade.timestamp)
+            bar.add(trade)
+        if late:
+            self.late_trades += 1
+
+    def update_many(self, trades: Iterable[values.Trade]) -> None:
+        """
+        Accepts trades in any order, e.g. the newest-first result of `latest_trades()`.
+        """
+        for trade in sorted(trades, key=lambda trade: trade.sequential_id):
+            self.update(trade)
+
+    def flush(self, now: Optional[datetime.datetime] = None) -> List[values.BaseCandle]:
+        """
+        Closes bars whose period has ended by `now` (defaults to the current time) and returns them.
+        """
+        if now is None:
+            now = datetime.datetime.now(datetime.timezone.utc)
+        closed = []
+        for (ticker, timeframe), bar in tuple(self._bars.items()):
+            end = self._next_period_start(timeframe, bar.start)
+            if end <= now:
+                del self._bars[(ticker, timeframe)]
+                self._seeded_until.pop((ticker, timeframe), None)
+                self._closed_until[(ticker, timeframe)] = end
+                candle = self._close(ticker, timeframe, bar)
+                if candle is not None:
+                    closed.append(candle)
+        return closed
+
+    def current(self, ticker: Union[values.Ticker, str], timeframe: Timeframe) -> Optional[values.BaseCandle]:
+        """
+        The forming candle of `ticker` in `timeframe`.
+        """
+        if isinstance(ticker, values.Ticker):
+            ticker = ticker.ticker
+        bar = self._bars.get((ticker, timeframe))
+        if bar is None:
+            return None
+        return self._to_candle(ticker, timeframe, bar)
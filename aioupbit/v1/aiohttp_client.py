@@ -1,27 +1,36 @@
 from __future__ import annotations
 
-import codecs
+import asyncio
 import datetime
-import uuid
-from typing import Any, ClassVar, Iterable, Mapping, Optional, Sequence, Union, cast, overload
+from typing import (
+    Any,
+    AsyncIterator,
+    ClassVar,
+    Dict,
+    Iterable,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    cast,
+)
 
 import aiohttp.connector
-import rapidjson
-from typing_extensions import Final
+import yarl
 
-from aioupbit import utils
-from aioupbit.v1 import constants, values
-from aioupbit.v1.client import Client
+from aioupbit.v1 import cache, columnar, constants, endpoints, instrumentation, keepalive, rate_limit, values
+from aioupbit.v1.client import BaseRestClient
 
 __all__ = ('AioHTTPRestClient',)
 
 
-class AioHTTPRestClient(Client):
+class AioHTTPRestClient(BaseRestClient):
     __slots__ = ('_session',)
 
-    _UTF8: Final[codecs.CodecInfo] = codecs.lookup('UTF-8')
-
     _connector: ClassVar[Optional[aiohttp.BaseConnector]] = None
+    # market list of `snapshot()` if no class level cache is set
+    _markets_cache: ClassVar[Optional[cache.ResponseCache]] = None
 
     _session: aiohttp.ClientSession
 
@@ -37,239 +46,194 @@ class AioHTTPRestClient(Client):
             connector_owner=connector is None,
         )
 
+    async def close(self) -> None:
+        await self._session.close()
+
     @classmethod
     async def set_class_level_connector(cls, connector: aiohttp.BaseConnector) -> None:
         cls._connector = connector
 
+    @classmethod
+    async def prewarm(cls, size: int = 4, interval: float = 10) -> keepalive.ConnectionWarmer:
+        """
+        Opens `size` connections of the class level connector, which is created if not set, and keeps them alive
+        every `interval` seconds until the returned warmer is closed.
+        """
+        if cls._connector is None:
+            await cls.set_class_level_connector(aiohttp.TCPConnector(keepalive_timeout=interval * 3))
+        warmer = keepalive.ConnectionWarmer(cast(aiohttp.BaseConnector, cls._connector), cls.BASE_URL, size, interval)
+        await warmer.start()
+        return warmer
+
     @classmethod
     def _get_class_level_session(cls) -> aiohttp.ClientSession:
         return aiohttp.ClientSession(
             cls.BASE_URL,
             connector=cls._connector,
             connector_owner=cls._connector is None,
+            trace_configs=None if cls._instrument is None else [instrumentation.TRACE_CONFIG],
         )
 
     @classmethod
     async def _deserialize_json_response(cls, res: aiohttp.ClientResponse) -> Any:
-        content: Union[str, bytes] = await res.read()
-        encoding = res.get_encoding()
-        if encoding != 'utf-8' and utils.get_codec(encoding) != cls._UTF8:
-            content = content.decode(encoding)  # type: ignore[union-attr]
-        print(content)
-        print(
-            rapidjson.loads(
-                content,
-                number_mode=rapidjson.NM_NAN | rapidjson.NM_DECIMAL,
-                datetime_mode=rapidjson.DM_ISO8601 | rapidjson.DM_NAIVE_IS_UTC,
-            )
-        )
-        return rapidjson.loads(
-            content,
-            number_mode=rapidjson.NM_NAN | rapidjson.NM_DECIMAL,
-            datetime_mode=rapidjson.DM_ISO8601 | rapidjson.DM_NAIVE_IS_UTC,
-        )
+        return cls._loads(await res.read(), res.get_encoding())
 
     @classmethod
-    async def markets(cls) -> Iterable[values.Ticker]:
-        async with cls._get_class_level_session() as session:
-            async with session.get('/v1/market/all?isDetails=true') as res:
-                return map(values.Ticker.from_json, await cls._deserialize_json_response(res))
+    async def _request(
+        cls,
+        method: str,
+        url: str,
+        session: aiohttp.ClientSession,
+        limiter: Optional[rate_limit.RateLimiter],
+        trace: Optional[instrumentation.RequestTrace],
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> Tuple[bytes, str]:
+        if trace is not None:
+            trace.connection_limit = session.connector.limit if session.connector is not None else 0
+        async with session.request(
+            method, yarl.URL(url, encoded=True), headers=headers, trace_request_ctx=trace
+        ) as res:
+            cls._on_headers(res.status, res.url.path, res.headers, limiter, trace)
+            res.raise_for_status()
+            return await res.read(), res.get_encoding()
 
     @classmethod
-    async def candles(
-        cls,
-        ticker: Union[values.Ticker, str],
-        unit: values.MinCandle.Unit = values.MinCandle.Unit.MIN1,
-        count: int = 1,
-        to: Optional[datetime.datetime] = None,
-    ) -> Iterable[values.MinCandle]:
-        """
-        If `to` exists and naive, it treated as UTC. (note. datetime.utcnow() returns naive datetime object)
-        """
-        async with cls._get_class_level_session() as session:
-            params = dict(market=cls._get_ticker_code(ticker), count=count)
-            if to is not None:
-                params['to'] = to.astimezone(datetime.timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
-            async with session.get(f'/v1/candles/minutes/{unit.value}', params=params) as res:
-                return map(
-                    values.MinCandle.from_json,
-                    cast(Sequence[Mapping[str, Any]], await cls._deserialize_json_response(res)),
-                )
+    def _is_not_found(cls, error: Exception) -> bool:
+        return isinstance(error, aiohttp.ClientResponseError) and error.status == 404
 
     @classmethod
-    async def candles_day(
+    async def _candles(
         cls,
         ticker: Union[values.Ticker, str],
-        count: int = 1,
-        to: Optional[datetime.datetime] = None,
-        converting_price_unit: Optional[constants.CurrencyCode] = None,
-    ) -> Iterable[values.DayCandle]:
-        """
-        If `to` exists and naive, it treated as UTC. (note. datetime.utcnow() returns naive datetime object)
-        """
-        async with cls._get_class_level_session() as session:
-            params = dict(market=cls._get_ticker_code(ticker), count=count)
-            if to is not None:
-                params['to'] = to.astimezone(datetime.timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
-            if converting_price_unit is not None:
-                params['convertingPriceUnit'] = converting_price_unit
-            async with session.get('/v1/candles/days', params=params) as res:
-                return map(
-                    values.DayCandle.from_json,
-                    cast(Sequence[Mapping[str, Any]], await cls._deserialize_json_response(res)),
-                )
+        unit: values.MinCandle.Unit,
+        count: int,
+        to: Optional[datetime.datetime],
+        session: Optional[aiohttp.ClientSession] = None,
+        limiter: Optional[rate_limit.RateLimiter] = None,
+    ) -> Iterable[values.MinCandle]:
+        return await cls._fetch(
+            endpoints.MIN_CANDLES[unit],
+            cls._candles_query(ticker, count, to),
+            values.MinCandle.from_json,
+            session,
+            limiter,
+        )
 
     @classmethod
-    async def candles_week(
+    async def candles_many(
         cls,
-        ticker: Union[values.Ticker, str],
+        tickers: Union[Iterable[values.Ticker], Iterable[str]],
+        unit: values.MinCandle.Unit = values.MinCandle.Unit.MIN1,
         count: int = 1,
         to: Optional[datetime.datetime] = None,
-    ) -> Iterable[values.WeekCandle]:
+        limiter: Optional[rate_limit.RateLimiter] = None,
+    ) -> AsyncIterator[Tuple[str, Sequence[values.MinCandle]]]:
         """
+        Fetches candles of each ticker concurrently over one session and yields `(ticker, candles)` as they arrive.
+
+        Requests are bounded by `limiter`, which defaults to the class level limiter of the `candles` rate limit group,
+        so concurrent `candles_many()` calls share the budget.
         If `to` exists and naive, it treated as UTC. (note. datetime.utcnow() returns naive datetime object)
         """
+        if limiter is None:
+            limiter = cls._get_rate_limiter(constants.RateLimitGroup.CANDLES)
+
         async with cls._get_class_level_session() as session:
-            params = dict(market=cls._get_ticker_code(ticker), count=count)
-            if to is not None:
-                params['to'] = to.astimezone(datetime.timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
-            async with session.get('/v1/candles/weeks', params=params) as res:
-                return map(
-                    values.WeekCandle.from_json,
-                    cast(Sequence[Mapping[str, Any]], await cls._deserialize_json_response(res)),
-                )
+
+            async def fetch(code: str) -> Tuple[str, Sequence[values.MinCandle]]:
+                return code, tuple(await cls._candles(code, unit, count, to, session, limiter))
+
+            tasks = [asyncio.ensure_future(fetch(code)) for code in map(cls._get_ticker_code, tickers)]
+            try:
+                for task in asyncio.as_completed(tasks):
+                    yield await task
+            finally:
+                for task in tasks:
+                    task.cancel()
 
     @classmethod
-    async def candles_month(
+    async def candles_batch(
         cls,
-        ticker: Union[values.Ticker, str],
+        tickers: Union[Iterable[values.Ticker], Iterable[str]],
+        unit: values.MinCandle.Unit = values.MinCandle.Unit.MIN1,
         count: int = 1,
         to: Optional[datetime.datetime] = None,
-    ) -> Iterable[values.MonthCandle]:
+        limiter: Optional[rate_limit.RateLimiter] = None,
+    ) -> columnar.CandleBatch:
         """
-        If `to` exists and naive, it treated as UTC. (note. datetime.utcnow() returns naive datetime object)
+        `candles_many()` collected into one columnar batch.
         """
-        async with cls._get_class_level_session() as session:
-            params = dict(market=cls._get_ticker_code(ticker), count=count)
-            if to is not None:
-                params['to'] = to.astimezone(datetime.timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
-            async with session.get('/v1/candles/months', params=params) as res:
-                return map(
-                    values.MonthCandle.from_json,
-                    cast(Sequence[Mapping[str, Any]], await cls._deserialize_json_response(res)),
-                )
+        return columnar.CandleBatch.from_candles(
+            [candle async for _, candles in cls.candles_many(tickers, unit, count, to, limiter) for candle in candles]
+        )
 
     @classmethod
-    async def latest_trades(
-        cls,
-        ticker: Union[values.Ticker, str],
-        to: Optional[datetime.time] = None,
-        count: int = 1,
-        cursor: Optional[int] = None,
-        days_ago: constants.DaysAgo = 0,
-    ) -> Iterable[values.Trade]:
-        """
-        If `to` exists and naive, it treated as UTC. (note. datetime.utcnow() returns naive datetime object)
-        """
-        async with cls._get_class_level_session() as session:
-            params = dict(market=cls._get_ticker_code(ticker), count=count)
-            if days_ago > 0:
-                params['daysAgo'] = days_ago
-            if cursor is not None:
-                params['cursor'] = cursor
-            if to is not None:
-                params['to'] = to.isoformat()
-            async with session.get('/v1/trades/ticks', params=params) as res:
-                return map(
-                    values.Trade.from_json,
-                    cast(Sequence[Mapping[str, Any]], await cls._deserialize_json_response(res)),
-                )
+    async def _cached_markets(cls, session: aiohttp.ClientSession) -> Tuple[values.Ticker, ...]:
+        response_cache = cls._cache
+        if response_cache is None:
+            response_cache = cls._markets_cache
+            if response_cache is None:
+                response_cache = cls._markets_cache = cache.ResponseCache()
+        return tuple(
+            await cls._fetch(
+                endpoints.MARKETS, 'isDetails=true', values.Ticker.from_json, session, None, response_cache
+            )
+        )
 
     @classmethod
-    async def latest_tick(cls, markets: Union[Iterable[values.Ticker], Iterable[str]]) -> Iterable[values.Tick]:
-        async with cls._get_class_level_session() as session:
-            params = dict(markets=','.join(map(cls._get_ticker_code, markets)))
-            async with session.get('/v1/ticker', params=params) as res:
-                return map(
-                    values.Tick.from_json,
-                    cast(Sequence[Mapping[str, Any]], await cls._deserialize_json_response(res)),
-                )
+    async def snapshot(cls, quote: Optional[constants.CurrencyCode] = 'KRW') -> Dict[str, values.MarketSnapshot]:
+        """
+        Ticks and orderbooks of every market quoted in `quote` (or of all markets if `None`), indexed by market code.
 
-    @classmethod
-    async def orderbook(cls, markets: Union[Iterable[values.Ticker], Iterable[str]]) -> Iterable[values.Orderbook]:
+        The market list is cached for the `markets` TTL of `cache.ResponseCache`, in the class level cache if set.
+        Markets are joined into as few requests as possible, and all ticker and orderbook requests are sent
+        concurrently over one session, so a sweep takes about one round trip.
+        Markets listed but missing from either response (e.g. just delisted) are left out.
+        """
         async with cls._get_class_level_session() as session:
-            params = dict(markets=','.join(map(cls._get_ticker_code, markets)))
-            async with session.get('/v1/orderbook', params=params) as res:
-                return map(
-                    values.Orderbook.from_json,
-                    cast(Sequence[Mapping[str, Any]], await cls._deserialize_json_response(res)),
-                )
-
-    async def accounts(self) -> Sequence[values.Account]:
-        pass
-
-    async def market_with_account(self, ticker: Union[values.Ticker, str]) -> values.MarketWithAccount:
-        pass
-
-    @overload
-    async def get_order(self, *, order_uuid: Union[uuid.UUID, str]) -> values.OrderWithTrades | None:
-        pass
-
-    @overload
-    async def get_order(self, *, order_id: str) -> values.OrderWithTrades | None:
-        pass
-
-    async def get_order(self, **kwargs: Union[uuid.UUID, str]) -> values.OrderWithTrades | None:
-        pass
-
-    @overload
-    async def orders(
-        self,
-        *,
-        ticker: Union[values.Ticker, str],
-        uuids: Union[Iterable[uuid.UUID], Iterable[str]],
-        identifiers: Iterable[str],
-        state: constants.OrderState = constants.OrderState.WAIT,
-        page: int = 1,
-        limit: int = 100,
-        order_by: constants.OrderBy = constants.OrderBy.DESC,
-    ) -> Sequence[values.Order]:
-        pass
-
-    @overload
-    async def orders(
-        self,
-        *,
-        ticker: Union[values.Ticker, str],
-        uuids: Union[Iterable[uuid.UUID], Iterable[str]],
-        identifiers: Iterable[str],
-        states: Iterable[constants.OrderState],
-        page: int = 1,
-        limit: int = 100,
-        order_by: constants.OrderBy = constants.OrderBy.DESC,
-    ) -> Sequence[values.Order]:
-        pass
-
-    async def orders(
-        self,
-        *,
-        ticker: Union[values.Ticker, str],
-        uuids: Union[Iterable[uuid.UUID], Iterable[str]],
-        identifiers: Iterable[str],
-        page: int = 1,
-        limit: int = 100,
-        order_by: constants.OrderBy = constants.OrderBy.DESC,
-        **kwargs: Union[constants.OrderState, Iterable[constants.OrderState]],
-    ) -> Sequence[values.Order]:
-        pass
-
-    @overload
-    async def cancel_order(self, *, order_uuid: Union[uuid.UUID, str]) -> None:
-        pass
-
-    @overload
-    async def cancel_order(self, *, order_id: str) -> None:
-        pass
+            markets = await cls._cached_markets(session)
+            if quote is not None:
+                prefix = f'{quote}-'
+                markets = tuple(market for market in markets if market.ticker.startswith(prefix))
+
+            chunks = cls._chunk_markets(market.ticker for market in markets)
+            ticker_limiter = cls._get_rate_limiter(endpoints.TICKER.group)
+            orderbook_limiter = cls._get_rate_limiter(endpoints.ORDERBOOK.group)
+            tick_results, orderbook_results = await asyncio.gather(
+                asyncio.gather(
+                    *(
+                        cls._fetch(
+                            endpoints.TICKER,
+                            chunk,
+                            values.Tick.from_json,
+                            session,
+                            ticker_limiter,
+                        )
+                        for chunk in chunks
+                    )
+                ),
+                asyncio.gather(
+                    *(
+                        cls._fetch(
+                            endpoints.ORDERBOOK,
+                            chunk,
+                            values.Orderbook.from_json,
+                            session,
+                            orderbook_limiter,
+                        )
+                        for chunk in chunks
+                    )
+                ),
+            )
 
-    async def cancel_order(self, **kwargs: Union[uuid.UUID, str]) -> None:
-        pass
+        ticks = {tick.ticker: tick for result in tick_results for tick in result}
+        orderbooks = {orderbook.ticker: orderbook for result in orderbook_results for orderbook in result}
+        return {
+            market.ticker: values.MarketSnapshot(market, ticks[market.ticker], orderbooks[market.ticker])
+            for market in markets
+            if market.ticker in ticks and market.ticker in orderbooks
+        }
+
+    @property
+    def _private_session(self) -> aiohttp.ClientSession:
+        return self._session
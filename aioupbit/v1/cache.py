@@ -0,0 +1,267 @@
+from __future__ import annotations
+
+import collections
+import datetime
+import hashlib
+import math
+import os
+import struct
+import time
+from abc import ABCMeta, abstractmethod
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, ClassVar, Counter, Mapping, Optional, OrderedDict, Union
+
+from typing_extensions import Final
+
+from aioupbit.v1 import constants, endpoints
+
+__all__ = ('CacheEntry', 'CacheBackend', 'MemoryCacheBackend', 'DiskCacheBackend', 'ResponseCache')
+
+_HEADER: Final[struct.Struct] = struct.Struct('<dB')
+# minute unit of each minute candle endpoint by path
+_CANDLE_MINUTES: Final[Mapping[str, int]] = {
+    endpoint.path: int(unit) for unit, endpoint in endpoints.MIN_CANDLES.items()
+}
+_DAY: Final[int] = 24 * 60 * 60
+
+
+@dataclass(frozen=True)
+class CacheEntry:
+    """
+    Response body of a quotation request. `expires` is in epoch seconds, `math.inf` if it never expires.
+    """
+
+    __slots__ = ('expires', 'content', 'encoding')
+
+    expires: float
+    content: bytes
+    encoding: str
+
+
+class CacheBackend(metaclass=ABCMeta):
+    """
+    Storage of cache entries by URL, bounded to `max_entries` by evicting the least recently used.
+    """
+
+    __slots__ = ('max_entries', 'evictions')
+
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max_entries
+        self.evictions = 0
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[CacheEntry]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def set(self, key: str, entry: CacheEntry) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def __len__(self) -> int:
+        raise NotImplementedError
+
+
+class MemoryCacheBackend(CacheBackend):
+    __slots__ = ('_entries',)
+
+    def __init__(self, max_entries: int = 4096) -> None:
+        super().__init__(max_entries)
+        self._entries: OrderedDict[str, CacheEntry] = collections.OrderedDict()
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        entries = self._entries
+        entries[key] = entry
+        entries.move_to_end(key)
+        while len(entries) > self.max_entries:
+            entries.popitem(last=False)
+            self.evictions += 1
+
+    def delete(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class DiskCacheBackend(CacheBackend):
+    """
+    Stores each entry in a file of `directory` named by the hash of its URL, so closed candles survive restarts.
+    Existing files are used from the least recently modified.
+    """
+
+    __slots__ = ('directory', '_files')
+
+    def __init__(self, directory: Union[str, Path], max_entries: int = 65536) -> None:
+        super().__init__(max_entries)
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        # recency of the file names, which are the only state kept in memory
+        self._files: OrderedDict[str, None] = collections.OrderedDict(
+            (path.name, None) for path in sorted(self.directory.glob('*.cache'), key=lambda path: path.stat().st_mtime)
+        )
+
+    @staticmethod
+    def _name(key: str) -> str:
+        return hashlib.sha256(key.encode()).hexdigest() + '.cache'
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        name = self._name(key)
+        if name not in self._files:
+            return None
+        try:
+            data = (self.directory / name).read_bytes()
+        except FileNotFoundError:
+            del self._files[name]
+            return None
+        self._files.move_to_end(name)
+        expires, length = _HEADER.unpack_from(data)
+        start = _HEADER.size + length
+        return CacheEntry(expires, data[start:], data[_HEADER.size : start].decode('ascii'))
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        name = self._name(key)
+        encoding = entry.encoding.encode('ascii')
+        path = self.directory / name
+        temporary = path.with_suffix('.tmp')
+        temporary.write_bytes(_HEADER.pack(entry.expires, len(encoding)) + encoding + entry.content)
+        # atomic, so concurrent readers never see a partial entry
+        os.replace(temporary, path)
+
+        files = self._files
+        files[name] = None
+        files.move_to_end(name)
+        while len(files) > self.max_entries:
+            evicted, _ = files.popitem(last=False)
+            self._unlink(evicted)
+            self.evictions += 1
+
+    def _unlink(self, name: str) -> None:
+        try:
+            (self.directory / name).unlink()
+        except FileNotFoundError:
+            pass
+
+    def delete(self, key: str) -> None:
+        name = self._name(key)
+        if name in self._files:
+            del self._files[name]
+            self._unlink(name)
+
+    def __len__(self) -> int:
+        return len(self._files)
+
+
+class ResponseCache:
+    """
+    Cache of quotation responses by URL, with a TTL in seconds per endpoint name (see `endpoints.Endpoint.name`).
+    Endpoints without a TTL, or with a TTL of 0, are not cached.
+
+    Candle pages whose `to` is at or before the start of the period of the endpoint (e.g. the day of
+    `candles_day()`) that was current `closed_candle_delay` seconds ago hold only closed candles,
+    which never change, so they never expire. Other pages, which include the forming candle, use `ttls`.
+
+    `hits` and `misses` count lookups by endpoint name.
+
+    ::
+
+        await AioHTTPRestClient.set_class_level_cache(ResponseCache(DiskCacheBackend('.upbit-cache')))
+    """
+
+    __slots__ = ('backend', 'ttls', 'closed_candle_delay', 'hits', 'misses', '_clock')
+
+    DEFAULT_TTLS: ClassVar[Mapping[str, float]] = {
+        'markets': 600,
+        'candles': 1,
+        'candles_day': 1,
+        'candles_week': 1,
+        'candles_month': 1,
+    }
+
+    def __init__(
+        self,
+        backend: Optional[CacheBackend] = None,
+        ttls: Optional[Mapping[str, float]] = None,
+        closed_candle_delay: float = 10,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """
+        `ttls` overrides `DEFAULT_TTLS` by endpoint name. (e.g. `dict(latest_tick=0.1)`)
+        """
+        self.backend = MemoryCacheBackend() if backend is None else backend
+        self.ttls = {**self.DEFAULT_TTLS, **(ttls or {})}
+        self.closed_candle_delay = closed_candle_delay
+        self.hits: Counter[str] = collections.Counter()
+        self.misses: Counter[str] = collections.Counter()
+        self._clock = clock
+
+    @property
+    def hit_rate(self) -> float:
+        hits, misses = sum(self.hits.values()), sum(self.misses.values())
+        return hits / (hits + misses) if hits or misses else 0.0
+
+    @staticmethod
+    def _to(query: Optional[str]) -> Optional[float]:
+        # `to` as formatted by `endpoints.format_time()`
+        if not query:
+            return None
+        start = query.find('&to=')
+        if start < 0:
+            return None
+        try:
+            to = datetime.datetime.strptime(query[start + 4 : start + 24], '%Y-%m-%dT%H:%M:%SZ')
+        except ValueError:
+            return None
+        return to.replace(tzinfo=datetime.timezone.utc).timestamp()
+
+    @staticmethod
+    def _period_start(endpoint: endpoints.Endpoint, at: float) -> float:
+        # candle periods are aligned in UTC: minute units from the epoch, days from 00:00,
+        # weeks from Monday and months from the first day
+        minutes = _CANDLE_MINUTES.get(endpoint.path)
+        if minutes is not None:
+            return at - at % (minutes * 60)
+        day = datetime.datetime.fromtimestamp(at - at % _DAY, datetime.timezone.utc)
+        if endpoint is endpoints.WEEK_CANDLES:
+            day -= datetime.timedelta(days=day.weekday())
+        elif endpoint is endpoints.MONTH_CANDLES:
+            day = day.replace(day=1)
+        return day.timestamp()
+
+    def ttl(self, endpoint: endpoints.Endpoint, query: Optional[str], now: float) -> float:
+        if endpoint.group is constants.RateLimitGroup.CANDLES:
+            to = self._to(query)
+            if to is not None and to <= self._period_start(endpoint, now - self.closed_candle_delay):
+                return math.inf
+        return self.ttls.get(endpoint.name, 0)
+
+    def get(self, endpoint: endpoints.Endpoint, query: Optional[str]) -> Optional[CacheEntry]:
+        now = self._clock()
+        if self.ttl(endpoint, query, now) <= 0:
+            return None
+        key = endpoint.url(query)
+        entry = self.backend.get(key)
+        if entry is not None:
+            if entry.expires > now:
+                self.hits[endpoint.name] += 1
+                return entry
+            self.backend.delete(key)
+        self.misses[endpoint.name] += 1
+        return None
+
+    def put(self, endpoint: endpoints.Endpoint, query: Optional[str], content: bytes, encoding: str) -> None:
+        now = self._clock()
+        ttl = self.ttl(endpoint, query, now)
+        if ttl > 0:
+            self.backend.set(endpoint.url(query), CacheEntry(now + ttl, content, encoding))
@@ -1,22 +1,44 @@
 from __future__ import annotations
 
+import codecs
 import datetime
 import hashlib
 import uuid
 from abc import ABCMeta, abstractmethod
 from collections.abc import Iterable
-from typing import Optional, Sequence, Union, overload
+from contextlib import asynccontextmanager
+from typing import (
+    Any,
+    AsyncContextManager,
+    AsyncIterator,
+    Callable,
+    ClassVar,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+    cast,
+    overload,
+)
 
 import jwt
+import rapidjson
 from typing_extensions import Final
 
-from aioupbit.v1 import constants, values
+from aioupbit import utils
+from aioupbit.v1 import cache, constants, endpoints, instrumentation, rate_limit, values
 
-__all__ = ('Client',)
+__all__ = ('Client', 'BaseRestClient')
+
+_T = TypeVar('_T')
 
 
 class Client(metaclass=ABCMeta):
-    __slots__ = ('_access_key', '_secret_key')
+    __slots__ = ('_access_key', '_secret_key', '_exchange_limiters')
     BASE_URL: Final[str] = 'https://api.upbit.com'
 
     _access_key: Final[str]
@@ -27,6 +49,17 @@ class Client(metaclass=ABCMeta):
 
         self._access_key = access_key
         self._secret_key = secret_key
+        self._exchange_limiters: Dict[constants.RateLimitGroup, rate_limit.RateLimiter] = dict()
+
+    def exchange_rate_limiter(self, group: constants.RateLimitGroup) -> rate_limit.RateLimiter:
+        """
+        Limiter of the exchange API budget of `group`, which the server counts per access key.
+        Implementations update it with the `Remaining-Req` header of exchange API responses.
+        """
+        limiter = self._exchange_limiters.get(group)
+        if limiter is None:
+            limiter = self._exchange_limiters[group] = rate_limit.RateLimiter.for_group(group)
+        return limiter
 
     @classmethod
     def _get_ticker_code(cls, ticker: Union[values.Ticker, str]) -> str:
@@ -150,9 +183,9 @@ class Client(metaclass=ABCMeta):
     async def orders(
         self,
         *,
-        ticker: Union[values.Ticker, str],
-        uuids: Union[Iterable[uuid.UUID], Iterable[str]],
-        identifiers: Iterable[str],
+        ticker: Union[values.Ticker, str, None] = None,
+        uuids: Union[Iterable[uuid.UUID], Iterable[str]] = (),
+        identifiers: Iterable[str] = (),
         state: constants.OrderState = constants.OrderState.WAIT,
         page: int = 1,
         limit: int = 100,
@@ -164,9 +197,9 @@ class Client(metaclass=ABCMeta):
     async def orders(
         self,
         *,
-        ticker: Union[values.Ticker, str],
-        uuids: Union[Iterable[uuid.UUID], Iterable[str]],
-        identifiers: Iterable[str],
+        ticker: Union[values.Ticker, str, None] = None,
+        uuids: Union[Iterable[uuid.UUID], Iterable[str]] = (),
+        identifiers: Iterable[str] = (),
         states: Iterable[constants.OrderState],
         page: int = 1,
         limit: int = 100,
@@ -178,9 +211,9 @@ class Client(metaclass=ABCMeta):
     async def orders(
         self,
         *,
-        ticker: Union[values.Ticker, str],
-        uuids: Union[Iterable[uuid.UUID], Iterable[str]],
-        identifiers: Iterable[str],
+        ticker: Union[values.Ticker, str, None] = None,
+        uuids: Union[Iterable[uuid.UUID], Iterable[str]] = (),
+        identifiers: Iterable[str] = (),
         page: int = 1,
         limit: int = 100,
         order_by: constants.OrderBy = constants.OrderBy.DESC,
@@ -201,3 +234,462 @@ class Client(metaclass=ABCMeta):
     async def cancel_order(self, **kwargs: Union[uuid.UUID, str]) -> None:
         """https://docs.upbit.com/reference/%EC%A3%BC%EB%AC%B8-%EC%B7%A8%EC%86%8C"""
         raise NotImplementedError
+
+
+@asynccontextmanager
+async def _no_session() -> AsyncIterator[None]:
+    yield None
+
+
+class BaseRestClient(Client):
+    """
+    Endpoints written once over `_fetch()` and `_fetch_private()`, which share the response cache, rate limiting
+    and instrumentation. Subclasses only send requests with their own HTTP stack in `_request()`.
+
+    `_fetch()`, `_get_class_level_session()`, `_get_rate_limiter()` and `_chunk_markets()` are the protected API
+    that helpers polling many markets, such as `polling.TickPoller`, build on.
+    """
+
+    __slots__ = ()
+
+    _UTF8: Final[codecs.CodecInfo] = codecs.lookup('UTF-8')
+
+    _cache: ClassVar[Optional[cache.ResponseCache]] = None
+    _instrument: ClassVar[Optional[instrumentation.Instrument]] = None
+    _rate_limiters: ClassVar[Dict[constants.RateLimitGroup, rate_limit.RateLimiter]] = dict()
+
+    # query length of the `markets` parameter a request carries, well below common URL length limits
+    MAX_MARKETS_QUERY_LENGTH: ClassVar[int] = 4000
+
+    @classmethod
+    def _loads(cls, content: Union[str, bytes], encoding: str) -> Any:
+        if encoding != 'utf-8' and utils.get_codec(encoding) != cls._UTF8:
+            content = content.decode(encoding)  # type: ignore[union-attr]
+        return rapidjson.loads(
+            content,
+            number_mode=rapidjson.NM_NAN | rapidjson.NM_DECIMAL,
+            datetime_mode=rapidjson.DM_ISO8601 | rapidjson.DM_NAIVE_IS_UTC,
+        )
+
+    @classmethod
+    async def set_class_level_instrument(cls, instrument: Optional[instrumentation.Instrument]) -> None:
+        """
+        `instrument` is called with `instrumentation.RequestMetrics` after every quotation request.
+        Passing `None` disables instrumentation.
+        """
+        cls._instrument = instrument
+
+    @classmethod
+    async def set_class_level_cache(cls, response_cache: Optional[cache.ResponseCache]) -> None:
+        """
+        Quotation responses are served from `response_cache` while fresh, without a request or rate limit budget.
+        Passing `None` disables caching.
+        """
+        cls._cache = response_cache
+
+    @classmethod
+    async def _fetch(
+        cls,
+        endpoint: endpoints.Endpoint,
+        query: Optional[str],
+        from_json: Callable[[Mapping[str, Any]], _T],
+        session: Any = None,
+        limiter: Optional[rate_limit.RateLimiter] = None,
+        response_cache: Optional[cache.ResponseCache] = None,
+    ) -> Iterable[_T]:
+        """
+        GETs `endpoint` with the encoded `query` and maps `from_json` over the decoded JSON array.
+
+        The request is sent over `session` of `_get_class_level_session()` if given (it is not closed), or a new one,
+        within `limiter`, which is updated with the `Remaining-Req` header of the response.
+        `response_cache` is used instead of the class level cache if given.
+        """
+        if response_cache is None:
+            response_cache = cls._cache
+        if response_cache is not None:
+            entry = response_cache.get(endpoint, query)
+            if entry is not None:
+                return tuple(
+                    map(from_json, cast(Sequence[Mapping[str, Any]], cls._loads(entry.content, entry.encoding)))
+                )
+
+        if session is None:
+            async with cls._get_class_level_session() as session:
+                return await cls._fetch_limited(endpoint, query, from_json, session, limiter, response_cache)
+        return await cls._fetch_limited(endpoint, query, from_json, session, limiter, response_cache)
+
+    @classmethod
+    async def _fetch_limited(
+        cls,
+        endpoint: endpoints.Endpoint,
+        query: Optional[str],
+        from_json: Callable[[Mapping[str, Any]], _T],
+        session: Any,
+        limiter: Optional[rate_limit.RateLimiter],
+        response_cache: Optional[cache.ResponseCache],
+    ) -> Iterable[_T]:
+        if limiter is not None:
+            async with limiter.acquire():
+                return await cls._fetch_uncached(endpoint, query, from_json, session, limiter, response_cache)
+        return await cls._fetch_uncached(endpoint, query, from_json, session, limiter, response_cache)
+
+    @classmethod
+    async def _fetch_uncached(
+        cls,
+        endpoint: endpoints.Endpoint,
+        query: Optional[str],
+        from_json: Callable[[Mapping[str, Any]], _T],
+        session: Any,
+        limiter: Optional[rate_limit.RateLimiter],
+        response_cache: Optional[cache.ResponseCache],
+    ) -> Iterable[_T]:
+        instrument = cls._instrument
+        url = endpoint.url(query)
+
+        if instrument is None:
+            content, encoding = await cls._request('GET', url, session, limiter, None)
+            if response_cache is not None:
+                response_cache.put(endpoint, query, content, encoding)
+            return tuple(map(from_json, cast(Sequence[Mapping[str, Any]], cls._loads(content, encoding))))
+
+        trace = instrumentation.RequestTrace(endpoint.name)
+        content, encoding = await cls._request('GET', url, session, limiter, trace)
+        trace.on_body(len(content))
+        if response_cache is not None:
+            response_cache.put(endpoint, query, content, encoding)
+        json = cls._loads(content, encoding)
+        trace.on_decoded()
+        result = tuple(map(from_json, cast(Sequence[Mapping[str, Any]], json)))
+        trace.on_constructed()
+
+        instrument(trace.finish())
+        return result
+
+    @classmethod
+    def _on_headers(
+        cls,
+        status: int,
+        path: str,
+        headers: Mapping[str, str],
+        limiter: Optional[rate_limit.RateLimiter],
+        trace: Optional[instrumentation.RequestTrace],
+    ) -> None:
+        """
+        Called by `_request()` when the response headers arrive, before raising for an error status,
+        to update `limiter` with the `Remaining-Req` header and to report the headers to `trace`.
+        """
+        if trace is not None:
+            trace.on_headers(status, path, headers)
+            remaining = trace.remaining_req
+        elif limiter is not None and 'Remaining-Req' in headers:
+            remaining = values.RemainingReq.from_header(headers['Remaining-Req'])
+        else:
+            return
+        if limiter is not None and remaining is not None:
+            limiter.update(remaining)
+
+    @classmethod
+    @abstractmethod
+    async def _request(
+        cls,
+        method: str,
+        url: str,
+        session: Any,
+        limiter: Optional[rate_limit.RateLimiter],
+        trace: Optional[instrumentation.RequestTrace],
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> Tuple[bytes, str]:
+        """
+        Sends `method` to `url`, which is encoded and relative to `BASE_URL`, over `session`
+        and returns the body and its encoding.
+        Implementations pass the response headers to `_on_headers()` and then raise for an error status.
+        """
+        raise NotImplementedError
+
+    @classmethod
+    @abstractmethod
+    def _is_not_found(cls, error: Exception) -> bool:
+        """
+        Whether `error` raised by `_request()` is for a 404 response.
+        """
+        raise NotImplementedError
+
+    @property
+    def _private_session(self) -> Any:
+        """
+        Session of the exchange API requests of this client.
+        """
+        return None
+
+    async def _request_private(self, method: str, endpoint: endpoints.Endpoint, query: Optional[str]) -> Any:
+        """
+        Authenticated request, returning the decoded JSON. The token carries the hash of `query` as sent.
+        The `Remaining-Req` header of the response updates `exchange_rate_limiter()` of the endpoint group.
+        """
+        headers = dict(Authorization=self._gen_auth_token(query or None))
+        limiter = self.exchange_rate_limiter(endpoint.group)
+        url = endpoint.url(query)
+        content, encoding = await self._request(method, url, self._private_session, limiter, None, headers)
+        return self._loads(content, encoding)
+
+    async def _fetch_private(
+        self,
+        endpoint: endpoints.Endpoint,
+        query: Optional[str],
+        from_json: Callable[[Mapping[str, Any]], _T],
+    ) -> Iterable[_T]:
+        """
+        Authenticated GET of a JSON array, mapped with `from_json`.
+        """
+        return map(from_json, cast(Sequence[Mapping[str, Any]], await self._request_private('GET', endpoint, query)))
+
+    @staticmethod
+    def _order_query(kwargs: Mapping[str, Union[uuid.UUID, str]]) -> str:
+        order_uuid = kwargs.get('order_uuid')
+        if order_uuid is not None:
+            return endpoints.build_query(dict(uuid=str(order_uuid)))
+        order_id = kwargs.get('order_id')
+        if order_id is None:
+            raise TypeError('either order_uuid or order_id is required')
+        return endpoints.build_query(dict(identifier=str(order_id)))
+
+    @classmethod
+    def _get_class_level_session(cls) -> AsyncContextManager[Any]:
+        """
+        Session to send a series of requests over, passed to `_fetch()`. (`None` for clients without sessions)
+        """
+        return _no_session()
+
+    @classmethod
+    def _get_rate_limiter(cls, group: constants.RateLimitGroup) -> rate_limit.RateLimiter:
+        """
+        Class level limiter of `group`, shared by concurrent fan-out calls.
+        """
+        limiter = cls._rate_limiters.get(group)
+        if limiter is None:
+            limiter = cls._rate_limiters[group] = rate_limit.RateLimiter.for_group(group)
+        return limiter
+
+    @classmethod
+    def _chunk_markets(cls, codes: Iterable[str]) -> List[str]:
+        """
+        Joins `codes` into as few `markets` queries as `MAX_MARKETS_QUERY_LENGTH` allows.
+        The queries are cached, so repeated market sets are encoded once.
+        """
+        chunks: List[str] = []
+        chunk: List[str] = []
+        length = 0
+        for code in codes:
+            if chunk and length + len(code) + 1 > cls.MAX_MARKETS_QUERY_LENGTH:
+                chunks.append(endpoints.markets_query(tuple(chunk)))
+                chunk, length = [], 0
+            chunk.append(code)
+            length += len(code) + 1
+        if chunk:
+            chunks.append(endpoints.markets_query(tuple(chunk)))
+        return chunks
+
+    @classmethod
+    def _candles_query(cls, ticker: Union[values.Ticker, str], count: int, to: Optional[datetime.datetime]) -> str:
+        query = f'{endpoints.market_query(cls._get_ticker_code(ticker))}&count={count}'
+        if to is not None:
+            query = f'{query}&to={endpoints.format_time(to)}'
+        return query
+
+    @classmethod
+    def _markets_query(cls, markets: Union[Iterable[values.Ticker], Iterable[str]]) -> str:
+        # inlined `_get_ticker_code()`, which costs more than the cached query lookup for long market lists
+        return endpoints.markets_query(
+            tuple(market if isinstance(market, str) else market.ticker for market in markets)
+        )
+
+    @classmethod
+    async def markets(cls) -> Iterable[values.Ticker]:
+        return await cls._fetch(endpoints.MARKETS, 'isDetails=true', values.Ticker.from_json)
+
+    @classmethod
+    async def candles(
+        cls,
+        ticker: Union[values.Ticker, str],
+        unit: values.MinCandle.Unit = values.MinCandle.Unit.MIN1,
+        count: int = 1,
+        to: Optional[datetime.datetime] = None,
+    ) -> Iterable[values.MinCandle]:
+        """
+        If `to` exists and naive, it treated as UTC. (note. datetime.utcnow() returns naive datetime object)
+        """
+        return await cls._fetch(
+            endpoints.MIN_CANDLES[unit],
+            cls._candles_query(ticker, count, to),
+            values.MinCandle.from_json,
+        )
+
+    @classmethod
+    async def candles_day(
+        cls,
+        ticker: Union[values.Ticker, str],
+        count: int = 1,
+        to: Optional[datetime.datetime] = None,
+        converting_price_unit: Optional[constants.CurrencyCode] = None,
+    ) -> Iterable[values.DayCandle]:
+        """
+        If `to` exists and naive, it treated as UTC. (note. datetime.utcnow() returns naive datetime object)
+        """
+        query = cls._candles_query(ticker, count, to)
+        if converting_price_unit is not None:
+            query = f'{query}&{endpoints.build_query(dict(convertingPriceUnit=converting_price_unit))}'
+        return await cls._fetch(endpoints.DAY_CANDLES, query, values.DayCandle.from_json)
+
+    @classmethod
+    async def candles_week(
+        cls,
+        ticker: Union[values.Ticker, str],
+        count: int = 1,
+        to: Optional[datetime.datetime] = None,
+    ) -> Iterable[values.WeekCandle]:
+        """
+        If `to` exists and naive, it treated as UTC. (note. datetime.utcnow() returns naive datetime object)
+        """
+        return await cls._fetch(
+            endpoints.WEEK_CANDLES, cls._candles_query(ticker, count, to), values.WeekCandle.from_json
+        )
+
+    @classmethod
+    async def candles_month(
+        cls,
+        ticker: Union[values.Ticker, str],
+        count: int = 1,
+        to: Optional[datetime.datetime] = None,
+    ) -> Iterable[values.MonthCandle]:
+        """
+        If `to` exists and naive, it treated as UTC. (note. datetime.utcnow() returns naive datetime object)
+        """
+        return await cls._fetch(
+            endpoints.MONTH_CANDLES, cls._candles_query(ticker, count, to), values.MonthCandle.from_json
+        )
+
+    @classmethod
+    async def latest_trades(
+        cls,
+        ticker: Union[values.Ticker, str],
+        to: Optional[datetime.time] = None,
+        count: int = 1,
+        cursor: Optional[int] = None,
+        days_ago: constants.DaysAgo = 0,
+    ) -> Iterable[values.Trade]:
+        """
+        If `to` exists and naive, it treated as UTC. (note. datetime.utcnow() returns naive datetime object)
+        """
+        query = f'{endpoints.market_query(cls._get_ticker_code(ticker))}&count={count}'
+        if days_ago > 0:
+            query = f'{query}&daysAgo={days_ago}'
+        if cursor is not None:
+            query = f'{query}&cursor={cursor}'
+        if to is not None:
+            query = f'{query}&{endpoints.build_query(dict(to=to.isoformat()))}'
+        return await cls._fetch(endpoints.TRADES, query, values.Trade.from_json)
+
+    @classmethod
+    async def latest_tick(cls, markets: Union[Iterable[values.Ticker], Iterable[str]]) -> Iterable[values.Tick]:
+        return await cls._fetch(endpoints.TICKER, cls._markets_query(markets), values.Tick.from_json)
+
+    @classmethod
+    async def orderbook(cls, markets: Union[Iterable[values.Ticker], Iterable[str]]) -> Iterable[values.Orderbook]:
+        return await cls._fetch(endpoints.ORDERBOOK, cls._markets_query(markets), values.Orderbook.from_json)
+
+    async def accounts(self) -> Sequence[values.Account]:
+        return tuple(await self._fetch_private(endpoints.ACCOUNTS, None, values.Account.from_json))
+
+    async def market_with_account(self, ticker: Union[values.Ticker, str]) -> values.MarketWithAccount:
+        query = endpoints.market_query(self._get_ticker_code(ticker))
+        return values.MarketWithAccount.from_json(await self._request_private('GET', endpoints.ORDERS_CHANCE, query))
+
+    @overload
+    async def get_order(self, *, order_uuid: Union[uuid.UUID, str]) -> values.OrderWithTrades | None:
+        pass
+
+    @overload
+    async def get_order(self, *, order_id: str) -> values.OrderWithTrades | None:
+        pass
+
+    async def get_order(self, **kwargs: Union[uuid.UUID, str]) -> values.OrderWithTrades | None:
+        """
+        The order with `order_uuid` or the identifier `order_id`, `None` if there is no such order.
+        """
+        try:
+            json = await self._request_private('GET', endpoints.ORDER, self._order_query(kwargs))
+        except Exception as e:
+            if self._is_not_found(e):
+                return None
+            raise
+        return values.OrderWithTrades.from_json(json)
+
+    @overload
+    async def orders(
+        self,
+        *,
+        ticker: Union[values.Ticker, str, None] = None,
+        uuids: Union[Iterable[uuid.UUID], Iterable[str]] = (),
+        identifiers: Iterable[str] = (),
+        state: constants.OrderState = constants.OrderState.WAIT,
+        page: int = 1,
+        limit: int = 100,
+        order_by: constants.OrderBy = constants.OrderBy.DESC,
+    ) -> Sequence[values.Order]:
+        pass
+
+    @overload
+    async def orders(
+        self,
+        *,
+        ticker: Union[values.Ticker, str, None] = None,
+        uuids: Union[Iterable[uuid.UUID], Iterable[str]] = (),
+        identifiers: Iterable[str] = (),
+        states: Iterable[constants.OrderState],
+        page: int = 1,
+        limit: int = 100,
+        order_by: constants.OrderBy = constants.OrderBy.DESC,
+    ) -> Sequence[values.Order]:
+        pass
+
+    async def orders(
+        self,
+        *,
+        ticker: Union[values.Ticker, str, None] = None,
+        uuids: Union[Iterable[uuid.UUID], Iterable[str]] = (),
+        identifiers: Iterable[str] = (),
+        page: int = 1,
+        limit: int = 100,
+        order_by: constants.OrderBy = constants.OrderBy.DESC,
+        **kwargs: Union[constants.OrderState, Iterable[constants.OrderState]],
+    ) -> Sequence[values.Order]:
+        """
+        Orders matching `state` (`WAIT` by default) or `states`. Up to 100 `uuids` or `identifiers` per request.
+        """
+        params: Dict[str, Any] = dict()
+        if ticker is not None:
+            params['market'] = self._get_ticker_code(ticker)
+        uuids = [str(order_uuid) for order_uuid in uuids]
+        if uuids:
+            params['uuids'] = uuids
+        identifiers = list(identifiers)
+        if identifiers:
+            params['identifiers'] = identifiers
+        states = kwargs.get('states')
+        if states is not None:
+            params['states'] = [state.value for state in cast(Iterable[constants.OrderState], states)]
+        else:
+            params['state'] = cast(constants.OrderState, kwargs.get('state', constants.OrderState.WAIT)).value
+        params.update(page=page, limit=limit, order_by=order_by.value)
+        return tuple(await self._fetch_private(endpoints.ORDERS, endpoints.build_query(params), values.Order.from_json))
+
+    @overload
+    async def cancel_order(self, *, order_uuid: Union[uuid.UUID, str]) -> None:
+        pass
+
+    @overload
+    async def cancel_order(self, *, order_id: str) -> None:
+        pass
+
+    async def cancel_order(self, **kwargs: Union[uuid.UUID, str]) -> None:
+        await self._request_private('DELETE', endpoints.CANCEL_ORDER, self._order_query(kwargs))
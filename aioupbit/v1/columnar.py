@@ -0,0 +1,253 @@
+from __future__ import annotations
+
+import datetime
+import math
+from array import array
+from dataclasses import dataclass
+from itertools import groupby
+from operator import attrgetter
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+
+from aioupbit.v1 import values
+
+__all__ = ('CandleBatch', 'CandleGrid')
+
+
+def _seconds(interval: datetime.timedelta) -> int:
+    seconds = int(interval.total_seconds())
+    if seconds <= 0 or seconds % 60 or seconds != interval.total_seconds():
+        raise ValueError(f'interval must be a positive multiple of a minute: {interval}')
+    return seconds
+
+
+def _epoch(time: datetime.datetime) -> int:
+    return int(time.timestamp())
+
+
+@dataclass(frozen=True)
+class CandleBatch:
+    """
+    Candles of many markets in columns.
+
+    Rows of the same ticker are contiguous and sorted by `date_time` in ascending order;
+    `offsets[ticker]` is the `(start, stop)` range of its rows.
+    `timestamps` are the candle start times (`BaseCandle.date_time`) in epoch seconds,
+    and prices and volumes are converted to `float`.
+    """
+
+    __slots__ = (
+        'tickers',
+        'offsets',
+        'timestamps',
+        'opening_price',
+        'high_price',
+        'low_price',
+        'trade_price',
+        'acc_trade_price',
+        'acc_trade_volume',
+    )
+
+    tickers: Tuple[str, ...]
+    offsets: Mapping[str, Tuple[int, int]]
+    timestamps: array  # type: ignore[type-arg]
+    opening_price: array  # type: ignore[type-arg]
+    high_price: array  # type: ignore[type-arg]
+    low_price: array  # type: ignore[type-arg]
+    trade_price: array  # type: ignore[type-arg]
+    acc_trade_price: array  # type: ignore[type-arg]
+    acc_trade_volume: array  # type: ignore[type-arg]
+
+    def __len__(self) -> int:
+        return len(self.tickers)
+
+    @classmethod
+    def from_candles(cls, candles: Iterable[values.BaseCandle]) -> CandleBatch:
+        tickers: List[str] = []
+        offsets: Dict[str, Tuple[int, int]] = dict()
+        timestamps = array('q')
+        opening_price, high_price, low_price, trade_price = array('d'), array('d'), array('d'), array('d')
+        acc_trade_price, acc_trade_volume = array('d'), array('d')
+
+        for ticker, rows in groupby(sorted(candles, key=attrgetter('ticker', 'date_time')), key=attrgetter('ticker')):
+            start = len(tickers)
+            for candle in rows:
+                tickers.append(ticker)
+                timestamps.append(int(candle.date_time.timestamp()))
+                opening_price.append(float(candle.opening_price))
+                high_price.append(float(candle.high_price))
+                low_price.append(float(candle.low_price))
+                trade_price.append(float(candle.trade_price))
+                acc_trade_price.append(float(candle.acc_trade_price))
+                acc_trade_volume.append(float(candle.acc_trade_volume))
+            offsets[ticker] = (start, len(tickers))
+
+        return cls(
+            tickers=tuple(tickers),
+            offsets=offsets,
+            timestamps=timestamps,
+            opening_price=opening_price,
+            high_price=high_price,
+            low_price=low_price,
+            trade_price=trade_price,
+            acc_trade_price=acc_trade_price,
+            acc_trade_volume=acc_trade_volume,
+        )
+
+    def resample(self, interval: datetime.timedelta) -> CandleBatch:
+        """
+        Candles rolled up into bars of `interval` (a multiple of a minute, e.g. 2 hours from `MIN1` candles),
+        aligned from the epoch in UTC like the candles of the REST API. Bars without candles are omitted.
+        """
+        seconds = _seconds(interval)
+        tickers: List[str] = []
+        offsets: Dict[str, Tuple[int, int]] = dict()
+        timestamps = array('q')
+        opening_price, high_price, low_price, trade_price = array('d'), array('d'), array('d'), array('d')
+        acc_trade_price, acc_trade_volume = array('d'), array('d')
+
+        for ticker, (start, stop) in self.offsets.items():
+            first = len(timestamps)
+            bucket = None
+            for i in range(start, stop):
+                time = self.timestamps[i] - self.timestamps[i] % seconds
+                if time != bucket:
+                    bucket = time
+                    tickers.append(ticker)
+                    timestamps.append(time)
+                    opening_price.append(self.opening_price[i])
+                    high_price.append(self.high_price[i])
+                    low_price.append(self.low_price[i])
+                    trade_price.append(self.trade_price[i])
+                    acc_trade_price.append(self.acc_trade_price[i])
+                    acc_trade_volume.append(self.acc_trade_volume[i])
+                else:
+                    if self.high_price[i] > high_price[-1]:
+                        high_price[-1] = self.high_price[i]
+                    if self.low_price[i] < low_price[-1]:
+                        low_price[-1] = self.low_price[i]
+                    trade_price[-1] = self.trade_price[i]
+                    acc_trade_price[-1] += self.acc_trade_price[i]
+                    acc_trade_volume[-1] += self.acc_trade_volume[i]
+            offsets[ticker] = (first, len(timestamps))
+
+        return CandleBatch(
+            tickers=tuple(tickers),
+            offsets=offsets,
+            timestamps=timestamps,
+            opening_price=opening_price,
+            high_price=high_price,
+            low_price=low_price,
+            trade_price=trade_price,
+            acc_trade_price=acc_trade_price,
+            acc_trade_volume=acc_trade_volume,
+        )
+
+    def align(
+        self,
+        interval: datetime.timedelta,
+        start: Optional[datetime.datetime] = None,
+        stop: Optional[datetime.datetime] = None,
+    ) -> CandleGrid:
+        """
+        Candles of all tickers on one grid of `interval` from `start` until `stop` (exclusive),
+        by default spanning all candles. Candles are rolled up as by `resample()` first.
+
+        Upbit omits the candles of periods without trades; these are filled with the previous close as all prices
+        and zero volumes. Periods before the first candle of a ticker have NaN prices.
+        """
+        batch = self.resample(interval)
+        seconds = _seconds(interval)
+        if start is None:
+            first = min(batch.timestamps) if batch.timestamps else 0
+        else:
+            first = _epoch(start) - _epoch(start) % seconds
+        if stop is None:
+            last = max(batch.timestamps) + seconds if batch.timestamps else first
+        else:
+            last = _epoch(stop)
+        timestamps = array('q', range(first, max(first, last), seconds))
+        width = len(timestamps)
+        tickers = tuple(batch.offsets)
+
+        size = len(tickers) * width
+        nan = array('d', [math.nan])
+        opening_price, high_price, low_price, trade_price = (nan * size for _ in range(4))
+        acc_trade_price, acc_trade_volume = array('d', bytes(8 * size)), array('d', bytes(8 * size))
+
+        for row, ticker in enumerate(tickers):
+            begin, end = batch.offsets[ticker]
+            base = row * width
+            close = math.nan
+            i = begin
+            # candles before the grid only carry their close forward
+            while i < end and batch.timestamps[i] < first:
+                close = batch.trade_price[i]
+                i += 1
+            for column in range(width):
+                cell = base + column
+                if i < end and batch.timestamps[i] == timestamps[column]:
+                    opening_price[cell] = batch.opening_price[i]
+                    high_price[cell] = batch.high_price[i]
+                    low_price[cell] = batch.low_price[i]
+                    trade_price[cell] = close = batch.trade_price[i]
+                    acc_trade_price[cell] = batch.acc_trade_price[i]
+                    acc_trade_volume[cell] = batch.acc_trade_volume[i]
+                    i += 1
+                else:
+                    opening_price[cell] = high_price[cell] = low_price[cell] = trade_price[cell] = close
+
+        return CandleGrid(
+            tickers=tickers,
+            timestamps=timestamps,
+            opening_price=opening_price,
+            high_price=high_price,
+            low_price=low_price,
+            trade_price=trade_price,
+            acc_trade_price=acc_trade_price,
+            acc_trade_volume=acc_trade_volume,
+        )
+
+
+@dataclass(frozen=True)
+class CandleGrid:
+    """
+    Candles of many markets aligned on the same times, as returned by `CandleBatch.align()`.
+
+    Each column is a dense `len(tickers)` by `len(timestamps)` matrix flattened by ticker,
+    so the value of `tickers[row]` at `timestamps[column]` is at `row * len(timestamps) + column`.
+    `series()` gives a row without copying.
+    """
+
+    __slots__ = (
+        'tickers',
+        'timestamps',
+        'opening_price',
+        'high_price',
+        'low_price',
+        'trade_price',
+        'acc_trade_price',
+        'acc_trade_volume',
+    )
+
+    tickers: Tuple[str, ...]
+    timestamps: array  # type: ignore[type-arg]
+    opening_price: array  # type: ignore[type-arg]
+    high_price: array  # type: ignore[type-arg]
+    low_price: array  # type: ignore[type-arg]
+    trade_price: array  # type: ignore[type-arg]
+    acc_trade_price: array  # type: ignore[type-arg]
+    acc_trade_volume: array  # type: ignore[type-arg]
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return len(self.tickers), len(self.timestamps)
+
+    def series(self, ticker: str, column: str = 'trade_price') -> memoryview:
+        """
+        Values of `column` (e.g. `'acc_trade_volume'`) of `ticker` at every time of `timestamps`.
+        """
+        if column not in self.__slots__[2:]:
+            raise ValueError(f'unknown column: {column}')
+        width = len(self.timestamps)
+        start = self.tickers.index(ticker) * width
+        return memoryview(getattr(self, column))[start : start + width]
@@ -4,7 +4,17 @@ from enum import Enum
 
 from typing_extensions import Literal, TypeAlias
 
-__all__ = ('MarketWarning', 'Side', 'Change', 'OrderType', 'OrderState', 'OrderBy', 'CurrencyCode', 'DaysAgo')
+__all__ = (
+    'MarketWarning',
+    'Side',
+    'Change',
+    'OrderType',
+    'OrderState',
+    'OrderBy',
+    'RateLimitGroup',
+    'CurrencyCode',
+    'DaysAgo',
+)
 
 
 class MarketWarning(str, Enum):
@@ -27,6 +37,7 @@ class OrderType(str, Enum):
     LIMIT = 'limit'
     PRICE = 'price'
     MARKET = 'market'
+    BEST = 'best'
 
 
 class OrderState(str, Enum):
@@ -34,6 +45,9 @@ class OrderState(str, Enum):
     WATCH = 'watch'
     DONE = 'done'
     CANCEL = 'cancel'
+    # only in `myOrder` events of the WebSocket EXCHANGE API
+    TRADE = 'trade'
+    PREVENTED = 'prevented'
 
 
 class OrderBy(str, Enum):
@@ -41,5 +55,15 @@ class OrderBy(str, Enum):
     DESC = 'desc'
 
 
+class RateLimitGroup(str, Enum):
+    MARKET = 'market'
+    CANDLES = 'candles'
+    TRADES = 'trades'
+    TICKER = 'ticker'
+    ORDERBOOK = 'orderbook'
+    DEFAULT = 'default'
+    ORDER = 'order'
+
+
 CurrencyCode: TypeAlias = str
 DaysAgo: TypeAlias = Literal[0, 1, 2, 3, 4, 5, 6, 7]
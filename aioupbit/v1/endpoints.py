@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import datetime
+import functools
+from typing import Any, List, Mapping, Optional, Tuple
+from urllib.parse import quote
+
+from typing_extensions import Final
+
+from aioupbit.v1 import constants, values
+
+__all__ = (
+    'Endpoint',
+    'MARKETS',
+    'MIN_CANDLES',
+    'DAY_CANDLES',
+    'WEEK_CANDLES',
+    'MONTH_CANDLES',
+    'TRADES',
+    'TICKER',
+    'ORDERBOOK',
+    'ACCOUNTS',
+    'ORDERS_CHANCE',
+    'ORDER',
+    'ORDERS',
+    'CANCEL_ORDER',
+    'build_query',
+    'market_query',
+    'markets_query',
+    'format_time',
+)
+
+# characters Upbit query values contain that need no escaping (e.g. `KRW-BTC,KRW-ETH`, `2022-02-06T09:22:30Z`)
+_SAFE: Final[str] = '-_.~,:'
+
+
+@functools.lru_cache(maxsize=4096)
+def _quote(value: str) -> str:
+    return quote(value, safe=_SAFE)
+
+
+def build_query(params: Mapping[str, Any]) -> str:
+    """
+    Percent-encoded query string of `params` in their order. Lists are repeated as `key[]=item`.
+
+    The result is sent as is, so it is also the exact string to hash for `Client._gen_auth_token()`.
+    """
+    fields: List[str] = []
+    for key, value in params.items():
+        if isinstance(value, list):
+            fields.extend(f'{key}[]={_quote(str(item))}' for item in value)
+        elif isinstance(value, int):
+            fields.append(f'{key}={value}')
+        else:
+            fields.append(f'{key}={_quote(str(value))}')
+    return '&'.join(fields)
+
+
+@functools.lru_cache(maxsize=4096)
+def market_query(code: str) -> str:
+    """
+    `market` parameter of `code`.
+    """
+    return f'market={_quote(code)}'
+
+
+@functools.lru_cache(maxsize=1024)
+def markets_query(codes: Tuple[str, ...]) -> str:
+    """
+    `markets` parameter of `codes`, cached for repeated market sets.
+    """
+    return 'markets=' + _quote(','.join(codes))
+
+
+def format_time(to: datetime.datetime) -> str:
+    """
+    `to` parameter of candle endpoints. (formats like `strftime('%Y-%m-%dT%H:%M:%SZ')` in UTC, but faster)
+    """
+    to = to.astimezone(datetime.timezone.utc)
+    return f'{to.year:04}-{to.month:02}-{to.day:02}T{to.hour:02}:{to.minute:02}:{to.second:02}Z'
+
+
+class Endpoint:
+    """
+    API endpoint with its path pre-joined to the start of a query string.
+    `name` is the client method that calls it, as reported by `instrumentation.RequestMetrics`,
+    and `group` is the rate limit group the server charges it to.
+    """
+
+    __slots__ = ('name', 'path', 'group', '_prefix')
+
+    def __init__(self, name: str, path: str, group: constants.RateLimitGroup) -> None:
+        self.name = name
+        self.path = path
+        self.group = group
+        self._prefix = f'{path}?'
+
+    def url(self, query: Optional[str] = None) -> str:
+        """
+        Already encoded, relative to `Client.BASE_URL`.
+        """
+        return self.path if not query else self._prefix + query
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({self.name!r}, {self.path!r}, {self.group})'
+
+
+MARKETS: Final[Endpoint] = Endpoint('markets', '/v1/market/all', constants.RateLimitGroup.MARKET)
+MIN_CANDLES: Final[Mapping[values.MinCandle.Unit, Endpoint]] = {
+    unit: Endpoint('candles', f'/v1/candles/minutes/{unit.value}', constants.RateLimitGroup.CANDLES)
+    for unit in values.MinCandle.Unit
+}
+DAY_CANDLES: Final[Endpoint] = Endpoint('candles_day', '/v1/candles/days', constants.RateLimitGroup.CANDLES)
+WEEK_CANDLES: Final[Endpoint] = Endpoint('candles_week', '/v1/candles/weeks', constants.RateLimitGroup.CANDLES)
+MONTH_CANDLES: Final[Endpoint] = Endpoint('candles_month', '/v1/candles/months', constants.RateLimitGroup.CANDLES)
+TRADES: Final[Endpoint] = Endpoint('latest_trades', '/v1/trades/ticks', constants.RateLimitGroup.TRADES)
+TICKER: Final[Endpoint] = Endpoint('latest_tick', '/v1/ticker', constants.RateLimitGroup.TICKER)
+ORDERBOOK: Final[Endpoint] = Endpoint('orderbook', '/v1/orderbook', constants.RateLimitGroup.ORDERBOOK)
+ACCOUNTS: Final[Endpoint] = Endpoint('accounts', '/v1/accounts', constants.RateLimitGroup.DEFAULT)
+ORDERS_CHANCE: Final[Endpoint] = Endpoint('market_with_account', '/v1/orders/chance', constants.RateLimitGroup.DEFAULT)
+ORDER: Final[Endpoint] = Endpoint('get_order', '/v1/order', constants.RateLimitGroup.DEFAULT)
+ORDERS: Final[Endpoint] = Endpoint('orders', '/v1/orders', constants.RateLimitGroup.DEFAULT)
+# DELETE of the path of `ORDER`, limited with order placement
+CANCEL_ORDER: Final[Endpoint] = Endpoint('cancel_order', '/v1/order', constants.RateLimitGroup.ORDER)
@@ -0,0 +1,331 @@
+from __future__ import annotations
+
+import math
+from abc import ABCMeta, abstractmethod
+from array import array
+from collections import deque
+from typing import Callable, Deque, Dict, Iterable, Mapping, Optional, Tuple, Type, Union
+
+from typing_extensions import TypeAlias
+
+from aioupbit.v1 import values
+from aioupbit.v1.columnar import CandleBatch
+
+__all__ = ('Indicator', 'SMA', 'EMA', 'RSI', 'ATR', 'VWAP', 'IndicatorEngine')
+
+# high, low, close, acc_trade_price, acc_trade_volume of a candle
+_Row: TypeAlias = Tuple[float, float, float, float, float]
+CandleKind: TypeAlias = Union[values.MinCandle.Unit, Type[values.BaseCandle]]
+
+
+def _time(candle: values.BaseCandle) -> int:
+    # epoch seconds like `CandleBatch.timestamps`, so live candles can follow a batch
+    return int(candle.date_time.timestamp())
+
+
+def _row(candle: values.BaseCandle) -> _Row:
+    return (
+        float(candle.high_price),
+        float(candle.low_price),
+        float(candle.trade_price),
+        float(candle.acc_trade_price),
+        float(candle.acc_trade_volume),
+    )
+
+
+class Indicator(metaclass=ABCMeta):
+    """
+    Indicator over a candle series, updated in O(1) per candle.
+
+    The latest candle is pending until a candle of a later `date_time` arrives, so a live bar may be updated
+    any number of times: each update of the same bar is computed from the state before it, not added again.
+    """
+
+    __slots__ = ('value', '_time', '_pending')
+
+    def __init__(self) -> None:
+        self.value: Optional[float] = None
+        self._time: Optional[int] = None
+        self._pending: Optional[_Row] = None
+
+    @abstractmethod
+    def _compute(self, row: _Row) -> Optional[float]:
+        """
+        Value with `row` as the latest candle, from the committed state.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def _commit(self, row: _Row) -> None:
+        """
+        Adds `row` to the committed state.
+        """
+        raise NotImplementedError
+
+    def _push(self, time: int, row: _Row) -> Optional[float]:
+        if time != self._time:
+            if self._pending is not None:
+                self._commit(self._pending)
+            self._time = time
+        self._pending = row
+        self.value = value = self._compute(row)
+        return value
+
+    def update(self, candle: values.BaseCandle) -> Optional[float]:
+        """
+        Adds `candle`, or replaces the latest one if it is of the same `date_time`. `None` while warming up.
+        """
+        return self._push(_time(candle), _row(candle))
+
+    def batch(self, batch: CandleBatch, start: int = 0, stop: Optional[int] = None) -> array:  # type: ignore[type-arg]
+        """
+        Values of the rows `start:stop` of `batch` (one ticker, e.g. `batch.offsets[ticker]`), NaN while warming up.
+        The rows are pushed like `update()`, so live candles can follow.
+        """
+        if stop is None:
+            stop = len(batch)
+        push = self._push
+        timestamps, high, low = batch.timestamps, batch.high_price, batch.low_price
+        close, acc_price, acc_volume = batch.trade_price, batch.acc_trade_price, batch.acc_trade_volume
+        result = array('d', bytes(8 * (stop - start)))
+        nan = math.nan
+        for i in range(start, stop):
+            value = push(timestamps[i], (high[i], low[i], close[i], acc_price[i], acc_volume[i]))
+            result[i - start] = nan if value is None else value
+        return result
+
+
+class SMA(Indicator):
+    """
+    Simple moving average of trade prices.
+    """
+
+    __slots__ = ('period', '_window', '_sum')
+
+    def __init__(self, period: int) -> None:
+        super().__init__()
+        self.period = period
+        self._window: Deque[float] = deque()
+        self._sum = 0.0
+
+    def _compute(self, row: _Row) -> Optional[float]:
+        if len(self._window) < self.period - 1:
+            return None
+        return (self._sum + row[2]) / self.period
+
+    def _commit(self, row: _Row) -> None:
+        window = self._window
+        window.append(row[2])
+        self._sum += row[2]
+        if len(window) >= self.period:
+            self._sum -= window.popleft()
+
+
+class EMA(Indicator):
+    """
+    Exponential moving average of trade prices (`alpha = 2 / (period + 1)`), seeded with the SMA of the first period.
+    """
+
+    __slots__ = ('period', 'alpha', '_count', '_average')
+
+    def __init__(self, period: int) -> None:
+        super().__init__()
+        self.period = period
+        self.alpha = 2 / (period + 1)
+        self._count = 0
+        self._average = 0.0
+
+    def _compute(self, row: _Row) -> Optional[float]:
+        count = self._count + 1
+        if count < self.period:
+            return None
+        if count == self.period:
+            return (self._average + row[2]) / self.period
+        return self._average + self.alpha * (row[2] - self._average)
+
+    def _commit(self, row: _Row) -> None:
+        if self._count + 1 >= self.period:
+            self._average = self._compute(row)  # type: ignore[assignment]
+        else:
+            # the sum of the seed period
+            self._average += row[2]
+        self._count += 1
+
+
+class RSI(Indicator):
+    """
+    Relative strength index with Wilder's smoothing, seeded with the simple averages of the first period.
+    """
+
+    __slots__ = ('period', '_previous', '_count', '_gain', '_loss')
+
+    def __init__(self, period: int = 14) -> None:
+        super().__init__()
+        self.period = period
+        self._previous: Optional[float] = None
+        self._count = 0
+        self._gain = self._loss = 0.0
+
+    def _averages(self, row: _Row) -> Optional[Tuple[float, float]]:
+        if self._previous is None:
+            return None
+        change = row[2] - self._previous
+        gain, loss = (change, 0.0) if change > 0 else (0.0, -change)
+        count, period = self._count + 1, self.period
+        if count < period:
+            return None
+        if count == period:
+            return (self._gain + gain) / period, (self._loss + loss) / period
+        return (self._gain * (period - 1) + gain) / period, (self._loss * (period - 1) + loss) / period
+
+    def _compute(self, row: _Row) -> Optional[float]:
+        averages = self._averages(row)
+        if averages is None:
+            return None
+        gain, loss = averages
+        if loss == 0:
+            return 100.0 if gain > 0 else 50.0
+        return 100 - 100 / (1 + gain / loss)
+
+    def _commit(self, row: _Row) -> None:
+        if self._previous is not None:
+            averages = self._averages(row)
+            if averages is None:
+                change = row[2] - self._previous
+                if change > 0:
+                    self._gain += change
+                else:
+                    self._loss -= change
+            else:
+                self._gain, self._loss = averages
+            self._count += 1
+        self._previous = row[2]
+
+
+class ATR(Indicator):
+    """
+    Average true range with Wilder's smoothing, seeded with the simple average of the first period.
+    """
+
+    __slots__ = ('period', '_previous', '_count', '_average')
+
+    def __init__(self, period: int = 14) -> None:
+        super().__init__()
+        self.period = period
+        self._previous: Optional[float] = None
+        self._count = 0
+        self._average = 0.0
+
+    def _true_range(self, row: _Row) -> float:
+        high, low, _, _, _ = row
+        if self._previous is None:
+            return high - low
+        return max(high, self._previous) - min(low, self._previous)
+
+    def _compute(self, row: _Row) -> Optional[float]:
+        count, period = self._count + 1, self.period
+        if count < period:
+            return None
+        if count == period:
+            return (self._average + self._true_range(row)) / period
+        return (self._average * (period - 1) + self._true_range(row)) / period
+
+    def _commit(self, row: _Row) -> None:
+        if self._count + 1 >= self.period:
+            self._average = self._compute(row)  # type: ignore[assignment]
+        else:
+            self._average += self._true_range(row)
+        self._count += 1
+        self._previous = row[2]
+
+
+class VWAP(Indicator):
+    """
+    Volume weighted average price over the last `period` candles, or all candles if `None`.
+    Computed from the accumulated trade price and volume of the candles, so it is exact rather than typical-price based.
+    """
+
+    __slots__ = ('period', '_window', '_price', '_volume')
+
+    def __init__(self, period: Optional[int] = None) -> None:
+        super().__init__()
+        self.period = period
+        self._window: Deque[Tuple[float, float]] = deque()
+        self._price = self._volume = 0.0
+
+    def _compute(self, row: _Row) -> Optional[float]:
+        if self.period is not None and len(self._window) < self.period - 1:
+            return None
+        volume = self._volume + row[4]
+        if volume == 0:
+            return None
+        return (self._price + row[3]) / volume
+
+    def _commit(self, row: _Row) -> None:
+        self._price += row[3]
+        self._volume += row[4]
+        if self.period is not None:
+            window = self._window
+            window.append((row[3], row[4]))
+            if len(window) >= self.period:
+                price, volume = window.popleft()
+                self._price -= price
+                self._volume -= volume
+
+
+class IndicatorEngine:
+    """
+    Named indicators of every `(ticker, kind)` series, where `kind` is the unit of minute candles
+    or the candle type otherwise (e.g. `values.DayCandle`).
+
+    Each series gets its own indicators from `factories` on its first candle.
+    `batch()` evaluates a whole `CandleBatch` of many markets in one pass and leaves the indicators ready
+    for live `update()`s.
+
+    ::
+
+        engine = IndicatorEngine(dict(sma=lambda: SMA(20), rsi=RSI))
+        columns = engine.batch(await RestClient.candles_batch(tickers, count=200), MinCandle.Unit.MIN1)
+        engine.update(live_candle)  # {'sma': ..., 'rsi': ...}
+    """
+
+    __slots__ = ('factories', '_series')
+
+    def __init__(self, factories: Mapping[str, Callable[[], Indicator]]) -> None:
+        self.factories = dict(factories)
+        self._series: Dict[Tuple[str, CandleKind], Dict[str, Indicator]] = dict()
+
+    @staticmethod
+    def kind(candle: values.BaseCandle) -> CandleKind:
+        if isinstance(candle, values.MinCandle):
+            return candle.unit
+        return type(candle)
+
+    def indicators(self, ticker: str, kind: CandleKind) -> Dict[str, Indicator]:
+        series = self._series.get((ticker, kind))
+        if series is None:
+            series = self._series[(ticker, kind)] = {name: factory() for name, factory in self.factories.items()}
+        return series
+
+    def latest(self, ticker: str, kind: CandleKind) -> Dict[str, Optional[float]]:
+        return {name: indicator.value for name, indicator in self.indicators(ticker, kind).items()}
+
+    def update(self, candle: values.BaseCandle) -> Dict[str, Optional[float]]:
+        indicators = self.indicators(candle.ticker, self.kind(candle))
+        time, row = _time(candle), _row(candle)
+        return {name: indicator._push(time, row) for name, indicator in indicators.items()}
+
+    def update_many(self, candles: Iterable[values.BaseCandle]) -> None:
+        for candle in candles:
+            self.update(candle)
+
+    def batch(self, batch: CandleBatch, kind: CandleKind) -> Dict[str, Dict[str, array]]:  # type: ignore[type-arg]
+        """
+        Values of every row of `batch` by ticker and indicator name, aligned with the rows `batch.offsets[ticker]`.
+        """
+        result = dict()
+        for ticker, (start, stop) in batch.offsets.items():
+            result[ticker] = {
+                name: indicator.batch(batch, start, stop) for name, indicator in self.indicators(ticker, kind).items()
+            }
+        return result
@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from types import SimpleNamespace
+from typing import Callable, Mapping, Optional
+
+import aiohttp
+from typing_extensions import Final, TypeAlias
+
+from aioupbit.v1 import values
+
+__all__ = ('RequestMetrics', 'Instrument', 'TRACE_CONFIG')
+
+
+@dataclass(frozen=True)
+class RequestMetrics:
+    """
+    Timings of a single request. All durations are in seconds.
+
+    `connection_acquire` includes waiting for a free slot of the connection pool and opening a new connection.
+    `connection_limit` is the connection pool size of the session. (0 if the connector is unlimited)
+    `remaining_req` is `None` if the response has no valid `Remaining-Req` header.
+    """
+
+    __slots__ = (
+        'endpoint',
+        'path',
+        'status',
+        'connection_acquire',
+        'time_to_first_byte',
+        'body_read',
+        'decode',
+        'construct',
+        'total',
+        'bytes_received',
+        'remaining_req',
+        'connection_limit',
+    )
+
+    endpoint: str
+    path: str
+    status: int
+    connection_acquire: float
+    time_to_first_byte: float
+    body_read: float
+    decode: float
+    construct: float
+    total: float
+    bytes_received: int
+    remaining_req: Optional[values.RemainingReq]
+    connection_limit: int
+
+
+Instrument: TypeAlias = Callable[[RequestMetrics], None]
+
+
+class RequestTrace:
+    """
+    Mutable timing record of an in-flight request. Passed as `trace_request_ctx` of aiohttp.
+    `connection_acquired` and `connection_limit` are only known to aiohttp and left unset by other transports.
+    """
+
+    __slots__ = (
+        'endpoint',
+        'started',
+        'connection_acquired',
+        'headers_received',
+        'body_read',
+        'decoded',
+        'constructed',
+        'bytes_received',
+        'status',
+        'path',
+        'remaining_req',
+        'connection_limit',
+    )
+
+    def __init__(self, endpoint: str) -> None:
+        self.endpoint = endpoint
+        self.started = time.perf_counter()
+        self.connection_acquired: Optional[float] = None
+        self.headers_received = self.body_read = self.decoded = self.constructed = self.started
+        self.bytes_received = 0
+        self.status = 0
+        self.path = ''
+        self.remaining_req: Optional[values.RemainingReq] = None
+        self.connection_limit = 0
+
+    def on_headers(self, status: int, path: str, headers: Mapping[str, str]) -> None:
+        self.headers_received = time.perf_counter()
+        self.status = status
+        self.path = path
+        header = headers.get('Remaining-Req')
+        if header is not None:
+            self.remaining_req = values.RemainingReq.from_header(header)
+
+    def on_body(self, size: int) -> None:
+        self.body_read = time.perf_counter()
+        self.bytes_received = size
+
+    def on_decoded(self) -> None:
+        self.decoded = time.perf_counter()
+
+    def on_constructed(self) -> None:
+        self.constructed = time.perf_counter()
+
+    def finish(self) -> RequestMetrics:
+        connection_acquired = self.started if self.connection_acquired is None else self.connection_acquired
+        return RequestMetrics(
+            endpoint=self.endpoint,
+            path=self.path,
+            status=self.status,
+            connection_acquire=connection_acquired - self.started,
+            time_to_first_byte=self.headers_received - connection_acquired,
+            body_read=self.body_read - self.headers_received,
+            decode=self.decoded - self.body_read,
+            construct=self.constructed - self.decoded,
+            total=self.constructed - self.started,
+            bytes_received=self.bytes_received,
+            remaining_req=self.remaining_req,
+            connection_limit=self.connection_limit,
+        )
+
+
+async def _on_request_start(
+    session: aiohttp.ClientSession, context: SimpleNamespace, params: aiohttp.TraceRequestStartParams
+) -> None:
+    trace = context.trace_request_ctx
+    if isinstance(trace, RequestTrace):
+        trace.started = time.perf_counter()
+
+
+async def _on_connection_acquired(session: aiohttp.ClientSession, context: SimpleNamespace, params: object) -> None:
+    trace = context.trace_request_ctx
+    if isinstance(trace, RequestTrace):
+        trace.connection_acquired = time.perf_counter()
+
+
+def _build_trace_config() -> aiohttp.TraceConfig:
+    trace_config = aiohttp.TraceConfig()
+    trace_config.on_request_start.append(_on_request_start)
+    trace_config.on_connection_create_end.append(_on_connection_acquired)
+    trace_config.on_connection_reuseconn.append(_on_connection_acquired)
+    return trace_config
+
+
+TRACE_CONFIG: Final[aiohttp.TraceConfig] = _build_trace_config()
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import asyncio
+from types import TracebackType
+from typing import Optional, Type
+
+import aiohttp
+
+from aioupbit.v1.client import Client
+
+__all__ = ('ConnectionWarmer',)
+
+
+class ConnectionWarmer:
+    """
+    Keeps `size` connections of `connector` open and healthy, so that requests, such as the first order after startup
+    or an idle gap, skip DNS, TCP and TLS setup.
+
+    `warm()` sends `size` concurrent requests of `path`, which is not a rate limited endpoint, so `size` connections
+    are opened or reused and then returned to the pool of `connector`. Repeated every `interval` seconds by `start()`,
+    this keeps idle connections alive, and a half-dead connection fails its ping within `timeout` seconds and is closed
+    by aiohttp, then replaced, before a real request lands on it.
+
+    The `keepalive_timeout` of `connector` must be longer than `interval`, or idle connections are dropped between
+    pings. Share `connector` with the client through `AioHTTPRestClient.set_class_level_connector()`
+    or the `connector` argument, or use `AioHTTPRestClient.prewarm()`.
+    """
+
+    __slots__ = (
+        'connector',
+        'base_url',
+        'size',
+        'interval',
+        'path',
+        'timeout',
+        'pings',
+        'failures',
+        '_session',
+        '_task',
+    )
+
+    def __init__(
+        self,
+        connector: aiohttp.BaseConnector,
+        base_url: str = Client.BASE_URL,
+        size: int = 4,
+        interval: float = 10,
+        path: str = '/',
+        timeout: float = 2,
+    ) -> None:
+        self.connector = connector
+        self.base_url = base_url
+        self.size = size
+        self.interval = interval
+        self.path = path
+        self.timeout = timeout
+        self.pings = 0
+        self.failures = 0
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._task: Optional[asyncio.Task[None]] = None
+
+    @property
+    def idle_connections(self) -> int:
+        """
+        Open connections in the pool of `connector`, as a best-effort aid for tests and diagnostics.
+
+        aiohttp has no public API for this, so it reads the private `_conns` of the connector, which may change
+        between aiohttp releases. It is 0 if the attribute is missing. Do not base decisions on it.
+        """
+        return sum(
+            sum(1 for proto, _ in conns if proto.is_connected())
+            for conns in getattr(self.connector, '_conns', {}).values()
+        )
+
+    async def _ping(self, session: aiohttp.ClientSession) -> bool:
+        self.pings += 1
+        try:
+            async with session.get(self.path, timeout=aiohttp.ClientTimeout(total=self.timeout)) as res:
+                await res.read()
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            # aiohttp closes the connection that failed
+            self.failures += 1
+            return False
+        return True
+
+    async def warm(self) -> int:
+        """
+        Pings `size` connections at once, replaces the ones that failed, and returns the number of failures.
+        """
+        session = self._session
+        if session is None:
+            session = self._session = aiohttp.ClientSession(
+                self.base_url, connector=self.connector, connector_owner=False
+            )
+        results = await asyncio.gather(*(self._ping(session) for _ in range(self.size)))
+        failed = results.count(False)
+        if failed:
+            await asyncio.gather(*(self._ping(session) for _ in range(failed)))
+        return failed
+
+    async def run(self) -> None:
+        """
+        Warms every `interval` seconds until cancelled.
+        """
+        while True:
+            await asyncio.sleep(self.interval)
+            await self.warm()
+
+    async def start(self) -> None:
+        """
+        Warms up, then keeps the connections alive in the background until `close()`.
+        """
+        await self.warm()
+        if self._task is None:
+            self._task = asyncio.ensure_future(self.run())
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self) -> ConnectionWarmer:
+        await self.start()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        await self.close()
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import asyncio
+from operator import attrgetter
+from typing import Any, AsyncIterable, Callable, Dict, Generic, Iterable, List, Optional, Tuple, TypeVar
+
+__all__ = ('LatestValueStore',)
+
+_T = TypeVar('_T')
+
+
+class LatestValueStore(Generic[_T]):
+    """
+    The latest value (e.g. `values.Tick` or `values.Orderbook`) of each ticker, with a version per ticker
+    that counts its updates. Consumers read the latest value when they are ready instead of queueing
+    every intermediate update.
+
+    Any source can fill it: `put` as the `on_change` of `polling.TickPoller`, `put_many()` with the result of
+    `latest_tick()`, or `feed()` with an async iterable such as `pipeline.poll_items()`.
+
+    ::
+
+        version = 0
+        while True:
+            version, orderbook = await store.wait_newer('KRW-BTC', version)
+            ...
+    """
+
+    __slots__ = ('key', '_values', '_versions', '_waiters')
+
+    def __init__(self, key: Callable[[_T], str] = attrgetter('ticker')) -> None:
+        self.key = key
+        self._values: Dict[str, _T] = dict()
+        self._versions: Dict[str, int] = dict()
+        self._waiters: Dict[str, List[asyncio.Future[None]]] = dict()
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __contains__(self, ticker: Any) -> bool:
+        return ticker in self._values
+
+    @property
+    def tickers(self) -> Tuple[str, ...]:
+        return tuple(self._values)
+
+    def get(self, ticker: str) -> Optional[_T]:
+        return self._values.get(ticker)
+
+    def version(self, ticker: str) -> int:
+        """
+        Number of updates of `ticker`, 0 if it has none.
+        """
+        return self._versions.get(ticker, 0)
+
+    def put(self, value: _T) -> int:
+        """
+        Replaces the value of its ticker, wakes up the waiters, and returns the new version.
+        """
+        ticker = self.key(value)
+        self._values[ticker] = value
+        version = self._versions[ticker] = self._versions.get(ticker, 0) + 1
+        waiters = self._waiters.pop(ticker, None)
+        if waiters is not None:
+            for waiter in waiters:
+                if not waiter.done():
+                    waiter.set_result(None)
+        return version
+
+    def put_many(self, values: Iterable[_T]) -> None:
+        for value in values:
+            self.put(value)
+
+    async def wait_newer(self, ticker: str, version: int = 0) -> Tuple[int, _T]:
+        """
+        The version and value of `ticker` once its version is newer than `version`, immediately if it already is.
+        Intermediate updates are skipped.
+        """
+        while self._versions.get(ticker, 0) <= version:
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.setdefault(ticker, []).append(waiter)
+            try:
+                await waiter
+            finally:
+                waiters = self._waiters.get(ticker)
+                if waiters is not None and waiter in waiters:
+                    waiters.remove(waiter)
+        return self._versions[ticker], self._values[ticker]
+
+    async def feed(self, source: AsyncIterable[_T]) -> None:
+        """
+        Puts the values of `source` until it is exhausted.
+        """
+        async for value in source:
+            self.put(value)
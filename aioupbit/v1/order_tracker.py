@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+import asyncio
+import uuid
+from typing import Callable, ClassVar, Dict, FrozenSet, Iterable, List, Optional, Sequence, Tuple, Union
+
+from typing_extensions import Final
+
+from aioupbit.v1 import constants, values
+from aioupbit.v1.client import Client
+
+__all__ = ('OrderTracker',)
+
+_OPEN_STATES: Final[Tuple[constants.OrderState, ...]] = (constants.OrderState.WAIT, constants.OrderState.WATCH)
+_CLOSED_STATES: Final[Tuple[constants.OrderState, ...]] = (constants.OrderState.DONE, constants.OrderState.CANCEL)
+_FINAL_STATES: Final[FrozenSet[constants.OrderState]] = frozenset(
+    (constants.OrderState.DONE, constants.OrderState.CANCEL, constants.OrderState.PREVENTED)
+)
+
+
+class OrderTracker:
+    """
+    Keeps the open orders of `client` up to date, and resolves the future of each order when it is closed
+    (`DONE` or `CANCEL`).
+
+    Tracked orders are indexed by uuid and identifier, and refreshed in bulk: `refresh()` queries the open ones
+    by `BATCH_SIZE` uuids per request, and only the orders missing from the results, which have been closed since,
+    are queried again among the closed states. So N open orders cost about N / 100 requests per refresh
+    instead of N `get_order()` calls. Events of `websocket.ExchangeStream` may be passed to `apply()` as well.
+
+    `on_change` is called with every new state of a tracked order.
+    """
+
+    __slots__ = ('client', 'interval', 'on_change', '_orders', '_identifiers', '_futures')
+
+    BATCH_SIZE: ClassVar[int] = 100
+
+    def __init__(
+        self,
+        client: Client,
+        interval: float = 1,
+        on_change: Optional[Callable[[values.Order], None]] = None,
+    ) -> None:
+        self.client = client
+        self.interval = interval
+        self.on_change = on_change
+        self._orders: Dict[uuid.UUID, values.Order] = dict()
+        self._identifiers: Dict[str, uuid.UUID] = dict()
+        self._futures: Dict[uuid.UUID, asyncio.Future[values.Order]] = dict()
+
+    def __len__(self) -> int:
+        return len(self._orders)
+
+    @property
+    def open_orders(self) -> Sequence[values.Order]:
+        return tuple(self._orders.values())
+
+    def get(
+        self, *, order_uuid: Union[uuid.UUID, str, None] = None, identifier: Optional[str] = None
+    ) -> Optional[values.Order]:
+        """
+        The latest state of a tracked open order.
+        """
+        if order_uuid is None:
+            if identifier is None:
+                raise TypeError('either order_uuid or identifier is required')
+            tracked = self._identifiers.get(identifier)
+            return None if tracked is None else self._orders.get(tracked)
+        if isinstance(order_uuid, str):
+            order_uuid = uuid.UUID(order_uuid)
+        return self._orders.get(order_uuid)
+
+    def track(
+        self, order: values.Order, callback: Optional[Callable[[values.Order], None]] = None
+    ) -> asyncio.Future[values.Order]:
+        """
+        Starts tracking `order` (e.g. just placed), and returns a future of its closed state on the running loop.
+        `callback` is called with the closed state as well.
+        """
+        future = self._futures.get(order.order_uuid)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            if order.state in _FINAL_STATES:
+                # already closed, so not tracked
+                future.set_result(order)
+            else:
+                self._futures[order.order_uuid] = future
+                self._orders[order.order_uuid] = order
+                if order.identifier is not None:
+                    self._identifiers[order.identifier] = order.order_uuid
+        if callback is not None:
+
+            def on_done(done: asyncio.Future[values.Order]) -> None:
+                if not done.cancelled():
+                    callback(done.result())
+
+            future.add_done_callback(on_done)
+        return future
+
+    def untrack(self, order_uuid: uuid.UUID) -> None:
+        """
+        Stops tracking the order, and cancels its future.
+        """
+        order = self._orders.pop(order_uuid, None)
+        if order is not None and order.identifier is not None:
+            self._identifiers.pop(order.identifier, None)
+        future = self._futures.pop(order_uuid, None)
+        if future is not None:
+            future.cancel()
+
+    def apply(self, order: values.Order) -> bool:
+        """
+        Applies a new state of a tracked order, and returns whether it has changed. Other orders are ignored.
+        """
+        previous = self._orders.get(order.order_uuid)
+        if previous is None or previous == order:
+            return False
+
+        if order.state in _FINAL_STATES:
+            del self._orders[order.order_uuid]
+            if order.identifier is not None:
+                self._identifiers.pop(order.identifier, None)
+            future = self._futures.pop(order.order_uuid)
+            if not future.done():
+                future.set_result(order)
+        else:
+            self._orders[order.order_uuid] = order
+        if self.on_change is not None:
+            self.on_change(order)
+        return True
+
+    async def _query(
+        self, order_uuids: Sequence[uuid.UUID], states: Iterable[constants.OrderState]
+    ) -> Tuple[values.Order, ...]:
+        batch_size = self.BATCH_SIZE
+        results = await asyncio.gather(
+            *(
+                self.client.orders(uuids=order_uuids[start : start + batch_size], states=states, limit=batch_size)
+                for start in range(0, len(order_uuids), batch_size)
+            )
+        )
+        return tuple(order for orders in results for order in orders)
+
+    async def refresh(self) -> List[values.Order]:
+        """
+        Queries all tracked orders and returns the ones that changed.
+        """
+        order_uuids = tuple(self._orders)
+        if not order_uuids:
+            return []
+
+        changed = []
+        seen = set()
+        for order in await self._query(order_uuids, _OPEN_STATES):
+            seen.add(order.order_uuid)
+            if self.apply(order):
+                changed.append(order)
+
+        closed = [order_uuid for order_uuid in order_uuids if order_uuid not in seen and order_uuid in self._orders]
+        if closed:
+            for order in await self._query(closed, _CLOSED_STATES):
+                if self.apply(order):
+                    changed.append(order)
+        return changed
+
+    async def run(self) -> None:
+        """
+        Refreshes every `interval` seconds until cancelled.
+        """
+        while True:
+            await asyncio.gather(self.refresh(), asyncio.sleep(self.interval))
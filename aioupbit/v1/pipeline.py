@@ -0,0 +1,249 @@
+from __future__ import annotations
+
+import asyncio
+import collections
+from enum import Enum
+from operator import attrgetter
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Generic,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    OrderedDict,
+    TypeVar,
+)
+
+__all__ = ('Overflow', 'SubscriptionClosed', 'Subscription', 'Pipeline', 'poll_items')
+
+_T = TypeVar('_T')
+
+_ticker: Callable[[Any], Hashable] = attrgetter('ticker')
+
+
+class Overflow(str, Enum):
+    """
+    What a full subscription does with a new item.
+    """
+
+    # the publisher waits for the subscriber
+    BLOCK = 'block'
+    # the oldest item is dropped
+    DROP_OLDEST = 'drop_oldest'
+    # an item replaces the pending one of the same key (e.g. ticker), in its place;
+    # the oldest pending key is dropped if the new key does not fit
+    CONFLATE = 'conflate'
+
+
+class SubscriptionClosed(Exception):
+    pass
+
+
+def _wake(waiters: Deque[asyncio.Future[None]]) -> None:
+    while waiters:
+        waiter = waiters.popleft()
+        if not waiter.done():
+            waiter.set_result(None)
+            return
+
+
+class Subscription(Generic[_T]):
+    """
+    Bounded queue of one subscriber of a `Pipeline`, holding at most `maxsize` items or keys.
+    `dropped` counts the items dropped or replaced by `overflow`.
+
+    Iterating yields items until the subscription is closed and drained.
+    """
+
+    __slots__ = ('maxsize', 'overflow', 'key', 'dropped', '_items', '_latest', '_closed', '_getters', '_putters')
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        overflow: Overflow = Overflow.DROP_OLDEST,
+        key: Callable[[_T], Hashable] = _ticker,
+    ) -> None:
+        """
+        `key` groups items to conflate, by `ticker` by default.
+        """
+        if maxsize <= 0:
+            raise ValueError('maxsize must be positive')
+        self.maxsize = maxsize
+        self.overflow = overflow
+        self.key = key
+        self.dropped = 0
+        self._items: Deque[_T] = collections.deque()
+        self._latest: OrderedDict[Hashable, _T] = collections.OrderedDict()
+        self._closed = False
+        self._getters: Deque[asyncio.Future[None]] = collections.deque()
+        self._putters: Deque[asyncio.Future[None]] = collections.deque()
+
+    def __len__(self) -> int:
+        return len(self._latest) if self.overflow is Overflow.CONFLATE else len(self._items)
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def put_nowait(self, item: _T) -> bool:
+        """
+        Adds `item` by `overflow`, and returns `False` without adding it if `BLOCK` is full.
+        Items are ignored once closed.
+        """
+        if self._closed:
+            return True
+        if self.overflow is Overflow.CONFLATE:
+            latest = self._latest
+            key = self.key(item)
+            if key in latest:
+                self.dropped += 1
+            elif len(latest) >= self.maxsize:
+                latest.popitem(last=False)
+                self.dropped += 1
+            latest[key] = item
+        elif len(self._items) >= self.maxsize:
+            if self.overflow is Overflow.BLOCK:
+                return False
+            self._items.popleft()
+            self._items.append(item)
+            self.dropped += 1
+        else:
+            self._items.append(item)
+        _wake(self._getters)
+        return True
+
+    async def put(self, item: _T) -> None:
+        """
+        Adds `item`, waiting for space if `BLOCK` is full.
+        """
+        while not self.put_nowait(item):
+            waiter = asyncio.get_running_loop().create_future()
+            self._putters.append(waiter)
+            await waiter
+
+    def get_nowait(self) -> Optional[_T]:
+        if self.overflow is Overflow.CONFLATE:
+            if not self._latest:
+                return None
+            _, item = self._latest.popitem(last=False)
+        else:
+            if not self._items:
+                return None
+            item = self._items.popleft()
+            _wake(self._putters)
+        return item
+
+    async def get(self) -> _T:
+        """
+        Waits for the next item. Raises `SubscriptionClosed` once closed and drained.
+        """
+        while True:
+            if self._latest or self._items:
+                return self.get_nowait()  # type: ignore[return-value]
+            if self._closed:
+                raise SubscriptionClosed
+            waiter = asyncio.get_running_loop().create_future()
+            self._getters.append(waiter)
+            await waiter
+
+    def close(self) -> None:
+        """
+        Stops accepting items. Pending items are still delivered.
+        """
+        self._closed = True
+        for waiters in (self._getters, self._putters):
+            while waiters:
+                waiter = waiters.popleft()
+                if not waiter.done():
+                    waiter.set_result(None)
+
+    async def __aiter__(self) -> AsyncIterator[_T]:
+        while True:
+            try:
+                yield await self.get()
+            except SubscriptionClosed:
+                return
+
+
+class Pipeline(Generic[_T]):
+    """
+    Fans out items (e.g. `values.Tick` or `values.Orderbook`) to subscribers, each with its own bounded queue,
+    so a slow subscriber holds at most `maxsize` items and, unless it `BLOCK`s, never slows down the others.
+
+    ::
+
+        pipeline = Pipeline()
+        ticks = pipeline.subscribe(overflow=Overflow.CONFLATE)
+        asyncio.ensure_future(pipeline.pump(poll_items(lambda: RestClient.latest_tick(codes), 0.2)))
+        async for tick in ticks:
+            ...
+    """
+
+    __slots__ = ('_subscriptions',)
+
+    def __init__(self) -> None:
+        self._subscriptions: List[Subscription[_T]] = []
+
+    @property
+    def subscriptions(self) -> List[Subscription[_T]]:
+        return list(self._subscriptions)
+
+    def subscribe(
+        self,
+        maxsize: int = 1024,
+        overflow: Overflow = Overflow.DROP_OLDEST,
+        key: Callable[[_T], Hashable] = _ticker,
+    ) -> Subscription[_T]:
+        subscription: Subscription[_T] = Subscription(maxsize, overflow, key)
+        self._subscriptions.append(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription[_T]) -> None:
+        if subscription in self._subscriptions:
+            self._subscriptions.remove(subscription)
+        subscription.close()
+
+    async def publish(self, item: _T) -> None:
+        """
+        Delivers `item` to every subscriber. Waits only for the full subscribers that `BLOCK`.
+        """
+        blocked = [subscription for subscription in self._subscriptions if not subscription.put_nowait(item)]
+        if blocked:
+            await asyncio.gather(*(subscription.put(item) for subscription in blocked))
+
+    async def publish_many(self, items: Iterable[_T]) -> None:
+        for item in items:
+            await self.publish(item)
+
+    async def pump(self, source: AsyncIterable[_T]) -> None:
+        """
+        Publishes the items of `source` until it is exhausted, then closes the pipeline.
+        """
+        try:
+            async for item in source:
+                await self.publish(item)
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        for subscription in self._subscriptions:
+            subscription.close()
+        self._subscriptions.clear()
+
+
+async def poll_items(fetch: Callable[[], Awaitable[Iterable[_T]]], interval: float) -> AsyncIterator[_T]:
+    """
+    Yields the items of `fetch()` (e.g. `lambda: RestClient.orderbook(codes)`) every `interval` seconds.
+    """
+    loop = asyncio.get_running_loop()
+    while True:
+        started = loop.time()
+        for item in await fetch():
+            yield item
+        await asyncio.sleep(max(0.0, interval - (loop.time() - started)))
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple, Type, Union
+
+from aioupbit.v1 import endpoints, values
+from aioupbit.v1.client import BaseRestClient
+
+__all__ = ('TickPoller',)
+
+
+class TickPoller:
+    """
+    Polls `latest_tick` of `tickers` and reports only the markets that moved.
+
+    Each row is compared with the previous one of its market by `timestamp` and `trade_price` before it is parsed,
+    so an unchanged market costs neither a new `values.Tick` nor a call of `on_change`; the previous instance is kept.
+    Each market is polled every `min_interval` seconds while it moves, and its interval grows by `backoff`
+    up to `max_interval` while it stays unchanged or is missing from the response (e.g. delisted),
+    so quiet markets drop out of most requests.
+    `client` is a `BaseRestClient` class, such as `AioHTTPRestClient` or `TransportRestClient.using(transport)`.
+    """
+
+    __slots__ = (
+        'client',
+        'tickers',
+        'on_change',
+        'min_interval',
+        'max_interval',
+        'backoff',
+        '_keys',
+        '_ticks',
+        '_intervals',
+        '_due',
+    )
+
+    def __init__(
+        self,
+        client: Type[BaseRestClient],
+        tickers: Union[Iterable[values.Ticker], Iterable[str]],
+        on_change: Optional[Callable[[values.Tick], None]] = None,
+        min_interval: float = 0.2,
+        max_interval: float = 5,
+        backoff: float = 1.5,
+    ) -> None:
+        self.client = client
+        self.tickers: Tuple[str, ...] = tuple(map(client._get_ticker_code, tickers))
+        self.on_change = on_change
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self._keys: Dict[str, Tuple[Any, Any]] = dict()
+        self._ticks: Dict[str, values.Tick] = dict()
+        self._intervals: Dict[str, float] = {ticker: min_interval for ticker in self.tickers}
+        self._due: Dict[str, float] = {ticker: 0.0 for ticker in self.tickers}
+
+    def latest(self, ticker: Union[values.Ticker, str]) -> Optional[values.Tick]:
+        return self._ticks.get(self.client._get_ticker_code(ticker))
+
+    def interval(self, ticker: Union[values.Ticker, str]) -> float:
+        """
+        Current poll interval of `ticker` in seconds.
+        """
+        return self._intervals[self.client._get_ticker_code(ticker)]
+
+    def _parse(self, json: Mapping[str, Any]) -> Tuple[bool, values.Tick]:
+        ticker = json['market']
+        key = (json['timestamp'], json['trade_price'])
+        if self._keys.get(ticker) == key:
+            return False, self._ticks[ticker]
+        self._keys[ticker] = key
+        tick = self._ticks[ticker] = values.Tick.from_json(json)
+        return True, tick
+
+    async def poll(self, session: Any = None) -> List[values.Tick]:
+        """
+        Polls the markets that are due and returns the ticks that changed.
+        `session` is one of `client._get_class_level_session()`, or a new one is used.
+        """
+        now = time.monotonic()
+        due = [ticker for ticker in self.tickers if self._due[ticker] <= now]
+        if not due:
+            return []
+
+        limiter = self.client._get_rate_limiter(endpoints.TICKER.group)
+        results = await asyncio.gather(
+            *(
+                self.client._fetch(endpoints.TICKER, query, self._parse, session, limiter)
+                for query in self.client._chunk_markets(due)
+            )
+        )
+
+        changed = []
+        unchanged = set(due)
+        for result in results:
+            for is_changed, tick in result:
+                if is_changed:
+                    unchanged.discard(tick.ticker)
+                    self._intervals[tick.ticker] = self.min_interval
+                    self._due[tick.ticker] = now + self.min_interval
+                    changed.append(tick)
+        # including markets missing from the response (e.g. delisted or suspended)
+        for ticker in unchanged:
+            interval = self._intervals[ticker] = min(self._intervals[ticker] * self.backoff, self.max_interval)
+            self._due[ticker] = now + interval
+
+        if self.on_change is not None:
+            for tick in changed:
+                self.on_change(tick)
+        return changed
+
+    async def run(self) -> None:
+        """
+        Polls over one session until cancelled.
+        """
+        async with self.client._get_class_level_session() as session:
+            while True:
+                await asyncio.gather(self.poll(session), asyncio.sleep(self.min_interval))
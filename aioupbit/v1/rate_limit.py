@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import asyncio
+import collections
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Deque, Mapping, Optional
+
+from typing_extensions import Final
+
+from aioupbit.v1 import constants, values
+
+__all__ = ('REQUESTS_PER_SECOND', 'RateLimiter')
+
+# https://docs.upbit.com/docs/user-request-guide
+REQUESTS_PER_SECOND: Final[Mapping[constants.RateLimitGroup, int]] = {
+    constants.RateLimitGroup.MARKET: 10,
+    constants.RateLimitGroup.CANDLES: 10,
+    constants.RateLimitGroup.TRADES: 10,
+    constants.RateLimitGroup.TICKER: 10,
+    constants.RateLimitGroup.ORDERBOOK: 10,
+    constants.RateLimitGroup.DEFAULT: 30,
+    constants.RateLimitGroup.ORDER: 8,
+}
+
+
+class RateLimiter:
+    """
+    Client side limiter of a rate limit group.
+
+    At most `concurrency` requests are in flight and at most `per_second` requests start in any one second window.
+    `update()` with the `Remaining-Req` header of a response holds further requests
+    until the next second once the server reports that the budget is exhausted.
+
+    Asyncio primitives are created on first use in each event loop, so a limiter can be kept at class level.
+    """
+
+    __slots__ = ('per_second', 'concurrency', '_loop', '_semaphore', '_starts', '_blocked_until')
+
+    _WINDOW: Final[float] = 1
+
+    def __init__(self, per_second: int, concurrency: Optional[int] = None) -> None:
+        self.per_second = per_second
+        self.concurrency = per_second if concurrency is None else concurrency
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._starts: Deque[float] = collections.deque(maxlen=per_second)
+        self._blocked_until = 0.0
+
+    @classmethod
+    def for_group(cls, group: constants.RateLimitGroup, concurrency: Optional[int] = None) -> RateLimiter:
+        return cls(REQUESTS_PER_SECOND[group], concurrency)
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._loop is not loop:
+            self._loop = loop
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+        return self._semaphore
+
+    async def _wait_for_budget(self) -> None:
+        while True:
+            now = time.monotonic()
+            delay = self._blocked_until - now
+            if len(self._starts) == self.per_second:
+                delay = max(delay, self._starts[0] + self._WINDOW - now)
+            if delay <= 0:
+                self._starts.append(now)
+                return
+            await asyncio.sleep(delay)
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[None]:
+        async with self._get_semaphore():
+            await self._wait_for_budget()
+            yield
+
+    def update(self, remaining: values.RemainingReq) -> None:
+        if remaining.sec <= 0:
+            self._blocked_until = max(self._blocked_until, time.monotonic() + self._WINDOW)
+
+    def available(self) -> int:
+        """
+        Number of requests that could start now without waiting, ignoring `concurrency`.
+        """
+        now = time.monotonic()
+        if self._blocked_until > now:
+            return 0
+        return self.per_second - sum(1 for start in self._starts if start > now - self._WINDOW)
@@ -0,0 +1,231 @@
+from __future__ import annotations
+
+import asyncio
+import collections
+import dataclasses
+import math
+import struct
+import time
+import zlib
+from pathlib import Path
+from typing import Deque, Dict, Iterable, Iterator, Mapping, Optional, Type, TypeVar, Union
+
+from typing_extensions import Final
+
+from aioupbit.v1.transport import Response, Transport, TransportRestClient
+
+__all__ = (
+    'Record',
+    'RecordFile',
+    'FileRecordingTransport',
+    'TimedReplayTransport',
+    'ReplayFinished',
+    'ReplayClient',
+)
+
+_C = TypeVar('_C', bound='ReplayClient')
+
+_MAGIC: Final[bytes] = b'UPBITREC\x01'
+# time, status, flags, encoding length, url length, content length
+_HEADER: Final[struct.Struct] = struct.Struct('<dHBBHI')
+_COMPRESSED: Final[int] = 1
+
+
+@dataclasses.dataclass(frozen=True)
+class Record:
+    """
+    Response to a GET of `url` (relative and encoded like `endpoints.Endpoint.url()`),
+    received at `time` in epoch seconds.
+    """
+
+    __slots__ = ('time', 'url', 'response')
+
+    time: float
+    url: str
+    response: Response
+
+
+class RecordFile:
+    """
+    Append-only file of records. Each record is a fixed binary header followed by the encoding, the url
+    and the response body, which is compressed with zlib when that makes it smaller. (JSON bodies shrink
+    several times)
+    """
+
+    __slots__ = ('path', 'compress', '_file')
+
+    def __init__(self, path: Union[str, Path], compress: bool = True) -> None:
+        self.path = Path(path)
+        self.compress = compress
+        self._file = self.path.open('ab')
+        if self._file.tell() == 0:
+            self._file.write(_MAGIC)
+            self._file.flush()
+
+    def append(self, records: Iterable[Record]) -> None:
+        chunks = []
+        for record in records:
+            response = record.response
+            content, flags = response.content, 0
+            if self.compress:
+                compressed = zlib.compress(content, 1)
+                if len(compressed) < len(content):
+                    content, flags = compressed, _COMPRESSED
+            encoding, url = response.encoding.encode('ascii'), record.url.encode()
+            chunks.append(_HEADER.pack(record.time, response.status, flags, len(encoding), len(url), len(content)))
+            chunks.extend((encoding, url, content))
+        self._file.write(b''.join(chunks))
+        self._file.flush()
+
+    def __iter__(self) -> Iterator[Record]:
+        return self.read(self.path)
+
+    @staticmethod
+    def read(path: Union[str, Path]) -> Iterator[Record]:
+        """
+        Records of the file at `path`, without opening it for appending.
+        """
+        data = Path(path).read_bytes()
+        if not data.startswith(_MAGIC):
+            raise ValueError(f'{path} is not a record file')
+        offset, size = len(_MAGIC), len(data)
+        while offset + _HEADER.size <= size:
+            timestamp, status, flags, encoding_length, url_length, content_length = _HEADER.unpack_from(data, offset)
+            offset += _HEADER.size
+            encoding = data[offset : offset + encoding_length].decode('ascii')
+            offset += encoding_length
+            url = data[offset : offset + url_length].decode()
+            offset += url_length
+            content = data[offset : offset + content_length]
+            offset += content_length
+            if len(content) < content_length:
+                # a record cut off by a crash while appending
+                return
+            if flags & _COMPRESSED:
+                content = zlib.decompress(content)
+            yield Record(timestamp, url, Response(status, {}, content, encoding))
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class FileRecordingTransport(Transport):
+    """
+    Passes requests through to `transport` and appends every GET response to `file` with its arrival time.
+
+    ::
+
+        recorder = FileRecordingTransport(AioHTTPTransport(), RecordFile('market.rec'))
+        client = TransportRestClient.using(recorder)
+    """
+
+    __slots__ = ('transport', 'file')
+
+    def __init__(self, transport: Transport, file: RecordFile) -> None:
+        self.transport = transport
+        self.file = file
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> Response:
+        response = await self.transport.request(method, url, headers)
+        if method.upper() == 'GET':
+            self.file.append((Record(time.time(), url, response),))
+        return response
+
+    async def close(self) -> None:
+        await self.transport.close()
+        self.file.close()
+
+
+class ReplayFinished(Exception):
+    """
+    Every recorded response to the request has been served.
+    """
+
+    def __init__(self, url: str) -> None:
+        super().__init__(url)
+        self.url = url
+
+
+class TimedReplayTransport(Transport):
+    """
+    Serves each recorded response once, in the order recorded per url, paced by the recorded times.
+
+    With `speed` 1 a response is not served before its recorded offset from the first record has passed
+    since the first request, with 10 after a tenth of it, and with `math.inf` immediately, so a replay is
+    deterministic at any speed. `now` is the recorded time of the latest response served.
+    A url that was never recorded gets a 404 response, and one whose responses are used up raises `ReplayFinished`.
+    """
+
+    __slots__ = ('speed', 'now', '_origin', '_started', '_responses')
+
+    def __init__(self, records: Iterable[Record], speed: float = 1) -> None:
+        if speed <= 0:
+            raise ValueError('speed must be positive')
+        self.speed = speed
+        self._responses: Dict[str, Deque[Record]] = dict()
+        origin = math.inf
+        for record in records:
+            self._responses.setdefault(record.url, collections.deque()).append(record)
+            origin = min(origin, record.time)
+        self._origin = origin
+        self.now = origin
+        self._started: Optional[float] = None
+
+    def remaining(self, url: Optional[str] = None) -> int:
+        if url is not None:
+            return len(self._responses.get(url, ()))
+        return sum(map(len, self._responses.values()))
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> Response:
+        responses = self._responses.get(url)
+        if responses is None or method.upper() != 'GET':
+            return Response(404, {}, b'{"error":{"name":"not_recorded"}}', 'utf-8')
+        if not responses:
+            raise ReplayFinished(url)
+        record = responses.popleft()
+
+        if self.speed != math.inf:
+            loop = asyncio.get_running_loop()
+            if self._started is None:
+                self._started = loop.time()
+            delay = (record.time - self._origin) / self.speed - (loop.time() - self._started)
+            if delay > 0:
+                await asyncio.sleep(delay)
+        if record.time > self.now:
+            self.now = record.time
+        return record.response
+
+
+class ReplayClient(TransportRestClient):
+    """
+    `Client` whose quotation API serves recorded responses through the usual parsing, for backtests and
+    network-free throughput tests of a strategy. Exchange API reads are served likewise if they were recorded,
+    and other requests get a 404 `ResponseError` like any unrecorded url.
+    Bind a `TimedReplayTransport` with `using()` to read its `now`.
+
+    ::
+
+        client = ReplayClient.from_file('market.rec', speed=math.inf)
+        while True:
+            ticks = await client.latest_tick(codes)  # until ReplayFinished
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def from_records(cls: Type[_C], records: Iterable[Record], speed: float = 1) -> Type[_C]:
+        return cls.using(TimedReplayTransport(records, speed))
+
+    @classmethod
+    def from_file(cls: Type[_C], path: Union[str, Path], speed: float = 1) -> Type[_C]:
+        return cls.from_records(RecordFile.read(path), speed)
@@ -0,0 +1,306 @@
+from __future__ import annotations
+
+import dataclasses
+import datetime
+import decimal
+import enum
+import struct
+import sys
+import typing
+import uuid
+from collections.abc import Sequence as _SequenceABC
+from collections.abc import Set as _SetABC
+from decimal import Decimal
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Tuple, Type, TypeVar, Union
+
+import rapidjson
+from typing_extensions import Final, get_args, get_origin
+
+__all__ = ('to_bytes', 'from_bytes', 'encode_many', 'decode_many', 'dumps', 'loads')
+
+_T = TypeVar('_T')
+
+_Encoder = Callable[[bytearray, Any], None]
+_Decoder = Callable[[memoryview, int], Tuple[Any, int]]
+
+_BOOL: Final[struct.Struct] = struct.Struct('<?')
+_INT: Final[struct.Struct] = struct.Struct('<q')
+_LENGTH: Final[struct.Struct] = struct.Struct('<H')
+_COUNT: Final[struct.Struct] = struct.Struct('<I')
+_DECIMAL: Final[struct.Struct] = struct.Struct('<bB')  # exponent, coefficient length
+_DATETIME: Final[struct.Struct] = struct.Struct('<qh')  # microseconds from the epoch, utc offset in minutes
+_DATE: Final[struct.Struct] = struct.Struct('<i')
+
+_NAIVE: Final[int] = -(2**15)
+_EPOCH: Final[datetime.datetime] = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+_MICROSECOND: Final[datetime.timedelta] = datetime.timedelta(microseconds=1)
+_EXACT: Final[decimal.Context] = decimal.Context(prec=decimal.MAX_PREC)
+
+_timezones: Dict[int, datetime.timezone] = {0: datetime.timezone.utc}
+
+
+def _struct_codec(layout: struct.Struct) -> Tuple[_Encoder, _Decoder]:
+    pack, unpack_from, size = layout.pack, layout.unpack_from, layout.size
+
+    def encode(buffer: bytearray, value: Any) -> None:
+        buffer += pack(value)
+
+    def decode(data: memoryview, offset: int) -> Tuple[Any, int]:
+        return unpack_from(data, offset)[0], offset + size
+
+    return encode, decode
+
+
+def _encode_str(buffer: bytearray, value: str) -> None:
+    encoded = value.encode()
+    buffer += _LENGTH.pack(len(encoded))
+    buffer += encoded
+
+
+def _decode_str(data: memoryview, offset: int) -> Tuple[str, int]:
+    (length,) = _LENGTH.unpack_from(data, offset)
+    offset += _LENGTH.size
+    return str(data[offset : offset + length], 'utf-8'), offset + length
+
+
+def _encode_decimal(buffer: bytearray, value: Union[Decimal, int]) -> None:
+    # integral numbers are decoded from JSON as int
+    if isinstance(value, int):
+        coefficient, exponent = value, 0
+    else:
+        # splitting the plain notation is much faster than `as_tuple()`
+        text = str(value)
+        if 'E' in text or not value.is_finite():
+            exponent = value.as_tuple().exponent
+            if not isinstance(exponent, int):
+                raise ValueError(f'{value} is not finite')
+            coefficient = int(value.scaleb(-exponent, _EXACT))
+        else:
+            point = text.find('.')
+            if point < 0:
+                coefficient, exponent = int(text), 0
+            else:
+                coefficient, exponent = int(text[:point] + text[point + 1 :]), point + 1 - len(text)
+    encoded = coefficient.to_bytes(coefficient.bit_length() // 8 + 1, 'little', signed=True)
+    buffer += _DECIMAL.pack(exponent, len(encoded))
+    buffer += encoded
+
+
+def _decode_decimal(data: memoryview, offset: int) -> Tuple[Decimal, int]:
+    exponent, length = _DECIMAL.unpack_from(data, offset)
+    offset += _DECIMAL.size
+    coefficient = int.from_bytes(data[offset : offset + length], 'little', signed=True)
+    return Decimal(coefficient).scaleb(exponent, _EXACT), offset + length
+
+
+def _encode_datetime(buffer: bytearray, value: datetime.datetime) -> None:
+    offset = value.utcoffset()
+    if offset is None:
+        buffer += _DATETIME.pack((value.replace(tzinfo=datetime.timezone.utc) - _EPOCH) // _MICROSECOND, _NAIVE)
+    else:
+        buffer += _DATETIME.pack((value - _EPOCH) // _MICROSECOND, offset // datetime.timedelta(minutes=1))
+
+
+def _decode_datetime(data: memoryview, offset: int) -> Tuple[datetime.datetime, int]:
+    microseconds, minutes = _DATETIME.unpack_from(data, offset)
+    value = _EPOCH + datetime.timedelta(microseconds=microseconds)
+    if minutes == _NAIVE:
+        value = value.replace(tzinfo=None)
+    else:
+        tz = _timezones.get(minutes)
+        if tz is None:
+            tz = _timezones[minutes] = datetime.timezone(datetime.timedelta(minutes=minutes))
+        value = value.astimezone(tz)
+    return value, offset + _DATETIME.size
+
+
+def _encode_date(buffer: bytearray, value: datetime.date) -> None:
+    buffer += _DATE.pack(value.toordinal())
+
+
+def _decode_date(data: memoryview, offset: int) -> Tuple[datetime.date, int]:
+    return datetime.date.fromordinal(_DATE.unpack_from(data, offset)[0]), offset + _DATE.size
+
+
+def _encode_uuid(buffer: bytearray, value: uuid.UUID) -> None:
+    buffer += value.bytes
+
+
+def _decode_uuid(data: memoryview, offset: int) -> Tuple[uuid.UUID, int]:
+    return uuid.UUID(bytes=bytes(data[offset : offset + 16])), offset + 16
+
+
+_PRIMITIVES: Final[Mapping[Any, Tuple[_Encoder, _Decoder]]] = {
+    bool: _struct_codec(_BOOL),
+    int: _struct_codec(_INT),
+    str: (_encode_str, _decode_str),
+    Decimal: (_encode_decimal, _decode_decimal),
+    datetime.datetime: (_encode_datetime, _decode_datetime),
+    datetime.date: (_encode_date, _decode_date),
+    uuid.UUID: (_encode_uuid, _decode_uuid),
+}
+
+
+def _enum_codec(tp: Type[enum.Enum]) -> Tuple[_Encoder, _Decoder]:
+    encode_value, decode_value = _PRIMITIVES[int if issubclass(tp, int) else str]
+
+    def encode(buffer: bytearray, value: enum.Enum) -> None:
+        encode_value(buffer, value.value)
+
+    members = {member.value: member for member in tp}
+
+    def decode(data: memoryview, offset: int) -> Tuple[enum.Enum, int]:
+        value, offset = decode_value(data, offset)
+        member = members.get(value)
+        return tp(value) if member is None else member, offset
+
+    return encode, decode
+
+
+def _optional_codec(tp: Any) -> Tuple[_Encoder, _Decoder]:
+    encode_value, decode_value = _codec(tp)
+
+    def encode(buffer: bytearray, value: Any) -> None:
+        if value is None:
+            buffer += b'\0'
+        else:
+            buffer += b'\1'
+            encode_value(buffer, value)
+
+    def decode(data: memoryview, offset: int) -> Tuple[Any, int]:
+        if not data[offset]:
+            return None, offset + 1
+        return decode_value(data, offset + 1)
+
+    return encode, decode
+
+
+def _collection_codec(tp: Any, factory: Callable[[Iterable[Any]], Any]) -> Tuple[_Encoder, _Decoder]:
+    encode_item, decode_item = _codec(tp)
+
+    def encode(buffer: bytearray, value: Any) -> None:
+        buffer += _COUNT.pack(len(value))
+        for item in value:
+            encode_item(buffer, item)
+
+    def decode(data: memoryview, offset: int) -> Tuple[Any, int]:
+        (count,) = _COUNT.unpack_from(data, offset)
+        offset += _COUNT.size
+        items = []
+        for _ in range(count):
+            item, offset = decode_item(data, offset)
+            items.append(item)
+        return factory(items), offset
+
+    return encode, decode
+
+
+def _dataclass_codec(cls: Type[Any]) -> Tuple[_Encoder, _Decoder]:
+    hints = typing.get_type_hints(cls, vars(sys.modules[cls.__module__]), dict(vars(cls)))
+    names = tuple(field.name for field in dataclasses.fields(cls))
+    codecs = tuple(_codec(hints[name]) for name in names)
+    encoders = tuple(zip(names, (encode for encode, _ in codecs)))
+    decoders = tuple(zip(names, (decode for _, decode in codecs)))
+
+    def encode(buffer: bytearray, value: Any) -> None:
+        for name, encode_field in encoders:
+            encode_field(buffer, getattr(value, name))
+
+    def decode(data: memoryview, offset: int) -> Tuple[Any, int]:
+        fields = dict()
+        for name, decode_field in decoders:
+            fields[name], offset = decode_field(data, offset)
+        return cls(**fields), offset
+
+    return encode, decode
+
+
+_codecs: Dict[Any, Tuple[_Encoder, _Decoder]] = dict()
+
+
+def _codec(tp: Any) -> Tuple[_Encoder, _Decoder]:
+    codec = _codecs.get(tp)
+    if codec is not None:
+        return codec
+
+    origin, args = get_origin(tp), get_args(tp)
+    if tp in _PRIMITIVES:
+        codec = _PRIMITIVES[tp]
+    elif isinstance(tp, type) and issubclass(tp, enum.Enum):
+        codec = _enum_codec(tp)
+    elif origin is Union and len(args) == 2 and type(None) in args:
+        codec = _optional_codec(args[0] if args[1] is type(None) else args[1])
+    elif origin is not None and issubclass(origin, _SetABC):
+        codec = _collection_codec(args[0], frozenset)
+    elif origin is not None and issubclass(origin, _SequenceABC):
+        codec = _collection_codec(args[0], tuple)
+    elif isinstance(tp, type) and dataclasses.is_dataclass(tp):
+        codec = _dataclass_codec(tp)
+    else:
+        raise TypeError(f'unsupported type: {tp}')
+    _codecs[tp] = codec
+    return codec
+
+
+def to_bytes(value: Any) -> bytes:
+    """
+    Encodes a value object into a compact binary format derived from its dataclass fields.
+
+    Decimals are exact fixed-point integers with an exponent, datetimes are microseconds from the epoch
+    with their utc offset, and enums are their values. The format carries no schema,
+    so both sides must use the same version of the value type.
+    """
+    buffer = bytearray()
+    _codec(type(value))[0](buffer, value)
+    return bytes(buffer)
+
+
+def from_bytes(cls: Type[_T], data: Union[bytes, bytearray, memoryview]) -> _T:
+    value, offset = _codec(cls)[1](memoryview(data), 0)
+    if offset != len(data):
+        raise ValueError(f'{len(data) - offset} trailing bytes')
+    return typing.cast(_T, value)
+
+
+def encode_many(values: Iterable[Any]) -> bytes:
+    """
+    Encodes value objects of the same type into one buffer, prefixed by their count.
+    """
+    values = tuple(values)
+    buffer = bytearray(_COUNT.pack(len(values)))
+    if values:
+        encode = _codec(type(values[0]))[0]
+        for value in values:
+            encode(buffer, value)
+    return bytes(buffer)
+
+
+def decode_many(cls: Type[_T], data: Union[bytes, bytearray, memoryview]) -> List[_T]:
+    value, offset = _collection_codec(cls, list)[1](memoryview(data), 0)
+    if offset != len(data):
+        raise ValueError(f'{len(data) - offset} trailing bytes')
+    return typing.cast(List[_T], value)
+
+
+def dumps(values: Iterable[Any]) -> str:
+    """
+    Encodes value objects into a JSON array of their `to_json()`, which `loads()` decodes back.
+    Decimals are written as numbers without loss of precision.
+    """
+    return rapidjson.dumps(
+        [value.to_json() for value in values],
+        number_mode=rapidjson.NM_DECIMAL,
+        datetime_mode=rapidjson.DM_ISO8601,
+        uuid_mode=rapidjson.UM_CANONICAL,
+    )
+
+
+def loads(cls: Type[_T], text: Union[str, bytes]) -> List[_T]:
+    return [
+        cls.from_json(json)  # type: ignore[attr-defined]
+        for json in rapidjson.loads(
+            text,
+            number_mode=rapidjson.NM_NAN | rapidjson.NM_DECIMAL,
+            datetime_mode=rapidjson.DM_ISO8601 | rapidjson.DM_NAIVE_IS_UTC,
+        )
+    ]
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import uuid
+from collections.abc import Iterable
+from typing import Any, Awaitable, Callable, Dict, Optional, Sequence, Tuple, Type, TypeVar, Union, overload
+
+from aioupbit.v1 import constants, endpoints, rate_limit, values
+from aioupbit.v1.client import Client
+
+__all__ = ('ShardedClient',)
+
+_T = TypeVar('_T')
+_C = TypeVar('_C', bound=Client)
+
+
+class _Shard:
+    __slots__ = ('client',)
+
+    def __init__(self, client: Client) -> None:
+        self.client = client
+
+    def limiter(self, group: constants.RateLimitGroup) -> rate_limit.RateLimiter:
+        return self.client.exchange_rate_limiter(group)
+
+    async def call(self, group: constants.RateLimitGroup, factory: Callable[[Client], Awaitable[_T]]) -> _T:
+        async with self.limiter(group).acquire():
+            return await factory(self.client)
+
+
+class ShardedClient:
+    """
+    Spreads exchange API calls over several access keys of one account, since the exchange rate limits apply
+    per access key.
+
+    The budget of each key is tracked by `Client.exchange_rate_limiter()`, which counts the calls made here and
+    is updated from the `Remaining-Req` header of responses. Key-agnostic queries (`accounts`, `market_with_account`,
+    and `get_order`, `orders` of orders without a registered owner) go to the client with the most remaining budget.
+    Queries of orders registered with `set_owner()` and order mutations go through the client that owns the order,
+    and mutations of other orders through the first client.
+    The first client is kept for mutations only if `reserve_first` is true and there are other clients,
+    so that reconciliation and monitoring queries never compete with order placement.
+    """
+
+    __slots__ = ('reserve_first', '_shards', '_owners')
+
+    def __init__(self, clients: Sequence[Client], reserve_first: bool = True) -> None:
+        if not clients:
+            raise ValueError('at least one client is required')
+        self.reserve_first = reserve_first
+        self._shards: Tuple[_Shard, ...] = tuple(map(_Shard, clients))
+        self._owners: Dict[str, _Shard] = dict()
+
+    @classmethod
+    def from_credentials(
+        cls,
+        client: Type[_C],
+        credentials: Iterable[Tuple[str, str]],
+        reserve_first: bool = True,
+        **kwargs: Any,
+    ) -> ShardedClient:
+        """
+        `credentials` are pairs of `(access_key, secret_key)`, and `kwargs` are passed to each `client(...)`.
+        """
+        return cls([client(access_key, secret_key, **kwargs) for access_key, secret_key in credentials], reserve_first)
+
+    @property
+    def clients(self) -> Tuple[Client, ...]:
+        return tuple(shard.client for shard in self._shards)
+
+    def set_owner(
+        self, client: Client, *, order_uuid: Union[uuid.UUID, str, None] = None, order_id: Optional[str] = None
+    ) -> None:
+        """
+        Registers `client` as the owner of the order, which is usually the client that placed it.
+        """
+        for shard in self._shards:
+            if shard.client is client:
+                break
+        else:
+            raise ValueError('client is not in this sharded client')
+        for key in (order_uuid, order_id):
+            if key is not None:
+                self._owners[str(key)] = shard
+
+    def _query_shard(self, group: constants.RateLimitGroup) -> _Shard:
+        shards = self._shards[1:] if self.reserve_first and len(self._shards) > 1 else self._shards
+        return max(shards, key=lambda shard: shard.limiter(group).available())
+
+    def _registered_owner(self, keys: Iterable[Union[uuid.UUID, str, None]]) -> Optional[_Shard]:
+        """
+        The owner of the orders of `keys` if every one of them is registered to the same client.
+        """
+        owners = {self._owners.get(str(key)) for key in keys if key is not None}
+        return owners.pop() if len(owners) == 1 else None
+
+    def _owner_shard(self, order_uuid: Union[uuid.UUID, str, None], order_id: Optional[str]) -> _Shard:
+        return self._registered_owner((order_uuid, order_id)) or self._shards[0]
+
+    async def accounts(self) -> Sequence[values.Account]:
+        group = endpoints.ACCOUNTS.group
+        return await self._query_shard(group).call(group, lambda client: client.accounts())
+
+    async def market_with_account(self, ticker: Union[values.Ticker, str]) -> values.MarketWithAccount:
+        group = endpoints.ORDERS_CHANCE.group
+        return await self._query_shard(group).call(group, lambda client: client.market_with_account(ticker))
+
+    @overload
+    async def get_order(self, *, order_uuid: Union[uuid.UUID, str]) -> values.OrderWithTrades | None:
+        pass
+
+    @overload
+    async def get_order(self, *, order_id: str) -> values.OrderWithTrades | None:
+        pass
+
+    async def get_order(self, **kwargs: Union[uuid.UUID, str]) -> values.OrderWithTrades | None:
+        group = endpoints.ORDER.group
+        shard = self._registered_owner((kwargs.get('order_uuid'), kwargs.get('order_id')))
+        if shard is None:
+            shard = self._query_shard(group)
+        return await shard.call(group, lambda client: client.get_order(**kwargs))
+
+    async def orders(self, **kwargs: Any) -> Sequence[values.Order]:
+        """
+        Takes the same arguments as `Client.orders()`.
+        """
+        for name in ('uuids', 'identifiers'):
+            if name in kwargs:
+                kwargs[name] = tuple(kwargs[name])
+        group = endpoints.ORDERS.group
+        shard = self._registered_owner((*kwargs.get('uuids', ()), *kwargs.get('identifiers', ())))
+        if shard is None:
+            shard = self._query_shard(group)
+        return await shard.call(group, lambda client: client.orders(**kwargs))
+
+    @overload
+    async def cancel_order(self, *, order_uuid: Union[uuid.UUID, str]) -> None:
+        pass
+
+    @overload
+    async def cancel_order(self, *, order_id: str) -> None:
+        pass
+
+    async def cancel_order(self, **kwargs: Union[uuid.UUID, str]) -> None:
+        order_id = kwargs.get('order_id')
+        shard = self._owner_shard(kwargs.get('order_uuid'), None if order_id is None else str(order_id))
+        await shard.call(endpoints.CANCEL_ORDER.group, lambda client: client.cancel_order(**kwargs))
@@ -0,0 +1,318 @@
+from __future__ import annotations
+
+import asyncio
+import datetime
+import struct
+import time
+from decimal import Decimal
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Type, Union
+
+from typing_extensions import Final
+
+try:
+    from multiprocessing.shared_memory import SharedMemory
+except ImportError:  # python 3.7
+    SharedMemory = None  # type: ignore[assignment,misc]
+
+from aioupbit.v1 import constants, values
+from aioupbit.v1.client import Client
+
+__all__ = ('SharedMarketTable', 'SharedMemoryPublisher')
+
+_MAGIC: Final[bytes] = b'UPBT'
+_HEADER: Final[struct.Struct] = struct.Struct('<4sHHII')  # magic, version, depth, slot count, ticker size
+_VERSION: Final[int] = 1
+_TICKER_SIZE: Final[int] = 16
+_SEQUENCE: Final[struct.Struct] = struct.Struct('<Q')
+# a slot still being written after this many reads is left half-written by a writer that died
+_MAX_READ_RETRIES: Final[int] = 10000
+
+# fixed-point decimal: 128 bit signed coefficient and 8 bit exponent
+_DECIMAL_FORMAT: Final[str] = '16sb'
+_DECIMAL_SIZE: Final[int] = struct.calcsize('<' + _DECIMAL_FORMAT)
+
+_TICK_DECIMAL_FIELDS: Final[Tuple[str, ...]] = (
+    'opening_price',
+    'high_price',
+    'low_price',
+    'trade_price',
+    'prev_closing_price',
+    'change_price',
+    'change_rate',
+    'signed_change_price',
+    'signed_change_rate',
+    'trade_volume',
+    'acc_trade_price',
+    'acc_trade_price_24h',
+    'acc_trade_volume',
+    'acc_trade_volume_24h',
+    'highest_52_week_price',
+    'lowest_52_week_price',
+)
+# trade_date_time (ms), timestamp (ms), change, highest_52_week_date, lowest_52_week_date and decimals
+_TICK: Final[struct.Struct] = struct.Struct('<qqBii' + _DECIMAL_FORMAT * len(_TICK_DECIMAL_FIELDS))
+_CHANGES: Final[Tuple[constants.Change, ...]] = tuple(constants.Change)
+
+
+def _orderbook_struct(depth: int) -> struct.Struct:
+    # timestamp (ms), unit count, total_ask_size, total_bid_size and `depth` units
+    return struct.Struct('<qB' + _DECIMAL_FORMAT * (2 + 4 * depth))
+
+
+def _pack_decimal(value: Union[Decimal, int]) -> Tuple[bytes, int]:
+    # integral numbers are decoded from JSON as int
+    if isinstance(value, int):
+        return value.to_bytes(16, 'little', signed=True), 0
+    sign, digits, exponent = value.as_tuple()
+    if not isinstance(exponent, int):
+        raise ValueError(f'{value} is not finite')
+    coefficient = int(''.join(map(str, digits)))
+    return (-coefficient if sign else coefficient).to_bytes(16, 'little', signed=True), exponent
+
+
+def _unpack_decimal(coefficient: bytes, exponent: int) -> Decimal:
+    return Decimal(f'{int.from_bytes(coefficient, "little", signed=True)}E{exponent}')
+
+
+def _from_ms(value: int, tz: datetime.tzinfo) -> datetime.datetime:
+    return datetime.datetime.fromtimestamp(value / 1000, tz)
+
+
+class SharedMarketTable:
+    """
+    Latest `values.Tick` and `values.Orderbook` of a fixed set of markets in `multiprocessing.shared_memory`.
+
+    Each slot is guarded by a seqlock: the single writer makes the sequence odd while it writes,
+    and readers retry until they copy a slot with the same even sequence before and after.
+    A slot that stays odd, because the writer died while writing it, makes reads raise `RuntimeError`.
+    Readers never block the writer and take no locks.
+
+    The writer creates the table with `create()` and readers in other processes `attach()` by its `name`.
+    Decimals are stored as exact fixed-point numbers. Only the first `depth` units of an orderbook are kept.
+    """
+
+    __slots__ = ('tickers', 'depth', '_memory', '_buffer', '_owner', '_indices', '_orderbook', '_tick_base', '_ob_base')
+
+    def __init__(self, memory: SharedMemory, owner: bool) -> None:
+        assert memory.buf is not None
+        self._memory = memory
+        self._buffer: memoryview = memory.buf
+        self._owner = owner
+
+        magic, version, depth, count, ticker_size = _HEADER.unpack_from(self._buffer, 0)
+        if magic != _MAGIC or version != _VERSION or ticker_size != _TICKER_SIZE:
+            raise ValueError(f'{memory.name} is not a market table')
+
+        offset = _HEADER.size
+        tickers = []
+        for _ in range(count):
+            tickers.append(bytes(self._buffer[offset : offset + _TICKER_SIZE]).rstrip(b'\0').decode())
+            offset += _TICKER_SIZE
+        self.tickers: Tuple[str, ...] = tuple(tickers)
+        self.depth: int = depth
+        self._indices: Dict[str, int] = {ticker: i for i, ticker in enumerate(tickers)}
+        self._orderbook = _orderbook_struct(depth)
+        self._tick_base: int = offset
+        self._ob_base: int = offset + count * (_SEQUENCE.size + _TICK.size)
+
+    def __contains__(self, ticker: object) -> bool:
+        return ticker in self._indices
+
+    @classmethod
+    def _size(cls, count: int, depth: int) -> int:
+        return (
+            _HEADER.size
+            + count * _TICKER_SIZE
+            + count * (_SEQUENCE.size + _TICK.size)
+            + count * (_SEQUENCE.size + _orderbook_struct(depth).size)
+        )
+
+    @classmethod
+    def create(
+        cls,
+        tickers: Union[Iterable[values.Ticker], Iterable[str]],
+        name: Optional[str] = None,
+        depth: int = 15,
+    ) -> SharedMarketTable:
+        if SharedMemory is None:
+            raise RuntimeError('multiprocessing.shared_memory requires python 3.8 or later')
+        codes = [ticker.ticker if isinstance(ticker, values.Ticker) else ticker for ticker in tickers]
+        memory = SharedMemory(name, create=True, size=cls._size(len(codes), depth))
+        assert memory.buf is not None
+        _HEADER.pack_into(memory.buf, 0, _MAGIC, _VERSION, depth, len(codes), _TICKER_SIZE)
+        offset = _HEADER.size
+        for code in codes:
+            encoded = code.encode()
+            if len(encoded) > _TICKER_SIZE:
+                memory.close()
+                memory.unlink()
+                raise ValueError(f'ticker is too long: {code}')
+            memory.buf[offset : offset + len(encoded)] = encoded
+            offset += _TICKER_SIZE
+        return cls(memory, owner=True)
+
+    @classmethod
+    def attach(cls, name: str) -> SharedMarketTable:
+        if SharedMemory is None:
+            raise RuntimeError('multiprocessing.shared_memory requires python 3.8 or later')
+        return cls(SharedMemory(name), owner=False)
+
+    @property
+    def name(self) -> str:
+        return self._memory.name
+
+    def _tick_offset(self, ticker: str) -> int:
+        return self._tick_base + self._indices[ticker] * (_SEQUENCE.size + _TICK.size)
+
+    def _orderbook_offset(self, ticker: str) -> int:
+        return self._ob_base + self._indices[ticker] * (_SEQUENCE.size + self._orderbook.size)
+
+    def _write(self, offset: int, layout: struct.Struct, fields: Sequence[Any]) -> None:
+        # packed beforehand so that an invalid field never leaves the slot odd
+        data = layout.pack(*fields)
+        buffer = self._buffer
+        (sequence,) = _SEQUENCE.unpack_from(buffer, offset)
+        _SEQUENCE.pack_into(buffer, offset, sequence + 1)
+        buffer[offset + _SEQUENCE.size : offset + _SEQUENCE.size + layout.size] = data
+        _SEQUENCE.pack_into(buffer, offset, sequence + 2)
+
+    def _read(self, offset: int, layout: struct.Struct) -> Optional[Tuple[Any, ...]]:
+        buffer = self._buffer
+        for _ in range(_MAX_READ_RETRIES):
+            (before,) = _SEQUENCE.unpack_from(buffer, offset)
+            if before == 0:
+                return None
+            if before & 1:
+                # let the writer finish
+                time.sleep(0)
+                continue
+            fields = layout.unpack_from(buffer, offset + _SEQUENCE.size)
+            (after,) = _SEQUENCE.unpack_from(buffer, offset)
+            if before == after:
+                return fields
+        raise RuntimeError('market table slot is not updated; the writer may have died while writing it')
+
+    def write_tick(self, tick: values.Tick) -> None:
+        fields: List[Any] = [
+            values._to_ms(tick.trade_date_time),
+            values._to_ms(tick.timestamp),
+            _CHANGES.index(tick.change),
+            tick.highest_52_week_date.toordinal(),
+            tick.lowest_52_week_date.toordinal(),
+        ]
+        for name in _TICK_DECIMAL_FIELDS:
+            fields.extend(_pack_decimal(getattr(tick, name)))
+        self._write(self._tick_offset(tick.ticker), _TICK, fields)
+
+    def write_orderbook(self, orderbook: values.Orderbook) -> None:
+        units = orderbook.orderbook_units[: self.depth]
+        fields: List[Any] = [values._to_ms(orderbook.timestamp), len(units)]
+        fields.extend(_pack_decimal(orderbook.total_ask_size))
+        fields.extend(_pack_decimal(orderbook.total_bid_size))
+        for unit in units:
+            for value in (unit.ask_price, unit.bid_price, unit.ask_size, unit.bid_size):
+                fields.extend(_pack_decimal(value))
+        fields.extend((b'', 0) * 4 * (self.depth - len(units)))
+        self._write(self._orderbook_offset(orderbook.ticker), self._orderbook, fields)
+
+    def tick_version(self, ticker: str) -> int:
+        """
+        Number of writes of `ticker`'s tick. Cheap enough to poll for changes before `read_tick()`.
+        """
+        return int(_SEQUENCE.unpack_from(self._buffer, self._tick_offset(ticker))[0]) // 2
+
+    def orderbook_version(self, ticker: str) -> int:
+        return int(_SEQUENCE.unpack_from(self._buffer, self._orderbook_offset(ticker))[0]) // 2
+
+    def read_tick(self, ticker: str) -> Optional[values.Tick]:
+        fields = self._read(self._tick_offset(ticker), _TICK)
+        if fields is None:
+            return None
+        trade_date_time, timestamp, change, highest_52_week_date, lowest_52_week_date = fields[:5]
+        decimals = {
+            name: _unpack_decimal(fields[5 + i * 2], fields[6 + i * 2]) for i, name in enumerate(_TICK_DECIMAL_FIELDS)
+        }
+        return values.Tick(
+            ticker=ticker,
+            trade_date_time=_from_ms(trade_date_time, values._KST),
+            change=_CHANGES[change],
+            highest_52_week_date=datetime.date.fromordinal(highest_52_week_date),
+            lowest_52_week_date=datetime.date.fromordinal(lowest_52_week_date),
+            timestamp=_from_ms(timestamp, datetime.timezone.utc),
+            **decimals,
+        )
+
+    def read_orderbook(self, ticker: str) -> Optional[values.Orderbook]:
+        fields = self._read(self._orderbook_offset(ticker), self._orderbook)
+        if fields is None:
+            return None
+        timestamp, count = fields[:2]
+        decimals = [_unpack_decimal(fields[i], fields[i + 1]) for i in range(2, 2 + 2 * (2 + 4 * count), 2)]
+        return values.Orderbook(
+            ticker=ticker,
+            timestamp=_from_ms(timestamp, values._KST),
+            total_ask_size=decimals[0],
+            total_bid_size=decimals[1],
+            orderbook_units=tuple(
+                values.Orderbook.Unit(
+                    ask_price=decimals[i],
+                    bid_price=decimals[i + 1],
+                    ask_size=decimals[i + 2],
+                    bid_size=decimals[i + 3],
+                )
+                for i in range(2, len(decimals), 4)
+            ),
+        )
+
+    def close(self) -> None:
+        """
+        Detaches from the shared memory, and frees it if this table was created by `create()`.
+        """
+        del self._buffer
+        self._memory.close()
+        if self._owner:
+            self._memory.unlink()
+
+    def __enter__(self) -> SharedMarketTable:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+
+class SharedMemoryPublisher:
+    """
+    Polls `latest_tick` and `orderbook` of every market in `table` with one connection
+    and writes the results into the table, every `interval` seconds.
+    Values from any other source, such as a stream, can be written with `publish()`.
+    """
+
+    __slots__ = ('client', 'table', 'interval')
+
+    def __init__(self, client: Type[Client], table: SharedMarketTable, interval: float = 0.2) -> None:
+        self.client = client
+        self.table = table
+        self.interval = interval
+
+    def publish(self, value: Union[values.Tick, values.Orderbook]) -> None:
+        if isinstance(value, values.Tick):
+            self.table.write_tick(value)
+        else:
+            self.table.write_orderbook(value)
+
+    async def poll(self) -> None:
+        ticks, orderbooks = await asyncio.gather(
+            self.client.latest_tick(self.table.tickers),
+            self.client.orderbook(self.table.tickers),
+        )
+        # markets missing from the table are skipped
+        for tick in ticks:
+            if tick.ticker in self.table:
+                self.table.write_tick(tick)
+        for orderbook in orderbooks:
+            if orderbook.ticker in self.table:
+                self.table.write_orderbook(orderbook)
+
+    async def run(self) -> None:
+        while True:
+            await asyncio.gather(self.poll(), asyncio.sleep(self.interval))
@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import datetime
+import threading
+from types import TracebackType
+from typing import Any, Awaitable, Callable, Coroutine, Dict, Iterable, Optional, Tuple, Type, TypeVar, Union
+
+import aiohttp
+
+from aioupbit.v1 import columnar, constants, values
+from aioupbit.v1.aiohttp_client import AioHTTPRestClient
+
+__all__ = ('SyncRestClient',)
+
+_T = TypeVar('_T')
+
+
+class SyncRestClient:
+    """
+    Blocking facade of `AioHTTPRestClient` for non-async code.
+
+    One daemon thread runs an event loop that owns a pooled connector, and every call from any thread is dispatched
+    into it with `asyncio.run_coroutine_threadsafe()`, so blocking callers share keep-alive connections.
+    Results are materialized into tuples inside the loop. `timeout` bounds how long a call blocks, in seconds,
+    and a call that times out is cancelled.
+
+    ::
+
+        with SyncRestClient() as client:
+            ticks = client.latest_tick(client.markets())
+    """
+
+    __slots__ = ('timeout', '_loop', '_thread', '_connector', '_client_class', '_client')
+
+    def __init__(
+        self,
+        access_key: Optional[str] = None,
+        secret_key: Optional[str] = None,
+        client_class: Type[AioHTTPRestClient] = AioHTTPRestClient,
+        limit: int = 100,
+        timeout: Optional[float] = None,
+    ) -> None:
+        self.timeout = timeout
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name='aioupbit-sync-client', daemon=True)
+        self._thread.start()
+
+        self._connector = self._run(self._create_connector(limit))
+        # class level methods of the subclass reuse the connector of this facade only
+        self._client_class: Type[AioHTTPRestClient] = type(
+            f'Sync{client_class.__name__}',
+            (client_class,),
+            dict(__slots__=(), _connector=self._connector, _rate_limiters=dict()),
+        )
+        self._client: Optional[AioHTTPRestClient] = None
+        if access_key is not None and secret_key is not None:
+            self._client = self._run(self._create_client(access_key, secret_key))
+
+    @staticmethod
+    async def _create_connector(limit: int) -> aiohttp.BaseConnector:
+        return aiohttp.TCPConnector(limit=limit)
+
+    async def _create_client(self, access_key: str, secret_key: str) -> AioHTTPRestClient:
+        return self._client_class(access_key, secret_key, self._connector)
+
+    def _run(self, coro: Coroutine[Any, Any, _T]) -> _T:
+        if not self._thread.is_alive():
+            coro.close()
+            raise RuntimeError('client is closed')
+        future = asyncio.run_coroutine_threadsafe(coro, self._loop)
+        try:
+            return future.result(self.timeout)
+        except concurrent.futures.TimeoutError:
+            # stop the call, or it keeps running and spending the rate limit budget
+            future.cancel()
+            raise
+
+    def _call(self, factory: Callable[[], Awaitable[_T]]) -> _T:
+        async def call() -> _T:
+            return await factory()
+
+        return self._run(call())
+
+    def _collect(self, factory: Callable[[], Awaitable[Iterable[_T]]]) -> Tuple[_T, ...]:
+        async def collect() -> Tuple[_T, ...]:
+            return tuple(await factory())
+
+        return self._run(collect())
+
+    def run(self, factory: Callable[[AioHTTPRestClient], Awaitable[_T]]) -> _T:
+        """
+        Runs `factory(client)` in the background loop and returns its result,
+        for calls that this facade does not wrap. (e.g. `client.run(lambda c: c.accounts())`)
+        """
+        if self._client is None:
+            raise RuntimeError('access_key and secret_key are required')
+        client = self._client
+        return self._call(lambda: factory(client))
+
+    def markets(self) -> Tuple[values.Ticker, ...]:
+        return self._collect(self._client_class.markets)
+
+    def candles(
+        self,
+        ticker: Union[values.Ticker, str],
+        unit: values.MinCandle.Unit = values.MinCandle.Unit.MIN1,
+        count: int = 1,
+        to: Optional[datetime.datetime] = None,
+    ) -> Tuple[values.MinCandle, ...]:
+        return self._collect(lambda: self._client_class.candles(ticker, unit, count, to))
+
+    def candles_batch(
+        self,
+        tickers: Union[Iterable[values.Ticker], Iterable[str]],
+        unit: values.MinCandle.Unit = values.MinCandle.Unit.MIN1,
+        count: int = 1,
+        to: Optional[datetime.datetime] = None,
+    ) -> columnar.CandleBatch:
+        return self._call(lambda: self._client_class.candles_batch(tickers, unit, count, to))
+
+    def candles_day(
+        self,
+        ticker: Union[values.Ticker, str],
+        count: int = 1,
+        to: Optional[datetime.datetime] = None,
+        converting_price_unit: Optional[constants.CurrencyCode] = None,
+    ) -> Tuple[values.DayCandle, ...]:
+        return self._collect(lambda: self._client_class.candles_day(ticker, count, to, converting_price_unit))
+
+    def candles_week(
+        self,
+        ticker: Union[values.Ticker, str],
+        count: int = 1,
+        to: Optional[datetime.datetime] = None,
+    ) -> Tuple[values.WeekCandle, ...]:
+        return self._collect(lambda: self._client_class.candles_week(ticker, count, to))
+
+    def candles_month(
+        self,
+        ticker: Union[values.Ticker, str],
+        count: int = 1,
+        to: Optional[datetime.datetime] = None,
+    ) -> Tuple[values.MonthCandle, ...]:
+        return self._collect(lambda: self._client_class.candles_month(ticker, count, to))
+
+    def latest_trades(
+        self,
+        ticker: Union[values.Ticker, str],
+        to: Optional[datetime.time] = None,
+        count: int = 1,
+        cursor: Optional[int] = None,
+        days_ago: constants.DaysAgo = 0,
+    ) -> Tuple[values.Trade, ...]:
+        return self._collect(lambda: self._client_class.latest_trades(ticker, to, count, cursor, days_ago))
+
+    def latest_tick(self, markets: Union[Iterable[values.Ticker], Iterable[str]]) -> Tuple[values.Tick, ...]:
+        return self._collect(lambda: self._client_class.latest_tick(markets))
+
+    def orderbook(self, markets: Union[Iterable[values.Ticker], Iterable[str]]) -> Tuple[values.Orderbook, ...]:
+        return self._collect(lambda: self._client_class.orderbook(markets))
+
+    def snapshot(self, quote: Optional[constants.CurrencyCode] = 'KRW') -> Dict[str, values.MarketSnapshot]:
+        return self._call(lambda: self._client_class.snapshot(quote))
+
+    async def _close(self) -> None:
+        if self._client is not None:
+            await self._client.close()
+        await self._connector.close()
+
+    def close(self) -> None:
+        if not self._thread.is_alive():
+            return
+        try:
+            self._run(self._close())
+        finally:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._loop.close()
+
+    def __enter__(self) -> SyncRestClient:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        self.close()
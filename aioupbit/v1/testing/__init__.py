@@ -0,0 +1,4 @@
+from __future__ import annotations
+
+from .payloads import *
+from .server import *
@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, List, Optional, Sequence, Type
+
+import aiohttp
+
+from aioupbit.v1.aiohttp_client import AioHTTPRestClient
+from aioupbit.v1.client import BaseRestClient
+from aioupbit.v1.testing.server import FakeUpbitServer
+from aioupbit.v1.transport import AioHTTPTransport, HTTPXTransport, Transport, TransportRestClient
+
+__all__ = ('LoadTestReport', 'Scenario', 'run_load_test', 'SCENARIOS')
+
+Scenario = Callable[[Type[BaseRestClient], Sequence[str]], Awaitable[object]]
+
+
+async def _latest_tick(client: Type[BaseRestClient], markets: Sequence[str]) -> object:
+    return tuple(await client.latest_tick(markets))
+
+
+async def _orderbook(client: Type[BaseRestClient], markets: Sequence[str]) -> object:
+    return tuple(await client.orderbook(markets))
+
+
+async def _candles(client: Type[BaseRestClient], markets: Sequence[str]) -> object:
+    return tuple(await client.candles(markets[0], count=200))
+
+
+async def _trades(client: Type[BaseRestClient], markets: Sequence[str]) -> object:
+    return tuple(await client.latest_trades(markets[0], count=200))
+
+
+async def _markets(client: Type[BaseRestClient], markets: Sequence[str]) -> object:
+    return tuple(await client.markets())
+
+
+SCENARIOS: Dict[str, Scenario] = dict(
+    latest_tick=_latest_tick,
+    orderbook=_orderbook,
+    candles=_candles,
+    trades=_trades,
+    markets=_markets,
+)
+
+
+@dataclass(frozen=True)
+class LoadTestReport:
+    """
+    Latencies are in seconds.
+    """
+
+    __slots__ = ('requests', 'errors', 'elapsed', 'p50', 'p90', 'p99', 'max')
+
+    requests: int
+    errors: int
+    elapsed: float
+    p50: float
+    p90: float
+    p99: float
+    max: float
+
+    @property
+    def throughput(self) -> float:
+        return self.requests / self.elapsed if self.elapsed > 0 else 0
+
+    def __str__(self) -> str:
+        return (
+            f'requests: {self.requests} (errors: {self.errors}) in {self.elapsed:.3f}s\n'
+            f'throughput: {self.throughput:.1f} req/s\n'
+            f'latency: p50 {self.p50 * 1000:.2f}ms, p90 {self.p90 * 1000:.2f}ms, '
+            f'p99 {self.p99 * 1000:.2f}ms, max {self.max * 1000:.2f}ms'
+        )
+
+
+def _percentile(ordered: Sequence[float], percent: int) -> float:
+    return ordered[min(len(ordered) - 1, len(ordered) * percent // 100)]
+
+
+async def run_load_test(
+    client: Type[BaseRestClient],
+    scenario: Scenario,
+    markets: Sequence[str],
+    concurrency: int,
+    requests: int,
+) -> LoadTestReport:
+    """
+    Runs `requests` calls of `scenario` from `concurrency` concurrent workers.
+    """
+    remaining = requests
+    latencies: List[float] = []
+    errors = 0
+
+    async def worker() -> None:
+        nonlocal remaining, errors
+        while remaining > 0:
+            remaining -= 1
+            started = time.perf_counter()
+            try:
+                await scenario(client, markets)
+            except Exception:
+                errors += 1
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    if not latencies:
+        return LoadTestReport(requests=0, errors=0, elapsed=elapsed, p50=0, p90=0, p99=0, max=0)
+    latencies.sort()
+    return LoadTestReport(
+        requests=len(latencies),
+        errors=errors,
+        elapsed=elapsed,
+        p50=_percentile(latencies, 50),
+        p90=_percentile(latencies, 90),
+        p99=_percentile(latencies, 99),
+        max=latencies[-1],
+    )
+
+
+async def _main(args: argparse.Namespace) -> None:
+    async with FakeUpbitServer(
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        enforce_rate_limit=args.enforce_rate_limit,
+        market_count=args.market_count,
+        orderbook_depth=args.orderbook_depth,
+    ) as server:
+        connector: Optional[aiohttp.BaseConnector] = None
+        if args.pool_size is not None:
+            connector = aiohttp.TCPConnector(limit=args.pool_size)
+
+        transport: Optional[Transport] = None
+        client: Type[BaseRestClient]
+        if args.transport == 'aiohttp':
+            transport = AioHTTPTransport(server.url, connector)
+            client = TransportRestClient.using(transport)
+        elif args.transport == 'httpx':
+            transport = HTTPXTransport(server.url, http2=False)
+            client = TransportRestClient.using(transport)
+        else:
+            client = server.client_class(AioHTTPRestClient)
+            if connector is not None:
+                await client.set_class_level_connector(connector)
+
+        markets = [code for code in server.market_codes if code.startswith(f'{args.quote}-')]
+        try:
+            report = await run_load_test(client, SCENARIOS[args.scenario], markets, args.clients, args.requests)
+        finally:
+            if transport is not None:
+                await transport.close()
+            if connector is not None:
+                await connector.close()
+        print(report)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description='Load test REST clients against an in-process fake Upbit server')
+    parser.add_argument('scenario', choices=tuple(SCENARIOS))
+    parser.add_argument('-c', '--clients', type=int, default=10, help='number of concurrent clients')
+    parser.add_argument('-n', '--requests', type=int, default=1000, help='total number of requests')
+    parser.add_argument(
+        '--transport',
+        choices=('client', 'aiohttp', 'httpx'),
+        default='client',
+        help='AioHTTPRestClient itself, or TransportRestClient over a transport',
+    )
+    parser.add_argument('--pool-size', type=int, help='share one connector of this size between clients')
+    parser.add_argument('--latency', type=float, default=0, help='server side latency in seconds')
+    parser.add_argument('--jitter', type=float, default=0, help='random extra latency in seconds')
+    parser.add_argument('--error-rate', type=float, default=0, help='probability of 429 responses')
+    parser.add_argument('--enforce-rate-limit', action='store_true')
+    parser.add_argument('--market-count', type=int, default=250)
+    parser.add_argument('--orderbook-depth', type=int, default=15)
+    parser.add_argument('--quote', default='KRW')
+    asyncio.run(_main(parser.parse_args(argv)))
+
+
+if __name__ == '__main__':
+    main()
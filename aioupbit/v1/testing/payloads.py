@@ -0,0 +1,314 @@
+from __future__ import annotations
+
+import datetime
+import random
+import uuid
+from typing import Any, Dict, List, Optional, Sequence
+
+from typing_extensions import TypeAlias
+
+__all__ = ('PayloadGenerator',)
+
+_JSON: TypeAlias = Dict[str, Any]
+
+_KST = datetime.timezone(datetime.timedelta(hours=9))
+
+
+def _to_ms(dt: datetime.datetime) -> int:
+    return int(dt.timestamp() * 1000)
+
+
+class PayloadGenerator:
+    """
+    Generates JSON payloads shaped like Upbit REST responses.
+
+    Prices are random walks seeded by `seed`, so the same generator always produces the same payloads.
+    """
+
+    __slots__ = ('_random', '_prices', '_sequence')
+
+    def __init__(self, seed: int = 322) -> None:
+        self._random = random.Random(seed)
+        self._prices: Dict[str, float] = dict()
+        self._sequence = 0
+
+    @staticmethod
+    def market_codes(count: int, quotes: Sequence[str] = ('KRW', 'BTC', 'USDT')) -> List[str]:
+        return [f'{quotes[i % len(quotes)]}-C{i // len(quotes):04d}' for i in range(count)]
+
+    def _price(self, market: str) -> float:
+        price = self._prices.get(market)
+        if price is None:
+            price = 10 ** self._random.uniform(-1, 7.7)
+        price *= self._random.uniform(0.999, 1.001)
+        self._prices[market] = price
+        return price
+
+    @staticmethod
+    def _round(price: float) -> float:
+        if price >= 100:
+            return float(round(price))
+        if price >= 1:
+            return round(price, 2)
+        return round(price, 8)
+
+    def markets(self, codes: Sequence[str]) -> List[_JSON]:
+        return [
+            dict(
+                market_warning='CAUTION' if self._random.random() < 0.05 else 'NONE',
+                market=code,
+                korean_name=f'코인{code.split("-", 1)[1]}',
+                english_name=code.split('-', 1)[1].title(),
+            )
+            for code in codes
+        ]
+
+    def tick(self, market: str, now: datetime.datetime) -> _JSON:
+        price = self._price(market)
+        prev = price * self._random.uniform(0.9, 1.1)
+        change = price - prev
+        volume = self._random.uniform(1e2, 1e9) / price
+        trade_at = now - datetime.timedelta(milliseconds=self._random.randint(0, 5000))
+        trade_at_kst = trade_at.astimezone(_KST)
+        return dict(
+            market=market,
+            trade_date=trade_at.strftime('%Y%m%d'),
+            trade_time=trade_at.strftime('%H%M%S'),
+            trade_date_kst=trade_at_kst.strftime('%Y%m%d'),
+            trade_time_kst=trade_at_kst.strftime('%H%M%S'),
+            trade_timestamp=_to_ms(trade_at),
+            opening_price=self._round(prev * self._random.uniform(0.98, 1.02)),
+            high_price=self._round(price * 1.03),
+            low_price=self._round(price * 0.97),
+            trade_price=self._round(price),
+            prev_closing_price=self._round(prev),
+            change='RISE' if change > 0 else 'FALL' if change < 0 else 'EVEN',
+            change_price=self._round(abs(change)),
+            change_rate=round(abs(change) / prev, 10),
+            signed_change_price=self._round(change),
+            signed_change_rate=round(change / prev, 10),
+            trade_volume=round(self._random.uniform(0.0001, 100), 8),
+            acc_trade_price=round(volume * price, 8),
+            acc_trade_price_24h=round(volume * price * 1.7, 8),
+            acc_trade_volume=round(volume, 8),
+            acc_trade_volume_24h=round(volume * 1.7, 8),
+            highest_52_week_price=self._round(price * 2.1),
+            highest_52_week_date='2021-11-09',
+            lowest_52_week_price=self._round(price * 0.4),
+            lowest_52_week_date='2021-07-21',
+            timestamp=_to_ms(now),
+        )
+
+    def orderbook(self, market: str, now: datetime.datetime, depth: int = 15) -> _JSON:
+        price = self._price(market)
+        step = price * 0.0005
+        units = [
+            dict(
+                ask_price=self._round(price + step * (i + 1)),
+                bid_price=self._round(price - step * i),
+                ask_size=round(self._random.uniform(0.001, 500), 8),
+                bid_size=round(self._random.uniform(0.001, 500), 8),
+            )
+            for i in range(depth)
+        ]
+        return dict(
+            market=market,
+            timestamp=_to_ms(now),
+            total_ask_size=round(sum(unit['ask_size'] for unit in units), 8),
+            total_bid_size=round(sum(unit['bid_size'] for unit in units), 8),
+            orderbook_units=units,
+        )
+
+    def _candles(self, market: str, starts: Sequence[datetime.datetime], period: datetime.timedelta) -> List[_JSON]:
+        price = self._price(market)
+        candles = []
+        for start in starts:
+            opening = price * self._random.uniform(0.995, 1.005)
+            high = max(opening, price) * self._random.uniform(1, 1.003)
+            low = min(opening, price) * self._random.uniform(0.997, 1)
+            volume = round(self._random.uniform(0.01, 20), 8)
+            candles.append(
+                dict(
+                    market=market,
+                    candle_date_time_utc=start.strftime('%Y-%m-%dT%H:%M:%S'),
+                    candle_date_time_kst=start.astimezone(_KST).strftime('%Y-%m-%dT%H:%M:%S'),
+                    opening_price=self._round(opening),
+                    high_price=self._round(high),
+                    low_price=self._round(low),
+                    trade_price=self._round(price),
+                    timestamp=_to_ms(start + period * self._random.uniform(0, 0.99)),
+                    candle_acc_trade_price=round(volume * price, 8),
+                    candle_acc_trade_volume=volume,
+                )
+            )
+            price = opening
+        return candles
+
+    def min_candles(self, market: str, unit: int, count: int, to: datetime.datetime) -> List[_JSON]:
+        period = datetime.timedelta(minutes=unit)
+        last = to - datetime.timedelta(seconds=to.timestamp() % period.total_seconds())
+        if last == to:
+            last -= period
+        candles = self._candles(market, [last - period * i for i in range(count)], period)
+        for candle in candles:
+            candle['unit'] = unit
+        return candles
+
+    def day_candles(self, market: str, count: int, to: datetime.datetime) -> List[_JSON]:
+        period = datetime.timedelta(days=1)
+        last = datetime.datetime.combine(to.date(), datetime.time(), datetime.timezone.utc)
+        if last == to:
+            last -= period
+        candles = self._candles(market, [last - period * i for i in range(count)], period)
+        for candle in candles:
+            prev = candle['opening_price']
+            candle['prev_closing_price'] = prev
+            candle['change_price'] = self._round(candle['trade_price'] - prev)
+            candle['change_rate'] = round((candle['trade_price'] - prev) / prev, 10)
+        return candles
+
+    def week_candles(self, market: str, count: int, to: datetime.datetime) -> List[_JSON]:
+        period = datetime.timedelta(weeks=1)
+        last = datetime.datetime.combine(to.date() - datetime.timedelta(days=to.weekday()), datetime.time())
+        last = last.replace(tzinfo=datetime.timezone.utc)
+        if last == to:
+            last -= period
+        candles = self._candles(market, [last - period * i for i in range(count)], period)
+        for candle in candles:
+            candle['first_day_of_period'] = candle['candle_date_time_utc'][:10]
+        return candles
+
+    def month_candles(self, market: str, count: int, to: datetime.datetime) -> List[_JSON]:
+        starts = []
+        year, month = to.year, to.month
+        for _ in range(count):
+            starts.append(datetime.datetime(year, month, 1, tzinfo=datetime.timezone.utc))
+            year, month = (year, month - 1) if month > 1 else (year - 1, 12)
+        candles = self._candles(market, starts, datetime.timedelta(days=28))
+        for candle in candles:
+            candle['first_day_of_period'] = candle['candle_date_time_utc'][:10]
+        return candles
+
+    def trades(self, market: str, count: int, now: datetime.datetime, cursor: Optional[int] = None) -> List[_JSON]:
+        """
+        Newest first. `cursor` is an exclusive upper bound of `sequential_id`, as in the real API.
+        """
+        trades = []
+        price = self._price(market)
+        at = now
+        if cursor is not None:
+            at = min(at, datetime.datetime.fromtimestamp(cursor // 10000 / 1000, datetime.timezone.utc))
+        for _ in range(count):
+            at -= datetime.timedelta(milliseconds=self._random.randint(10, 3000))
+            self._sequence = (self._sequence + 1) % 10000
+            trades.append(
+                dict(
+                    market=market,
+                    trade_date_utc=at.strftime('%Y-%m-%d'),
+                    trade_time_utc=at.strftime('%H:%M:%S'),
+                    timestamp=_to_ms(at),
+                    trade_price=self._round(price),
+                    trade_volume=round(self._random.uniform(0.0001, 0.5), 8),
+                    prev_closing_price=self._round(price * 0.99),
+                    change_price=self._round(price * 0.01),
+                    ask_bid='ASK' if self._random.random() < 0.5 else 'BID',
+                    sequential_id=_to_ms(at) * 10000 + self._sequence,
+                )
+            )
+            price *= self._random.uniform(0.9995, 1.0005)
+        return trades
+
+    def accounts(self, currencies: Sequence[str]) -> List[_JSON]:
+        return [
+            dict(
+                currency=currency,
+                balance=f'{self._random.uniform(0, 1000):.8f}',
+                locked=f'{self._random.uniform(0, 10):.8f}',
+                avg_buy_price=f'{self._random.uniform(0, 1000000):.8f}',
+                avg_buy_price_modified=False,
+                unit_currency='KRW',
+            )
+            for currency in currencies
+        ]
+
+    def order(
+        self,
+        market: str,
+        now: datetime.datetime,
+        state: str = 'wait',
+        order_uuid: Optional[str] = None,
+        identifier: Optional[str] = None,
+    ) -> _JSON:
+        price = self._round(self._price(market))
+        volume = round(self._random.uniform(0.001, 10), 8)
+        executed = volume if state == 'done' else round(volume * self._random.random(), 8)
+        return dict(
+            uuid=str(uuid.UUID(int=self._random.getrandbits(128), version=4)) if order_uuid is None else order_uuid,
+            side='bid' if self._random.random() < 0.5 else 'ask',
+            ord_type='limit',
+            price=f'{price}',
+            state=state,
+            market=market,
+            created_at=now.astimezone(_KST).isoformat(timespec='seconds'),
+            volume=f'{volume:.8f}',
+            remaining_volume=f'{volume - executed:.8f}',
+            reserved_fee=f'{price * volume * 0.0005:.8f}',
+            remaining_fee=f'{price * (volume - executed) * 0.0005:.8f}',
+            paid_fee=f'{price * executed * 0.0005:.8f}',
+            locked=f'{price * (volume - executed) * 1.0005:.8f}',
+            executed_volume=f'{executed:.8f}',
+            trades_count=0 if executed == 0 else 1,
+            identifier=identifier,
+        )
+
+    def my_order(
+        self,
+        market: str,
+        now: datetime.datetime,
+        state: str = 'wait',
+        order_uuid: Optional[str] = None,
+        identifier: Optional[str] = None,
+    ) -> _JSON:
+        """
+        `myOrder` event of the WebSocket EXCHANGE API.
+        """
+        order = self.order(market, now, state, order_uuid, identifier)
+        return dict(
+            type='myOrder',
+            code=market,
+            uuid=order['uuid'],
+            ask_bid=order['side'].upper(),
+            order_type=order['ord_type'],
+            state=state,
+            price=float(order['price']),
+            avg_price=float(order['price']),
+            volume=float(order['volume']),
+            remaining_volume=float(order['remaining_volume']),
+            executed_volume=float(order['executed_volume']),
+            trades_count=order['trades_count'],
+            reserved_fee=float(order['reserved_fee']),
+            remaining_fee=float(order['remaining_fee']),
+            paid_fee=float(order['paid_fee']),
+            locked=float(order['locked']),
+            executed_funds=round(float(order['price']) * float(order['executed_volume']), 8),
+            identifier=identifier,
+            order_timestamp=_to_ms(now),
+            timestamp=_to_ms(now),
+            stream_type='REALTIME',
+        )
+
+    def my_asset(self, currencies: Sequence[str], now: datetime.datetime) -> _JSON:
+        """
+        `myAsset` event of the WebSocket EXCHANGE API.
+        """
+        return dict(
+            type='myAsset',
+            asset_uuid=str(uuid.UUID(int=self._random.getrandbits(128), version=4)),
+            assets=[
+                dict(currency=account['currency'], balance=float(account['balance']), locked=float(account['locked']))
+                for account in self.accounts(currencies)
+            ],
+            asset_timestamp=_to_ms(now),
+            timestamp=_to_ms(now),
+            stream_type='REALTIME',
+        )
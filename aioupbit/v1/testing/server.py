@@ -0,0 +1,375 @@
+from __future__ import annotations
+
+import asyncio
+import datetime
+import random
+import time
+from collections import Counter
+from types import TracebackType
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple, Type, TypeVar, cast
+
+import rapidjson
+from aiohttp import web
+
+from aioupbit.v1 import constants, endpoints, rate_limit, values
+from aioupbit.v1.aiohttp_client import AioHTTPRestClient
+from aioupbit.v1.testing.payloads import PayloadGenerator
+
+__all__ = ('FakeUpbitServer',)
+
+_C = TypeVar('_C', bound=AioHTTPRestClient)
+
+_Handler = Callable[[web.Request], Awaitable[web.StreamResponse]]
+
+
+class FakeUpbitServer:
+    """
+    In-process fake of the Upbit REST API.
+
+    Every response is delayed by `latency` plus up to `jitter` seconds and carries a `Remaining-Req` header
+    computed from per-second request counters of its rate limit group.
+    When `enforce_rate_limit` is set, requests beyond the group limit get 429 like the real server.
+    `error_rate` is the probability of answering 429 regardless of the counters.
+
+    Events passed to `publish()` are sent to the clients of the private WebSocket API at `websocket_url`,
+    and their subscription requests are kept in `subscriptions`.
+
+    `market_count`, `orderbook_depth` and `max_count` control payload sizes;
+    `max_count` overrides the real server's 200 rows per request limit.
+    Generated per-market payloads are reused for `refresh_interval` seconds,
+    so that generating them does not compete for CPU with the client under test.
+
+    ::
+
+        async with FakeUpbitServer(latency=0.02) as server:
+            client = server.client_class()
+            await client.latest_tick(await client.markets())
+    """
+
+    __slots__ = (
+        'latency',
+        'jitter',
+        'error_rate',
+        'enforce_rate_limit',
+        'orderbook_depth',
+        'max_count',
+        'refresh_interval',
+        'requests',
+        'subscriptions',
+        '_markets',
+        '_payloads',
+        '_random',
+        '_host',
+        '_port',
+        '_runner',
+        '_url',
+        '_windows',
+        '_fragments',
+        '_websockets',
+    )
+
+    def __init__(
+        self,
+        *,
+        latency: float = 0,
+        jitter: float = 0,
+        error_rate: float = 0,
+        enforce_rate_limit: bool = False,
+        market_count: int = 250,
+        orderbook_depth: int = 15,
+        max_count: int = 200,
+        refresh_interval: float = 1,
+        seed: int = 322,
+        host: str = '127.0.0.1',
+        port: int = 0,
+    ) -> None:
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.enforce_rate_limit = enforce_rate_limit
+        self.orderbook_depth = orderbook_depth
+        self.max_count = max_count
+        self.refresh_interval = refresh_interval
+        self.requests: Counter[str] = Counter()
+        self.subscriptions: List[Any] = []
+
+        self._payloads = PayloadGenerator(seed)
+        self._markets = tuple(self._payloads.markets(PayloadGenerator.market_codes(market_count)))
+        self._random = random.Random(seed)
+        self._host = host
+        self._port = port
+        self._runner: Optional[web.AppRunner] = None
+        self._url: Optional[str] = None
+        self._windows: Dict[constants.RateLimitGroup, Tuple[int, int]] = dict()
+        self._fragments: Dict[Tuple[str, str], Tuple[float, bytes]] = dict()
+        self._websockets: List[web.WebSocketResponse] = []
+
+    @property
+    def url(self) -> str:
+        if self._url is None:
+            raise RuntimeError('server is not started')
+        return self._url
+
+    @property
+    def websocket_url(self) -> str:
+        return f'ws{self.url[4:]}/websocket/v1/private'
+
+    @property
+    def market_codes(self) -> Sequence[str]:
+        return tuple(market['market'] for market in self._markets)
+
+    def client_class(self, base: Type[_C] = AioHTTPRestClient) -> Type[_C]:  # type: ignore[assignment]
+        """
+        Subclass of `base` whose requests are sent to this server.
+        """
+        return cast(Type[_C], type(f'Fake{base.__name__}', (base,), dict(__slots__=(), BASE_URL=self.url)))
+
+    async def start(self) -> None:
+        app = web.Application()
+        get = app.router.add_get
+        for endpoint, handler in (
+            (endpoints.MARKETS, self._market_all),
+            *((endpoints.MIN_CANDLES[unit], self._candles_minutes) for unit in values.MinCandle.Unit),
+            (endpoints.DAY_CANDLES, self._candles_days),
+            (endpoints.WEEK_CANDLES, self._candles_weeks),
+            (endpoints.MONTH_CANDLES, self._candles_months),
+            (endpoints.TRADES, self._trades_ticks),
+            (endpoints.TICKER, self._ticker),
+            (endpoints.ORDERBOOK, self._orderbook),
+        ):
+            get(endpoint.path, self._route(endpoint.group, handler))
+        for endpoint, handler in (
+            (endpoints.ACCOUNTS, self._accounts),
+            (endpoints.ORDERS_CHANCE, self._orders_chance),
+            (endpoints.ORDER, self._get_order),
+            (endpoints.ORDERS, self._orders),
+        ):
+            get(endpoint.path, self._route(endpoint.group, handler, auth=True))
+        app.router.add_delete(
+            endpoints.CANCEL_ORDER.path,
+            self._route(endpoints.CANCEL_ORDER.group, self._cancel_order, auth=True),
+        )
+        # not in the endpoint table, since the client does not place orders
+        app.router.add_post('/v1/orders', self._route(constants.RateLimitGroup.ORDER, self._post_order, auth=True))
+        get('/websocket/v1/private', self._private_websocket)
+
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self._host, self._port)
+        await site.start()
+        host, port = self._runner.addresses[0][:2]
+        self._url = f'http://{host}:{port}'
+
+    async def publish(self, event: Any) -> None:
+        """
+        Sends `event` to every connected private WebSocket client, as binary like the real server.
+        """
+        data = rapidjson.dumps(event, ensure_ascii=False).encode()
+        for ws in tuple(self._websockets):
+            await ws.send_bytes(data)
+
+    async def close(self) -> None:
+        for ws in tuple(self._websockets):
+            await ws.close()
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+            self._url = None
+
+    async def __aenter__(self) -> FakeUpbitServer:
+        await self.start()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        await self.close()
+
+    def _remaining(self, group: constants.RateLimitGroup) -> int:
+        second = int(time.time())
+        window, count = self._windows.get(group, (second, 0))
+        if window != second:
+            count = 0
+        self._windows[group] = (second, count + 1)
+        return rate_limit.REQUESTS_PER_SECOND[group] - count - 1
+
+    def _route(
+        self, group: constants.RateLimitGroup, handler: Callable[[web.Request], Any], auth: bool = False
+    ) -> _Handler:
+        async def route(request: web.Request) -> web.StreamResponse:
+            self.requests[request.path] += 1
+
+            delay = self.latency + self._random.uniform(0, self.jitter)
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+            remaining = self._remaining(group)
+            headers = {'Remaining-Req': f'group={group.value}; min={max(remaining, 0) * 60}; sec={max(remaining, 0)}'}
+            if (self.enforce_rate_limit and remaining < 0) or self._random.random() < self.error_rate:
+                return self._error(429, 'too_many_requests', 'Too many API requests.', headers)
+            if auth and not request.headers.get('Authorization', '').startswith('Bearer '):
+                return self._error(401, 'jwt_verification', 'Failed to verify Jwt token.', headers)
+
+            try:
+                body = handler(request)
+            except (KeyError, ValueError) as e:
+                return self._error(400, 'validation_error', str(e), headers)
+            return web.Response(
+                body=body if isinstance(body, bytes) else rapidjson.dumps(body, ensure_ascii=False).encode(),
+                content_type='application/json',
+                headers=headers,
+            )
+
+        return route
+
+    async def _private_websocket(self, request: web.Request) -> web.StreamResponse:
+        self.requests[request.path] += 1
+        if not request.headers.get('Authorization', '').startswith('Bearer '):
+            return self._error(401, 'jwt_verification', 'Failed to verify Jwt token.', {})
+
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        self._websockets.append(ws)
+        try:
+            async for message in ws:
+                self.subscriptions.append(rapidjson.loads(message.data))
+        finally:
+            self._websockets.remove(ws)
+        return ws
+
+    @staticmethod
+    def _error(status: int, name: str, message: str, headers: Dict[str, str]) -> web.Response:
+        return web.Response(
+            status=status,
+            body=rapidjson.dumps(dict(error=dict(name=name, message=message)), ensure_ascii=False).encode(),
+            content_type='application/json',
+            headers=headers,
+        )
+
+    @staticmethod
+    def _now() -> datetime.datetime:
+        return datetime.datetime.now(datetime.timezone.utc)
+
+    def _count(self, request: web.Request) -> int:
+        return min(int(request.query.get('count', 1)), self.max_count)
+
+    def _to(self, request: web.Request) -> datetime.datetime:
+        to = request.query.get('to')
+        if to is None:
+            return self._now()
+        return datetime.datetime.strptime(to, '%Y-%m-%dT%H:%M:%SZ').replace(tzinfo=datetime.timezone.utc)
+
+    def _market_all(self, request: web.Request) -> Any:
+        return self._markets
+
+    def _candles_minutes(self, request: web.Request) -> Any:
+        unit = int(request.path.rsplit('/', 1)[1])
+        return self._payloads.min_candles(request.query['market'], unit, self._count(request), self._to(request))
+
+    def _candles_days(self, request: web.Request) -> Any:
+        return self._payloads.day_candles(request.query['market'], self._count(request), self._to(request))
+
+    def _candles_weeks(self, request: web.Request) -> Any:
+        return self._payloads.week_candles(request.query['market'], self._count(request), self._to(request))
+
+    def _candles_months(self, request: web.Request) -> Any:
+        return self._payloads.month_candles(request.query['market'], self._count(request), self._to(request))
+
+    def _trades_ticks(self, request: web.Request) -> Any:
+        now = self._now() - datetime.timedelta(days=int(request.query.get('daysAgo', 0)))
+        cursor = request.query.get('cursor')
+        return self._payloads.trades(
+            request.query['market'],
+            self._count(request),
+            now,
+            None if cursor is None else int(cursor),
+        )
+
+    def _fragment(self, kind: str, market: str, generate: Callable[[datetime.datetime], Any]) -> bytes:
+        key = (kind, market)
+        now = time.monotonic()
+        cached = self._fragments.get(key)
+        if cached is not None and now - cached[0] < self.refresh_interval:
+            return cached[1]
+        fragment: bytes = rapidjson.dumps(generate(self._now()), ensure_ascii=False).encode()
+        self._fragments[key] = (now, fragment)
+        return fragment
+
+    def _ticker(self, request: web.Request) -> Any:
+        return b'[%b]' % b','.join(
+            self._fragment('ticker', market, lambda now: self._payloads.tick(market, now))
+            for market in request.query['markets'].split(',')
+        )
+
+    def _orderbook(self, request: web.Request) -> Any:
+        return b'[%b]' % b','.join(
+            self._fragment('orderbook', market, lambda now: self._payloads.orderbook(market, now, self.orderbook_depth))
+            for market in request.query['markets'].split(',')
+        )
+
+    def _accounts(self, request: web.Request) -> Any:
+        return self._payloads.accounts(('KRW', 'BTC', 'ETH'))
+
+    def _orders_chance(self, request: web.Request) -> Any:
+        market = request.query['market']
+        quote, base = market.split('-', 1)
+        bid_account, ask_account = self._payloads.accounts((quote, base))
+        return dict(
+            bid_fee='0.0005',
+            ask_fee='0.0005',
+            market=dict(
+                id=market,
+                name=f'{base}/{quote}',
+                order_types=['limit'],
+                order_sides=['ask', 'bid'],
+                bid=dict(currency=quote, price_unit=None, min_total='5000'),
+                ask=dict(currency=base, price_unit=None, min_total='5000'),
+                max_total='1000000000.0',
+                state='active',
+            ),
+            bid_account=bid_account,
+            ask_account=ask_account,
+        )
+
+    def _get_order(self, request: web.Request) -> Any:
+        order = self._payloads.order(
+            'KRW-C0000',
+            self._now(),
+            order_uuid=request.query.get('uuid'),
+            identifier=request.query.get('identifier'),
+        )
+        order['trades'] = []
+        return order
+
+    def _orders(self, request: web.Request) -> Any:
+        now = self._now()
+        market = request.query.get('market', 'KRW-C0000')
+        states = request.query.getall('states[]', None) or [request.query.get('state', 'wait')]
+        uuids = request.query.getall('uuids[]', None)
+        if uuids is not None:
+            return [
+                self._payloads.order(market, now, state=states[i % len(states)], order_uuid=order_uuid)
+                for i, order_uuid in enumerate(uuids)
+            ]
+        identifiers = request.query.getall('identifiers[]', None)
+        if identifiers is not None:
+            return [
+                self._payloads.order(market, now, state=states[i % len(states)], identifier=identifier)
+                for i, identifier in enumerate(identifiers)
+            ]
+        limit = min(int(request.query.get('limit', 100)), 100)
+        return [self._payloads.order(market, now, state=states[i % len(states)]) for i in range(limit)]
+
+    def _cancel_order(self, request: web.Request) -> Any:
+        return self._payloads.order(
+            'KRW-C0000',
+            self._now(),
+            order_uuid=request.query.get('uuid'),
+            identifier=request.query.get('identifier'),
+        )
+
+    def _post_order(self, request: web.Request) -> Any:
+        return self._payloads.order('KRW-C0000', self._now())
@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+import asyncio
+import collections
+import datetime
+from abc import ABCMeta, abstractmethod
+from decimal import Decimal
+from pathlib import Path
+from typing import Deque, Iterator, List, Optional, Sequence, Set, Type, Union
+
+from aioupbit.v1 import constants, values
+from aioupbit.v1.client import Client
+
+__all__ = ('TradeStore', 'MemoryTradeStore', 'FileTradeStore', 'TradeTapeSyncer')
+
+
+class TradeStore(metaclass=ABCMeta):
+    """
+    Append-only store of trades.
+    """
+
+    __slots__ = ()
+
+    @abstractmethod
+    def append(self, trades: Sequence[values.Trade]) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def __iter__(self) -> Iterator[values.Trade]:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        pass
+
+
+class MemoryTradeStore(TradeStore):
+    __slots__ = ('trades',)
+
+    trades: List[values.Trade]
+
+    def __init__(self) -> None:
+        self.trades = []
+
+    def append(self, trades: Sequence[values.Trade]) -> None:
+        self.trades.extend(trades)
+
+    def __iter__(self) -> Iterator[values.Trade]:
+        return iter(self.trades)
+
+
+class FileTradeStore(TradeStore):
+    """
+    Stores trades as tab separated lines of
+    `ticker, sequential_id, timestamp (ms), trade_price, trade_volume, prev_closing_price, change_price, side`.
+    """
+
+    __slots__ = ('path', '_file')
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        self.path = Path(path)
+        self._file = self.path.open('a', encoding='utf-8')
+
+    def append(self, trades: Sequence[values.Trade]) -> None:
+        self._file.writelines(
+            f'{trade.ticker}\t{trade.sequential_id}\t{int(trade.timestamp.timestamp() * 1000)}\t'
+            f'{trade.trade_price}\t{trade.trade_volume}\t{trade.prev_closing_price}\t{trade.change_price}\t'
+            f'{trade.side.value}\n'
+            for trade in trades
+        )
+        self._file.flush()
+
+    def __iter__(self) -> Iterator[values.Trade]:
+        with self.path.open(encoding='utf-8') as f:
+            for line in f:
+                ticker, sequential_id, timestamp, price, volume, prev_closing_price, change_price, side = line.split()
+                yield values.Trade(
+                    ticker=ticker,
+                    timestamp=datetime.datetime.fromtimestamp(int(timestamp) / 1000, datetime.timezone.utc),
+                    trade_price=Decimal(price),
+                    trade_volume=Decimal(volume),
+                    prev_closing_price=Decimal(prev_closing_price),
+                    change_price=Decimal(change_price),
+                    side=constants.Side(side),
+                    sequential_id=int(sequential_id),
+                )
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class _SeenIds:
+    """
+    Set of the latest `capacity` sequential ids. The oldest inserted id is evicted first.
+    """
+
+    __slots__ = ('capacity', '_ids', '_order')
+
+    def __init__(self, capacity: int) -> None:
+        self.capacity = capacity
+        self._ids: Set[int] = set()
+        self._order: Deque[int] = collections.deque()
+
+    def __contains__(self, sequential_id: int) -> bool:
+        return sequential_id in self._ids
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def add(self, sequential_id: int) -> bool:
+        """
+        Returns `False` if `sequential_id` was already seen.
+        """
+        if sequential_id in self._ids:
+            return False
+        self._ids.add(sequential_id)
+        self._order.append(sequential_id)
+        if len(self._order) > self.capacity:
+            self._ids.discard(self._order.popleft())
+        return True
+
+
+class TradeTapeSyncer:
+    """
+    Keeps the trade tape of a market complete in `store`.
+
+    `backfill()` walks `cursor` backwards through each of `days_ago` 0..7,
+    then `poll()` fetches the latest trades and walks back only until it meets a trade already seen.
+    Trades are deduplicated by `sequential_id`; up to `dedup_capacity` recent ids are remembered.
+    Each page is appended to the store in ascending order of `sequential_id`.
+    """
+
+    __slots__ = ('client', 'ticker', 'store', 'count', '_seen', '_newest')
+
+    def __init__(
+        self,
+        client: Type[Client],
+        ticker: Union[values.Ticker, str],
+        store: TradeStore,
+        count: int = 500,
+        dedup_capacity: int = 100_000,
+    ) -> None:
+        self.client = client
+        self.ticker = ticker.ticker if isinstance(ticker, values.Ticker) else ticker
+        self.store = store
+        self.count = count
+        self._seen = _SeenIds(dedup_capacity)
+        self._newest: Optional[int] = None
+
+    def _store(self, trades: Sequence[values.Trade]) -> List[values.Trade]:
+        new = [
+            trade
+            for trade in sorted(trades, key=lambda trade: trade.sequential_id)
+            if self._seen.add(trade.sequential_id)
+        ]
+        if new:
+            self.store.append(new)
+            if self._newest is None or new[-1].sequential_id > self._newest:
+                self._newest = new[-1].sequential_id
+        return new
+
+    async def _page(self, cursor: Optional[int], days_ago: constants.DaysAgo) -> Sequence[values.Trade]:
+        return tuple(await self.client.latest_trades(self.ticker, count=self.count, cursor=cursor, days_ago=days_ago))
+
+    async def backfill(self, days: Sequence[constants.DaysAgo] = (0, 1, 2, 3, 4, 5, 6, 7)) -> int:
+        """
+        Returns the number of stored trades.
+        """
+        stored = 0
+        for days_ago in days:
+            cursor: Optional[int] = None
+            while True:
+                page = await self._page(cursor, days_ago)
+                stored += len(self._store(page))
+                if len(page) < self.count:
+                    break
+                cursor = min(trade.sequential_id for trade in page)
+        return stored
+
+    async def poll(self) -> List[values.Trade]:
+        """
+        Stores and returns the trades that arrived since the last call, oldest first.
+        """
+        newest = self._newest
+        new: List[values.Trade] = []
+        cursor: Optional[int] = None
+        while True:
+            page = await self._page(cursor, 0)
+            reached = newest is None or any(trade.sequential_id <= newest for trade in page)
+            new.extend(self._store(page))
+            if reached or len(page) < self.count:
+                break
+            cursor = min(trade.sequential_id for trade in page)
+        new.sort(key=lambda trade: trade.sequential_id)
+        return new
+
+    async def run(self, interval: float = 1) -> None:
+        """
+        Backfills and then polls every `interval` seconds until cancelled.
+        """
+        await self.backfill()
+        while True:
+            await asyncio.sleep(interval)
+            await self.poll()
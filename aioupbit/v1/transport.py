@@ -0,0 +1,255 @@
+from __future__ import annotations
+
+import dataclasses
+from abc import ABCMeta, abstractmethod
+from types import TracebackType
+from typing import Any, ClassVar, Dict, Iterable, List, Mapping, Optional, Tuple, Type, TypeVar, cast
+
+import aiohttp
+import yarl
+
+from aioupbit.v1 import instrumentation, rate_limit
+from aioupbit.v1.client import BaseRestClient, Client
+
+try:
+    import httpx
+except ImportError:  # optional extra
+    httpx = None  # type: ignore[assignment]
+
+__all__ = (
+    'Response',
+    'ResponseError',
+    'Transport',
+    'AioHTTPTransport',
+    'HTTPXTransport',
+    'ReplayTransport',
+    'RecordingTransport',
+    'TransportRestClient',
+)
+
+_T = TypeVar('_T')
+_C = TypeVar('_C', bound='TransportRestClient')
+
+
+@dataclasses.dataclass(frozen=True)
+class Response:
+    __slots__ = ('status', 'headers', 'content', 'encoding')
+
+    status: int
+    headers: Mapping[str, str]
+    content: bytes
+    encoding: str
+
+    def raise_for_status(self) -> None:
+        if self.status >= 400:
+            raise ResponseError(self)
+
+
+class ResponseError(Exception):
+    def __init__(self, response: Response) -> None:
+        super().__init__(response.status, response.content)
+        self.response = response
+
+    @property
+    def status(self) -> int:
+        return self.response.status
+
+
+class Transport(metaclass=ABCMeta):
+    """
+    Sends requests to the Upbit REST API and returns whole responses, so that the endpoint logic of
+    `TransportRestClient` does not depend on an HTTP library.
+
+    `url` is relative to the base url and already encoded (see `endpoints`), so it is sent as is.
+    """
+
+    __slots__ = ()
+
+    @abstractmethod
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> Response:
+        raise NotImplementedError
+
+    async def close(self) -> None:
+        pass
+
+    async def __aenter__(self: _T) -> _T:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        await self.close()
+
+
+class AioHTTPTransport(Transport):
+    """
+    One `aiohttp.ClientSession`, created on the first request so that it belongs to the running loop.
+    """
+
+    __slots__ = ('base_url', '_connector', '_session')
+
+    def __init__(self, base_url: str = Client.BASE_URL, connector: Optional[aiohttp.BaseConnector] = None) -> None:
+        self.base_url = base_url
+        self._connector = connector
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> Response:
+        session = self._session
+        if session is None:
+            session = self._session = aiohttp.ClientSession(
+                self.base_url,
+                connector=self._connector,
+                connector_owner=self._connector is None,
+            )
+        async with session.request(method, yarl.URL(url, encoded=True), headers=headers) as res:
+            return Response(res.status, res.headers, await res.read(), res.get_encoding())
+
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+
+class HTTPXTransport(Transport):
+    """
+    `httpx.AsyncClient`, which multiplexes concurrent requests over one HTTP/2 connection if `http2` is set.
+    Requires the `httpx` extra (and `h2` for HTTP/2).
+    """
+
+    __slots__ = ('_client',)
+
+    def __init__(self, base_url: str = Client.BASE_URL, http2: bool = True, **kwargs: Any) -> None:
+        if httpx is None:
+            raise RuntimeError('HTTPXTransport requires httpx. (pip install aio-upbit[httpx])')
+        self._client = httpx.AsyncClient(base_url=base_url, http2=http2, **kwargs)
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> Response:
+        res = await self._client.request(method, url, headers=headers)
+        return Response(res.status_code, res.headers, res.content, res.charset_encoding or 'utf-8')
+
+    async def close(self) -> None:
+        await self._client.aclose()
+
+
+class RecordingTransport(Transport):
+    """
+    Passes requests through to `transport` and keeps every response, for `ReplayTransport`.
+    """
+
+    __slots__ = ('transport', 'records')
+
+    def __init__(self, transport: Transport) -> None:
+        self.transport = transport
+        self.records: List[Tuple[str, str, Response]] = []
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> Response:
+        response = await self.transport.request(method, url, headers)
+        self.records.append(
+            (method, url, Response(response.status, dict(response.headers), response.content, response.encoding))
+        )
+        return response
+
+    async def close(self) -> None:
+        await self.transport.close()
+
+
+class ReplayTransport(Transport):
+    """
+    Serves recorded responses without a network.
+
+    Responses to the same request are served in the order they were added, and the last one is repeated.
+    A request that was never recorded gets a 404 response.
+    """
+
+    __slots__ = ('_responses', '_served')
+
+    def __init__(self, records: Iterable[Tuple[str, str, Response]] = ()) -> None:
+        self._responses: Dict[Tuple[str, str], List[Response]] = dict()
+        self._served: Dict[Tuple[str, str], int] = dict()
+        for method, url, response in records:
+            self.add(method, url, response)
+
+    def add(self, method: str, url: str, response: Response) -> None:
+        self._responses.setdefault((method.upper(), url), []).append(response)
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> Response:
+        key = (method.upper(), url)
+        responses = self._responses.get(key)
+        if not responses:
+            return Response(404, {}, b'{"error":{"name":"not_recorded"}}', 'utf-8')
+        served = self._served.get(key, 0)
+        self._served[key] = served + 1
+        return responses[min(served, len(responses) - 1)]
+
+
+class TransportRestClient(BaseRestClient):
+    """
+    `BaseRestClient` over a pluggable `Transport`, e.g. to compare HTTP stacks or to replay recorded responses.
+    The response cache, rate limiters and instrument of `BaseRestClient` apply as with `AioHTTPRestClient`,
+    except that `RequestMetrics.connection_acquire` and `connection_limit` are not measured.
+
+    The transport is bound at class level with `using()`.
+    """
+
+    __slots__ = ()
+
+    _transport: ClassVar[Optional[Transport]] = None
+
+    @classmethod
+    def using(cls: Type[_C], transport: Transport) -> Type[_C]:
+        """
+        A subclass bound to `transport`.
+        """
+        return cast(
+            Type[_C],
+            type(f'{type(transport).__name__}{cls.__name__}', (cls,), dict(__slots__=(), _transport=transport)),
+        )
+
+    @classmethod
+    async def _request(
+        cls,
+        method: str,
+        url: str,
+        session: Any,
+        limiter: Optional[rate_limit.RateLimiter],
+        trace: Optional[instrumentation.RequestTrace],
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> Tuple[bytes, str]:
+        if cls._transport is None:
+            raise RuntimeError(f'{cls.__name__} is not bound to a transport. (use {cls.__name__}.using())')
+        response = await cls._transport.request(method, url, headers)
+        cls._on_headers(response.status, url.partition('?')[0], response.headers, limiter, trace)
+        response.raise_for_status()
+        return response.content, response.encoding
+
+    @classmethod
+    def _is_not_found(cls, error: Exception) -> bool:
+        return isinstance(error, ResponseError) and error.status == 404
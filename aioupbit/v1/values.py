@@ -1,13 +1,16 @@
 from __future__ import annotations
 
 import datetime
+import sys
 from abc import ABCMeta
 from dataclasses import dataclass
 from decimal import Decimal
-from enum import IntEnum
-from typing import AbstractSet, Any, Mapping, Optional, Sequence, Type, TypeVar
+from enum import Enum, IntEnum
+from typing import AbstractSet, Any, Dict, Mapping, Optional, Sequence, Type, TypeVar, Union
 from uuid import UUID
 
+from typing_extensions import Final
+
 try:
     from zoneinfo import ZoneInfo  # type: ignore[import]
 except ImportError:
@@ -25,17 +28,86 @@ __all__ = (
     'Trade',
     'Tick',
     'Orderbook',
+    'MarketSnapshot',
     'Account',
     'OrderConfig',
     'Market',
     'MarketWithAccount',
     'Order',
     'OrderWithTrades',
+    'RemainingReq',
+)
+
+_KST = ZoneInfo('Asia/Seoul')
+
+_SelfValue = TypeVar('_SelfValue', bound='_BinarySerializable')
+_E = TypeVar('_E', bound=Enum)
+
+# market codes are interned so that equal tickers are the same object across rows and responses
+_intern = sys.intern
+
+
+class _EnumTable(Dict[Any, _E]):
+    """
+    Value to member table of an enum. A dict lookup is much cheaper than calling the enum.
+    Unknown values are passed to the enum, which raises the same `ValueError`.
+    """
+
+    __slots__ = ('enum_type',)
+
+    def __init__(self, enum_type: Type[_E], aliases: Optional[Mapping[Any, _E]] = None) -> None:
+        super().__init__((member.value, member) for member in enum_type)
+        if aliases is not None:
+            self.update(aliases)
+        self.enum_type = enum_type
+
+    def __missing__(self, value: Any) -> _E:
+        return self.enum_type(value)
+
+
+_MARKET_WARNINGS: Final[_EnumTable[constants.MarketWarning]] = _EnumTable(constants.MarketWarning)
+_CHANGES: Final[_EnumTable[constants.Change]] = _EnumTable(constants.Change)
+_ORDER_TYPES: Final[_EnumTable[constants.OrderType]] = _EnumTable(constants.OrderType)
+_ORDER_STATES: Final[_EnumTable[constants.OrderState]] = _EnumTable(constants.OrderState)
+# the exchange API uses lower case sides
+_SIDES: Final[_EnumTable[constants.Side]] = _EnumTable(
+    constants.Side, {side.value.lower(): side for side in constants.Side}
 )
 
 
+def _to_ms(value: datetime.datetime) -> int:
+    return round(value.timestamp() * 1000)
+
+
+def _to_optional_decimal(value: Any) -> Optional[Decimal]:
+    return None if value is None else Decimal(value)
+
+
+def _to_optional_str(value: Optional[Decimal]) -> Optional[str]:
+    return None if value is None else str(value)
+
+
+class _BinarySerializable:
+    __slots__ = ()
+
+    def to_bytes(self) -> bytes:
+        """
+        See `serialization.to_bytes()`.
+        """
+        # imported on use, as it loads rapidjson
+        from aioupbit.v1 import serialization
+
+        return serialization.to_bytes(self)
+
+    @classmethod
+    def from_bytes(cls: Type[_SelfValue], data: Union[bytes, bytearray, memoryview]) -> _SelfValue:
+        from aioupbit.v1 import serialization
+
+        return serialization.from_bytes(cls, data)
+
+
 @dataclass(frozen=True)
-class Ticker:
+class Ticker(_BinarySerializable):
     __slots__ = ('ticker', 'korean_name', 'english_name', 'warning')
 
     ticker: str
@@ -46,15 +118,23 @@ class Ticker:
     @classmethod
     def from_json(cls, json: Mapping[str, Any]) -> Ticker:
         return cls(
-            ticker=json['market'],
+            ticker=_intern(json['market']),
             korean_name=json['korean_name'],
             english_name=json['english_name'],
-            warning=constants.MarketWarning(json['market_warning']),
+            warning=_MARKET_WARNINGS[json['market_warning']],
+        )
+
+    def to_json(self) -> Dict[str, Any]:
+        return dict(
+            market=self.ticker,
+            korean_name=self.korean_name,
+            english_name=self.english_name,
+            market_warning=self.warning.value,
         )
 
 
 @dataclass(frozen=True)
-class BaseCandle(metaclass=ABCMeta):
+class BaseCandle(_BinarySerializable, metaclass=ABCMeta):
     __slots__ = (
         'ticker',
         'date_time',
@@ -77,6 +157,19 @@ class BaseCandle(metaclass=ABCMeta):
     acc_trade_price: Decimal
     acc_trade_volume: Decimal
 
+    def to_json(self) -> Dict[str, Any]:
+        return dict(
+            market=self.ticker,
+            candle_date_time_utc=self.date_time,
+            opening_price=self.opening_price,
+            high_price=self.high_price,
+            low_price=self.low_price,
+            trade_price=self.trade_price,
+            timestamp=_to_ms(self.latest_tick_timestamp),
+            candle_acc_trade_price=self.acc_trade_price,
+            candle_acc_trade_volume=self.acc_trade_volume,
+        )
+
 
 @dataclass(frozen=True)
 class MinCandle(BaseCandle):
@@ -97,7 +190,7 @@ class MinCandle(BaseCandle):
     @classmethod
     def from_json(cls, json: Mapping[str, Any]) -> MinCandle:
         return cls(
-            ticker=json['market'],
+            ticker=_intern(json['market']),
             date_time=json['candle_date_time_utc'],
             opening_price=json['opening_price'],
             high_price=json['high_price'],
@@ -106,9 +199,15 @@ class MinCandle(BaseCandle):
             latest_tick_timestamp=datetime.datetime.fromtimestamp(json['timestamp'] / 1000, datetime.timezone.utc),
             acc_trade_price=json['candle_acc_trade_price'],
             acc_trade_volume=json['candle_acc_trade_volume'],
-            unit=cls.Unit(json['unit']),
+            unit=_MIN_CANDLE_UNITS[json['unit']],
         )
 
+    def to_json(self) -> Dict[str, Any]:
+        return dict(super().to_json(), unit=self.unit.value)
+
+
+_MIN_CANDLE_UNITS: Final[_EnumTable[MinCandle.Unit]] = _EnumTable(MinCandle.Unit)
+
 
 @dataclass(frozen=True)
 class DayCandle(BaseCandle):
@@ -122,7 +221,7 @@ class DayCandle(BaseCandle):
     @classmethod
     def from_json(cls, json: Mapping[str, Any]) -> DayCandle:
         return cls(
-            ticker=json['market'],
+            ticker=_intern(json['market']),
             date_time=json['candle_date_time_utc'],
             opening_price=json['opening_price'],
             high_price=json['high_price'],
@@ -137,6 +236,17 @@ class DayCandle(BaseCandle):
             converted_trade_price=json.get('converted_trade_price'),
         )
 
+    def to_json(self) -> Dict[str, Any]:
+        json = dict(
+            super().to_json(),
+            prev_closing_price=self.prev_closing_price,
+            change_price=self.change_price,
+            change_rate=self.change_rate,
+        )
+        if self.converted_trade_price is not None:
+            json['converted_trade_price'] = self.converted_trade_price
+        return json
+
 
 _SelfWeekCandle = TypeVar('_SelfWeekCandle', bound='WeekCandle')
 
@@ -150,7 +260,7 @@ class WeekCandle(BaseCandle):
     @classmethod
     def from_json(cls: Type[_SelfWeekCandle], json: Mapping[str, Any]) -> _SelfWeekCandle:
         return cls(
-            ticker=json['market'],
+            ticker=_intern(json['market']),
             date_time=json['candle_date_time_utc'],
             opening_price=json['opening_price'],
             high_price=json['high_price'],
@@ -162,6 +272,9 @@ class WeekCandle(BaseCandle):
             first_day_of_period=json['first_day_of_period'],
         )
 
+    def to_json(self) -> Dict[str, Any]:
+        return dict(super().to_json(), first_day_of_period=self.first_day_of_period)
+
 
 @dataclass(frozen=True)
 class MonthCandle(WeekCandle):
@@ -169,7 +282,7 @@ class MonthCandle(WeekCandle):
 
 
 @dataclass(frozen=True)
-class Trade:
+class Trade(_BinarySerializable):
     __slots__ = (
         'ticker',
         'timestamp',
@@ -193,19 +306,31 @@ class Trade:
     @classmethod
     def from_json(cls, json: Mapping[str, Any]) -> Trade:
         return cls(
-            ticker=json['market'],
+            ticker=_intern(json['market']),
             timestamp=datetime.datetime.fromtimestamp(json['timestamp'] / 1000, datetime.timezone.utc),
             trade_price=json['trade_price'],
             trade_volume=json['trade_volume'],
             prev_closing_price=json['prev_closing_price'],
             change_price=json['change_price'],
-            side=constants.Side(json['ask_bid']),
+            side=_SIDES[json['ask_bid']],
             sequential_id=json['sequential_id'],
         )
 
+    def to_json(self) -> Dict[str, Any]:
+        return dict(
+            market=self.ticker,
+            timestamp=_to_ms(self.timestamp),
+            trade_price=self.trade_price,
+            trade_volume=self.trade_volume,
+            prev_closing_price=self.prev_closing_price,
+            change_price=self.change_price,
+            ask_bid=self.side.value,
+            sequential_id=self.sequential_id,
+        )
+
 
 @dataclass(frozen=True)
-class Tick:
+class Tick(_BinarySerializable):
     __slots__ = (
         'ticker',
         'trade_date_time',
@@ -257,14 +382,14 @@ class Tick:
     @classmethod
     def from_json(cls, json: Mapping[str, Any]) -> Tick:
         return cls(
-            ticker=json['market'],
-            trade_date_time=datetime.datetime.fromtimestamp(json['trade_timestamp'] / 1000, ZoneInfo('Asia/Seoul')),
+            ticker=_intern(json['market']),
+            trade_date_time=datetime.datetime.fromtimestamp(json['trade_timestamp'] / 1000, _KST),
             opening_price=json['opening_price'],
             high_price=json['high_price'],
             low_price=json['low_price'],
             trade_price=json['trade_price'],
             prev_closing_price=json['prev_closing_price'],
-            change=constants.Change(json['change']),
+            change=_CHANGES[json['change']],
             change_price=json['change_price'],
             change_rate=json['change_rate'],
             signed_change_price=json['signed_change_price'],
@@ -281,13 +406,39 @@ class Tick:
             timestamp=datetime.datetime.fromtimestamp(json['timestamp'] / 1000, datetime.timezone.utc),
         )
 
+    def to_json(self) -> Dict[str, Any]:
+        return dict(
+            market=self.ticker,
+            trade_timestamp=_to_ms(self.trade_date_time),
+            opening_price=self.opening_price,
+            high_price=self.high_price,
+            low_price=self.low_price,
+            trade_price=self.trade_price,
+            prev_closing_price=self.prev_closing_price,
+            change=self.change.value,
+            change_price=self.change_price,
+            change_rate=self.change_rate,
+            signed_change_price=self.signed_change_price,
+            signed_change_rate=self.signed_change_rate,
+            trade_volume=self.trade_volume,
+            acc_trade_price=self.acc_trade_price,
+            acc_trade_price_24h=self.acc_trade_price_24h,
+            acc_trade_volume=self.acc_trade_volume,
+            acc_trade_volume_24h=self.acc_trade_volume_24h,
+            highest_52_week_price=self.highest_52_week_price,
+            highest_52_week_date=self.highest_52_week_date,
+            lowest_52_week_price=self.lowest_52_week_price,
+            lowest_52_week_date=self.lowest_52_week_date,
+            timestamp=_to_ms(self.timestamp),
+        )
+
 
 @dataclass(frozen=True)
-class Orderbook:
+class Orderbook(_BinarySerializable):
     __slots__ = ('ticker', 'timestamp', 'total_ask_size', 'total_bid_size', 'orderbook_units')
 
     @dataclass(frozen=True)
-    class Unit:
+    class Unit(_BinarySerializable):
         __slots__ = ('ask_price', 'bid_price', 'ask_size', 'bid_size')
 
         ask_price: Decimal
@@ -304,6 +455,14 @@ class Orderbook:
                 bid_size=json['bid_size'],
             )
 
+        def to_json(self) -> Dict[str, Any]:
+            return dict(
+                ask_price=self.ask_price,
+                bid_price=self.bid_price,
+                ask_size=self.ask_size,
+                bid_size=self.bid_size,
+            )
+
     ticker: str
     timestamp: datetime.datetime
     total_ask_size: Decimal
@@ -313,16 +472,49 @@ class Orderbook:
     @classmethod
     def from_json(cls, json: Mapping[str, Any]) -> Orderbook:
         return cls(
-            ticker=json['market'],
-            timestamp=datetime.datetime.fromtimestamp(json['timestamp'] / 1000, ZoneInfo('Asia/Seoul')),
+            ticker=_intern(json['market']),
+            timestamp=datetime.datetime.fromtimestamp(json['timestamp'] / 1000, _KST),
             total_ask_size=json['total_ask_size'],
             total_bid_size=json['total_bid_size'],
             orderbook_units=tuple(map(cls.Unit.from_json, json['orderbook_units'])),
         )
 
+    def to_json(self) -> Dict[str, Any]:
+        return dict(
+            market=self.ticker,
+            timestamp=_to_ms(self.timestamp),
+            total_ask_size=self.total_ask_size,
+            total_bid_size=self.total_bid_size,
+            orderbook_units=[unit.to_json() for unit in self.orderbook_units],
+        )
+
 
 @dataclass(frozen=True)
-class Account:
+class MarketSnapshot(_BinarySerializable):
+    """
+    Tick and orderbook of a market taken together.
+    """
+
+    __slots__ = ('market', 'tick', 'orderbook')
+
+    market: Ticker
+    tick: Tick
+    orderbook: Orderbook
+
+    @classmethod
+    def from_json(cls, json: Mapping[str, Any]) -> MarketSnapshot:
+        return cls(
+            market=Ticker.from_json(json['market']),
+            tick=Tick.from_json(json['tick']),
+            orderbook=Orderbook.from_json(json['orderbook']),
+        )
+
+    def to_json(self) -> Dict[str, Any]:
+        return dict(market=self.market.to_json(), tick=self.tick.to_json(), orderbook=self.orderbook.to_json())
+
+
+@dataclass(frozen=True)
+class Account(_BinarySerializable):
     currency: constants.CurrencyCode
     balance: Decimal
     locked: Decimal
@@ -330,55 +522,231 @@ class Account:
     avg_buy_price_modified: bool
     unit_currency: constants.CurrencyCode
 
+    @classmethod
+    def from_json(cls, json: Mapping[str, Any]) -> Account:
+        return cls(
+            currency=json['currency'],
+            balance=Decimal(json['balance']),
+            locked=Decimal(json['locked']),
+            avg_buy_price=Decimal(json['avg_buy_price']),
+            avg_buy_price_modified=json['avg_buy_price_modified'],
+            unit_currency=json['unit_currency'],
+        )
+
+    @classmethod
+    def from_websocket(cls, json: Mapping[str, Any], previous: Optional[Account] = None) -> Account:
+        """
+        `json` is an item of `assets` of a `myAsset` event, which carries only the balances.
+        The other fields are kept from `previous`, or are zero in KRW for a new currency.
+        """
+        if previous is None:
+            return cls(
+                currency=json['currency'],
+                balance=Decimal(json['balance']),
+                locked=Decimal(json['locked']),
+                avg_buy_price=Decimal(0),
+                avg_buy_price_modified=False,
+                unit_currency='KRW',
+            )
+        return cls(
+            currency=previous.currency,
+            balance=Decimal(json['balance']),
+            locked=Decimal(json['locked']),
+            avg_buy_price=previous.avg_buy_price,
+            avg_buy_price_modified=previous.avg_buy_price_modified,
+            unit_currency=previous.unit_currency,
+        )
+
+    def to_json(self) -> Dict[str, Any]:
+        return dict(
+            currency=self.currency,
+            balance=str(self.balance),
+            locked=str(self.locked),
+            avg_buy_price=str(self.avg_buy_price),
+            avg_buy_price_modified=self.avg_buy_price_modified,
+            unit_currency=self.unit_currency,
+        )
+
 
 @dataclass(frozen=True)
-class OrderConfig:
+class OrderConfig(_BinarySerializable):
     fee: Decimal
     minimum: Decimal
     maximum: Decimal
-    unit_price: Decimal
+    # `None` if the market has no fixed price unit
+    unit_price: Optional[Decimal]
     currency: str
 
+    @classmethod
+    def from_json(cls, json: Mapping[str, Any], fee: Any, maximum: Any) -> OrderConfig:
+        """
+        `json` is the `bid` or `ask` object of the market, and `fee` and `maximum` come from the enclosing objects.
+        """
+        return cls(
+            fee=Decimal(fee),
+            minimum=Decimal(json['min_total']),
+            maximum=Decimal(maximum),
+            unit_price=_to_optional_decimal(json['price_unit']),
+            currency=json['currency'],
+        )
+
+    def to_json(self) -> Dict[str, Any]:
+        return dict(currency=self.currency, price_unit=_to_optional_str(self.unit_price), min_total=str(self.minimum))
+
 
 @dataclass(frozen=True)
-class Market:
+class Market(_BinarySerializable):
     ticker: str
     sell: OrderConfig
     buy: OrderConfig
     order_types: AbstractSet[constants.OrderType]
     order_sides: AbstractSet[constants.Side]
 
+    @classmethod
+    def from_json(cls, json: Mapping[str, Any]) -> Market:
+        """
+        `json` is the response of `/v1/orders/chance`.
+        """
+        market = json['market']
+        return cls(
+            ticker=_intern(market['id']),
+            sell=OrderConfig.from_json(market['ask'], json['ask_fee'], market['max_total']),
+            buy=OrderConfig.from_json(market['bid'], json['bid_fee'], market['max_total']),
+            order_types=frozenset(map(_ORDER_TYPES.__getitem__, market['order_types'])),
+            order_sides=frozenset(map(_SIDES.__getitem__, market['order_sides'])),
+        )
+
+    def to_json(self) -> Dict[str, Any]:
+        return dict(
+            bid_fee=str(self.buy.fee),
+            ask_fee=str(self.sell.fee),
+            market=dict(
+                id=self.ticker,
+                order_types=sorted(order_type.value for order_type in self.order_types),
+                order_sides=sorted(side.value.lower() for side in self.order_sides),
+                bid=self.buy.to_json(),
+                ask=self.sell.to_json(),
+                max_total=str(self.buy.maximum),
+            ),
+        )
+
 
 @dataclass(frozen=True)
-class MarketWithAccount:
+class MarketWithAccount(_BinarySerializable):
     market: Market
     bid_account: Account
     ask_account: Account
 
+    @classmethod
+    def from_json(cls, json: Mapping[str, Any]) -> MarketWithAccount:
+        return cls(
+            market=Market.from_json(json),
+            bid_account=Account.from_json(json['bid_account']),
+            ask_account=Account.from_json(json['ask_account']),
+        )
+
+    def to_json(self) -> Dict[str, Any]:
+        return dict(
+            self.market.to_json(), bid_account=self.bid_account.to_json(), ask_account=self.ask_account.to_json()
+        )
+
 
 @dataclass(frozen=True)
-class Order:
+class Order(_BinarySerializable):
     order_uuid: UUID
     side: constants.Side
     order_type: constants.OrderType
-    price: Decimal
+    # `None` for market sell orders
+    price: Optional[Decimal]
     state: constants.OrderState
     ticker: str
     created_at: datetime.datetime
-    volume: Decimal
-    remaining_volume: Decimal
+    # `None` for market buy orders, which are placed by total price
+    volume: Optional[Decimal]
+    remaining_volume: Optional[Decimal]
     reserved_fee: Decimal
     remaining_fee: Decimal
     paid_fee: Decimal
     locked: Decimal
     executed_volume: Decimal
     trade_count: int
+    # last field with a default, so that code constructing orders from before it was added keeps working
+    identifier: Optional[str] = None
+
+    @classmethod
+    def _fields_from_json(cls, json: Mapping[str, Any]) -> Dict[str, Any]:
+        return dict(
+            order_uuid=UUID(json['uuid']),
+            side=_SIDES[json['side']],
+            order_type=_ORDER_TYPES[json['ord_type']],
+            price=_to_optional_decimal(json['price']),
+            state=_ORDER_STATES[json['state']],
+            ticker=_intern(json['market']),
+            created_at=json['created_at'],
+            volume=_to_optional_decimal(json['volume']),
+            remaining_volume=_to_optional_decimal(json['remaining_volume']),
+            reserved_fee=Decimal(json['reserved_fee']),
+            remaining_fee=Decimal(json['remaining_fee']),
+            paid_fee=Decimal(json['paid_fee']),
+            locked=Decimal(json['locked']),
+            executed_volume=Decimal(json['executed_volume']),
+            trade_count=json['trades_count'],
+            identifier=json.get('identifier'),
+        )
+
+    @classmethod
+    def from_json(cls, json: Mapping[str, Any]) -> Order:
+        return cls(**cls._fields_from_json(json))
+
+    @classmethod
+    def from_websocket(cls, json: Mapping[str, Any]) -> Order:
+        """
+        `json` is a `myOrder` event of the WebSocket EXCHANGE API (in `DEFAULT` format).
+        """
+        return cls(
+            order_uuid=UUID(json['uuid']),
+            side=_SIDES[json['ask_bid']],
+            order_type=_ORDER_TYPES[json['order_type']],
+            price=_to_optional_decimal(json['price']),
+            state=_ORDER_STATES[json['state']],
+            ticker=_intern(json['code']),
+            created_at=datetime.datetime.fromtimestamp(json['order_timestamp'] / 1000, _KST),
+            volume=_to_optional_decimal(json['volume']),
+            remaining_volume=_to_optional_decimal(json['remaining_volume']),
+            reserved_fee=Decimal(json['reserved_fee']),
+            remaining_fee=Decimal(json['remaining_fee']),
+            paid_fee=Decimal(json['paid_fee']),
+            locked=Decimal(json['locked']),
+            executed_volume=Decimal(json['executed_volume']),
+            trade_count=json['trades_count'],
+            identifier=json.get('identifier'),
+        )
+
+    def to_json(self) -> Dict[str, Any]:
+        return dict(
+            uuid=str(self.order_uuid),
+            side=self.side.value.lower(),
+            ord_type=self.order_type.value,
+            price=_to_optional_str(self.price),
+            state=self.state.value,
+            market=self.ticker,
+            created_at=self.created_at,
+            volume=_to_optional_str(self.volume),
+            remaining_volume=_to_optional_str(self.remaining_volume),
+            reserved_fee=str(self.reserved_fee),
+            remaining_fee=str(self.remaining_fee),
+            paid_fee=str(self.paid_fee),
+            locked=str(self.locked),
+            executed_volume=str(self.executed_volume),
+            trades_count=self.trade_count,
+            identifier=self.identifier,
+        )
 
 
 @dataclass(frozen=True)
 class OrderWithTrades(Order):
     @dataclass(frozen=True)
-    class Trade:
+    class Trade(_BinarySerializable):
         ticker: str
         trade_uuid: UUID
         price: Decimal
@@ -387,4 +755,61 @@ class OrderWithTrades(Order):
         side: constants.Side
         created_at: datetime.datetime
 
-    trades: Sequence[Trade]
+        @classmethod
+        def from_json(cls, json: Mapping[str, Any]) -> OrderWithTrades.Trade:
+            return cls(
+                ticker=_intern(json['market']),
+                trade_uuid=UUID(json['uuid']),
+                price=Decimal(json['price']),
+                volume=Decimal(json['volume']),
+                funds=Decimal(json['funds']),
+                side=_SIDES[json['side']],
+                created_at=json['created_at'],
+            )
+
+        def to_json(self) -> Dict[str, Any]:
+            return dict(
+                market=self.ticker,
+                uuid=str(self.trade_uuid),
+                price=str(self.price),
+                volume=str(self.volume),
+                funds=str(self.funds),
+                side=self.side.value.lower(),
+                created_at=self.created_at,
+            )
+
+    # defaulted as it follows `Order.identifier`
+    trades: Sequence[Trade] = ()
+
+    @classmethod
+    def from_json(cls, json: Mapping[str, Any]) -> OrderWithTrades:
+        return cls(**cls._fields_from_json(json), trades=tuple(map(cls.Trade.from_json, json['trades'])))
+
+    def to_json(self) -> Dict[str, Any]:
+        return dict(super().to_json(), trades=[trade.to_json() for trade in self.trades])
+
+
+@dataclass(frozen=True)
+class RemainingReq(_BinarySerializable):
+    """https://docs.upbit.com/docs/user-request-guide"""
+
+    __slots__ = ('group', 'min', 'sec')
+
+    group: str
+    min: int
+    sec: int
+
+    @classmethod
+    def from_header(cls, header: str) -> Optional[RemainingReq]:
+        """
+        Parse `Remaining-Req` response header. (e.g. `group=default; min=1800; sec=29`)
+        Returns `None` if the header is malformed, so that a bad header never fails the response.
+        """
+        fields = dict(field.strip().partition('=')[::2] for field in header.split(';'))
+        try:
+            return cls(group=fields['group'], min=int(fields.get('min', 0)), sec=int(fields['sec']))
+        except (KeyError, ValueError):
+            return None
+
+    def to_header(self) -> str:
+        return f'group={self.group}; min={self.min}; sec={self.sec}'
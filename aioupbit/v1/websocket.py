@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import uuid
+from types import TracebackType
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Tuple, Type, Union
+
+import aiohttp
+import rapidjson
+from typing_extensions import Final, TypeAlias
+
+from aioupbit.v1 import values
+from aioupbit.v1.client import Client
+
+__all__ = ('ExchangeEvent', 'ExchangeStream', 'StreamError')
+
+ExchangeEvent: TypeAlias = Union[values.Order, values.Account]
+
+
+class StreamError(Exception):
+    """
+    Error message sent by the WebSocket server. (e.g. `INVALID_AUTH`)
+    """
+
+    def __init__(self, name: str, message: str) -> None:
+        super().__init__(name, message)
+        self.name = name
+        self.message = message
+
+
+class ExchangeStream:
+    """
+    Private WebSocket stream (EXCHANGE API) of order and asset events of the account of `client`.
+
+    `myOrder` events are yielded as `values.Order`, and each asset of `myAsset` events as `values.Account`.
+    As `myAsset` carries only the balances, the other fields of an account are kept from `accounts`
+    (e.g. the result of `Client.accounts()`) or from its previous event. `accounts` is updated as events arrive.
+    Order events are limited to `tickers` if given.
+
+    ::
+
+        async with ExchangeStream(client, accounts=await client.accounts()) as stream:
+            async for event in stream:
+                if isinstance(event, Order) and event.state is OrderState.DONE:
+                    ...
+    """
+
+    __slots__ = ('client', 'tickers', 'url', 'heartbeat', 'accounts', '_session', '_ws')
+
+    URL: Final[str] = 'wss://api.upbit.com/websocket/v1/private'
+
+    def __init__(
+        self,
+        client: Client,
+        tickers: Union[Iterable[values.Ticker], Iterable[str], None] = None,
+        accounts: Iterable[values.Account] = (),
+        url: str = URL,
+        heartbeat: float = 60,
+    ) -> None:
+        """
+        `heartbeat` is the ping interval in seconds. The server closes connections idle for 120 seconds.
+        """
+        self.client = client
+        self.tickers: Optional[Tuple[str, ...]] = (
+            None if tickers is None else tuple(map(client._get_ticker_code, tickers))
+        )
+        self.url = url
+        self.heartbeat = heartbeat
+        self.accounts: Dict[str, values.Account] = {account.currency: account for account in accounts}
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._ws: Optional[aiohttp.ClientWebSocketResponse] = None
+
+    def _subscription(self) -> str:
+        order: Dict[str, Any] = dict(type='myOrder')
+        if self.tickers is not None:
+            order['codes'] = list(self.tickers)
+        return rapidjson.dumps([dict(ticket=str(uuid.uuid4())), order, dict(type='myAsset'), dict(format='DEFAULT')])
+
+    async def connect(self) -> None:
+        """
+        Opens the connection authenticated with a token of `client`, and subscribes.
+        """
+        if self._ws is not None:
+            return
+        self._session = aiohttp.ClientSession()
+        try:
+            ws = await self._session.ws_connect(
+                self.url,
+                headers=dict(Authorization=self.client._gen_auth_token()),
+                heartbeat=self.heartbeat,
+            )
+            self._ws = ws  # type: ignore[assignment]
+            await ws.send_str(self._subscription())
+        except BaseException:
+            await self.close()
+            raise
+
+    async def close(self) -> None:
+        if self._ws is not None:
+            await self._ws.close()
+            self._ws = None
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self) -> ExchangeStream:
+        await self.connect()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        await self.close()
+
+    def parse(self, data: Union[str, bytes]) -> List[ExchangeEvent]:
+        """
+        Events of one message. Raises `StreamError` for an error message.
+        """
+        json = rapidjson.loads(data, number_mode=rapidjson.NM_NAN | rapidjson.NM_DECIMAL)
+        kind = json.get('type')
+        if kind == 'myOrder':
+            return [values.Order.from_websocket(json)]
+        if kind == 'myAsset':
+            accounts = self.accounts
+            events: List[ExchangeEvent] = []
+            for asset in json['assets']:
+                account = accounts[asset['currency']] = values.Account.from_websocket(
+                    asset, accounts.get(asset['currency'])
+                )
+                events.append(account)
+            return events
+        error = json.get('error')
+        if error is not None:
+            raise StreamError(error.get('name', ''), error.get('message', ''))
+        # e.g. the `{"status":"UP"}` reply of a status request
+        return []
+
+    async def __aiter__(self) -> AsyncIterator[ExchangeEvent]:
+        """
+        Yields events until the connection is closed.
+        """
+        if self._ws is None:
+            raise RuntimeError('stream is not connected')
+        async for message in self._ws:
+            if message.type is aiohttp.WSMsgType.BINARY or message.type is aiohttp.WSMsgType.TEXT:
+                for event in self.parse(message.data):
+                    yield event
+            elif message.type is aiohttp.WSMsgType.ERROR:
+                raise self._ws.exception() or aiohttp.ClientError('websocket error')
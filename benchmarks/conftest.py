@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+from typing import Any, Iterator
+
+import pytest
+import rapidjson
+
+DATA_DIR = Path(__file__).parent / 'data'
+
+NUMBER_MODES = dict(
+    native=rapidjson.NM_NATIVE,
+    decimal=rapidjson.NM_DECIMAL,
+    nan_decimal=rapidjson.NM_NAN | rapidjson.NM_DECIMAL,
+)
+
+
+class RecordedResponse:
+    """
+    Stand-in for `aiohttp.ClientResponse` that serves a recorded payload.
+    """
+
+    __slots__ = ('_content', '_encoding')
+
+    def __init__(self, content: bytes, encoding: str = 'utf-8') -> None:
+        self._content = content
+        self._encoding = encoding
+
+    async def read(self) -> bytes:
+        return self._content
+
+    def get_encoding(self) -> str:
+        return self._encoding
+
+
+def load_payload(name: str) -> bytes:
+    return (DATA_DIR / f'{name}.json').read_bytes()
+
+
+def load_json(name: str, number_mode: str = 'nan_decimal') -> Any:
+    """
+    Decodes a payload like the client does, with one of `NUMBER_MODES`.
+    """
+    return rapidjson.loads(
+        load_payload(name),
+        number_mode=NUMBER_MODES[number_mode],
+        datetime_mode=rapidjson.DM_ISO8601 | rapidjson.DM_NAIVE_IS_UTC,
+    )
+
+
+@pytest.fixture
+def event_loop() -> Iterator[asyncio.AbstractEventLoop]:
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
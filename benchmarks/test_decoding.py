@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import rapidjson
+import pytest
+
+from aioupbit.v1 import AioHTTPRestClient
+
+from .conftest import NUMBER_MODES, RecordedResponse, load_payload
+
+PAYLOADS = ('markets', 'ticker_krw', 'orderbook', 'candles_minutes_1', 'candles_days', 'trades_ticks')
+
+DATETIME_MODES = dict(
+    none=rapidjson.DM_NONE,
+    iso8601_utc=rapidjson.DM_ISO8601 | rapidjson.DM_NAIVE_IS_UTC,
+)
+
+
+@pytest.mark.parametrize('payload', PAYLOADS)
+@pytest.mark.parametrize('encoding', ('utf-8', 'UTF8', 'euc-kr'))
+def test_deserialize_json_response(benchmark, event_loop, payload, encoding) -> None:
+    """
+    `UTF8` takes the codec lookup path and `euc-kr` decodes to `str` before parsing.
+    """
+    content = load_payload(payload)
+    if encoding == 'euc-kr':
+        content = content.decode().encode(encoding)
+    res = RecordedResponse(content, encoding)
+
+    benchmark.group = f'deserialize-{payload}'
+    result = benchmark(lambda: event_loop.run_until_complete(AioHTTPRestClient._deserialize_json_response(res)))
+    assert result
+
+
+@pytest.mark.parametrize('payload', PAYLOADS)
+@pytest.mark.parametrize('number_mode', NUMBER_MODES)
+@pytest.mark.parametrize('datetime_mode', DATETIME_MODES)
+def test_loads(benchmark, payload, number_mode, datetime_mode) -> None:
+    content = load_payload(payload)
+
+    benchmark.group = f'loads-{payload}'
+    result = benchmark(
+        rapidjson.loads,
+        content,
+        number_mode=NUMBER_MODES[number_mode],
+        datetime_mode=DATETIME_MODES[datetime_mode],
+    )
+    assert result
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import datetime
+
+import yarl
+
+from aioupbit.v1 import endpoints
+from aioupbit.v1.aiohttp_client import AioHTTPRestClient
+from aioupbit.v1.values import MinCandle
+
+from .conftest import load_json
+
+_TO = datetime.datetime(2022, 2, 6, 9, 22, 30, tzinfo=datetime.timezone.utc)
+
+
+def test_markets_url_params(benchmark) -> None:
+    codes = [row['market'] for row in load_json('ticker_krw')]
+
+    def build() -> yarl.URL:
+        return yarl.URL('/v1/ticker').with_query(dict(markets=','.join(map(AioHTTPRestClient._get_ticker_code, codes))))
+
+    benchmark.group = 'request-url'
+    assert benchmark(build)
+
+
+def test_markets_url_template(benchmark) -> None:
+    codes = [row['market'] for row in load_json('ticker_krw')]
+
+    def build() -> yarl.URL:
+        return yarl.URL(endpoints.TICKER.url(AioHTTPRestClient._markets_query(codes)), encoded=True)
+
+    benchmark.group = 'request-url'
+    assert benchmark(build)
+
+
+def test_candles_url_params(benchmark) -> None:
+    def build() -> yarl.URL:
+        params = dict(market='KRW-BTC', count=200)
+        params['to'] = _TO.astimezone(datetime.timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+        return yarl.URL('/v1/candles/minutes/1').with_query(params)
+
+    benchmark.group = 'request-url'
+    assert benchmark(build)
+
+
+def test_candles_url_template(benchmark) -> None:
+    endpoint = endpoints.MIN_CANDLES[MinCandle.Unit.MIN1]
+
+    def build() -> yarl.URL:
+        return yarl.URL(endpoint.url(AioHTTPRestClient._candles_query('KRW-BTC', 200, _TO)), encoded=True)
+
+    benchmark.group = 'request-url'
+    assert benchmark(build)
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from aioupbit.v1.columnar import CandleBatch
+from aioupbit.v1.indicators import ATR, EMA, RSI, SMA, VWAP, IndicatorEngine
+from aioupbit.v1.values import MinCandle
+
+from .conftest import load_json
+
+_FACTORIES = dict(sma=lambda: SMA(20), ema=lambda: EMA(20), rsi=RSI, atr=ATR, vwap=VWAP)
+
+
+def _candles() -> list:
+    return [MinCandle.from_json(row) for row in reversed(load_json('candles_minutes_1'))]
+
+
+def test_indicators_update(benchmark) -> None:
+    candles = _candles()
+
+    def compute() -> IndicatorEngine:
+        engine = IndicatorEngine(_FACTORIES)
+        engine.update_many(candles)
+        return engine
+
+    benchmark.group = 'indicators'
+    assert benchmark(compute)
+
+
+def test_indicators_batch(benchmark) -> None:
+    batch = CandleBatch.from_candles(_candles())
+
+    def compute() -> dict:
+        return IndicatorEngine(_FACTORIES).batch(batch, MinCandle.Unit.MIN1)
+
+    benchmark.group = 'indicators'
+    assert benchmark(compute)
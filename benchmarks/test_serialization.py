@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import pytest
+
+from aioupbit.v1 import serialization
+from aioupbit.v1.values import MinCandle, Orderbook, Tick, Trade
+
+from .conftest import load_json
+
+VALUE_TYPES = (
+    ('ticker_krw', Tick),
+    ('orderbook', Orderbook),
+    ('candles_minutes_1', MinCandle),
+    ('trades_ticks', Trade),
+)
+
+
+@pytest.mark.parametrize(('payload', 'value_type'), VALUE_TYPES)
+def test_encode_many(benchmark, payload, value_type) -> None:
+    rows = tuple(map(value_type.from_json, load_json(payload)))
+
+    benchmark.group = 'encode-payload'
+    assert benchmark(serialization.encode_many, rows)
+
+
+@pytest.mark.parametrize(('payload', 'value_type'), VALUE_TYPES)
+def test_decode_many(benchmark, payload, value_type) -> None:
+    rows = tuple(map(value_type.from_json, load_json(payload)))
+    data = serialization.encode_many(rows)
+
+    benchmark.group = 'decode-payload'
+    assert len(rows) == len(benchmark(serialization.decode_many, value_type, data))
+
+
+@pytest.mark.parametrize(('payload', 'value_type'), VALUE_TYPES)
+def test_dumps(benchmark, payload, value_type) -> None:
+    rows = tuple(map(value_type.from_json, load_json(payload)))
+
+    benchmark.group = 'encode-payload'
+    assert benchmark(serialization.dumps, rows)
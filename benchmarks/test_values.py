@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import pytest
+
+from aioupbit.v1.values import DayCandle, MinCandle, Orderbook, Tick, Ticker, Trade
+
+from .conftest import NUMBER_MODES, load_json
+
+VALUE_TYPES = (
+    ('markets', Ticker),
+    ('ticker_krw', Tick),
+    ('orderbook', Orderbook),
+    ('candles_minutes_1', MinCandle),
+    ('candles_days', DayCandle),
+    ('trades_ticks', Trade),
+)
+
+
+@pytest.mark.parametrize(('payload', 'value_type'), VALUE_TYPES)
+def test_from_json_row(benchmark, payload, value_type) -> None:
+    row = load_json(payload)[0]
+
+    benchmark.group = 'from_json-row'
+    assert benchmark(value_type.from_json, row)
+
+
+@pytest.mark.parametrize(('payload', 'value_type'), VALUE_TYPES)
+@pytest.mark.parametrize('number_mode', NUMBER_MODES)
+def test_from_json_payload(benchmark, payload, value_type, number_mode) -> None:
+    """
+    Value objects built from each number mode of `test_decoding`, since `Decimal` and `float` fields convert differently.
+    """
+    rows = load_json(payload, number_mode)
+
+    benchmark.group = f'from_json-{payload}'
+    assert len(rows) == len(benchmark(lambda: tuple(map(value_type.from_json, rows))))
+
+
+def test_orderbook_unit_from_json(benchmark) -> None:
+    unit = load_json('orderbook')[0]['orderbook_units'][0]
+
+    benchmark.group = 'from_json-row'
+    assert benchmark(Orderbook.Unit.from_json, unit)
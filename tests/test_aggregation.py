@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+from datetime import date, datetime, timezone
+from decimal import Decimal
+
+from aioupbit.v1.aggregation import CandleAggregator
+from aioupbit.v1.constants import Side
+from aioupbit.v1.values import DayCandle, MinCandle, MonthCandle, Trade, WeekCandle
+
+
+def _trade(timestamp: datetime, price: str, volume: str, sequential_id: int) -> Trade:
+    return Trade(
+        ticker='KRW-BTC',
+        timestamp=timestamp,
+        trade_price=Decimal(price),
+        trade_volume=Decimal(volume),
+        prev_closing_price=Decimal('100'),
+        change_price=Decimal(price) - Decimal('100'),
+        side=Side.BID,
+        sequential_id=sequential_id,
+    )
+
+
+class TestCandleAggregator:
+    def test_minute_bars(self) -> None:
+        closed = []
+        aggregator = CandleAggregator((MinCandle.Unit.MIN1, MinCandle.Unit.MIN3), on_close=closed.append)
+
+        aggregator.update_many(
+            (
+                _trade(datetime(2022, 2, 6, 9, 1, 30, tzinfo=timezone.utc), '103', '1', 3),
+                _trade(datetime(2022, 2, 6, 9, 1, 10, tzinfo=timezone.utc), '101', '2', 2),
+                _trade(datetime(2022, 2, 6, 9, 0, 5, tzinfo=timezone.utc), '102', '1', 1),
+            )
+        )
+        assert [
+            MinCandle(
+                ticker='KRW-BTC',
+                date_time=datetime(2022, 2, 6, 9, 0, tzinfo=timezone.utc),
+                opening_price=Decimal('102'),
+                high_price=Decimal('102'),
+                low_price=Decimal('102'),
+                trade_price=Decimal('102'),
+                latest_tick_timestamp=datetime(2022, 2, 6, 9, 0, 5, tzinfo=timezone.utc),
+                acc_trade_price=Decimal('102'),
+                acc_trade_volume=Decimal('1'),
+                unit=MinCandle.Unit.MIN1,
+            )
+        ] == closed
+
+        assert MinCandle(
+            ticker='KRW-BTC',
+            date_time=datetime(2022, 2, 6, 9, 0, tzinfo=timezone.utc),
+            opening_price=Decimal('102'),
+            high_price=Decimal('103'),
+            low_price=Decimal('101'),
+            trade_price=Decimal('103'),
+            latest_tick_timestamp=datetime(2022, 2, 6, 9, 1, 30, tzinfo=timezone.utc),
+            acc_trade_price=Decimal('407'),
+            acc_trade_volume=Decimal('4'),
+            unit=MinCandle.Unit.MIN3,
+        ) == aggregator.current('KRW-BTC', MinCandle.Unit.MIN3)
+
+        # duplicated trade from overlapping polling is ignored
+        aggregator.update(_trade(datetime(2022, 2, 6, 9, 1, 30, tzinfo=timezone.utc), '103', '1', 3))
+        assert Decimal('4') == aggregator.current('KRW-BTC', MinCandle.Unit.MIN3).acc_trade_volume
+
+        assert 2 == len(aggregator.flush(datetime(2022, 2, 6, 9, 3, tzinfo=timezone.utc)))
+        assert 3 == len(closed)
+        assert aggregator.current('KRW-BTC', MinCandle.Unit.MIN1) is None
+
+    def test_late_trade_after_flush(self) -> None:
+        closed = []
+        aggregator = CandleAggregator((MinCandle.Unit.MIN1, MinCandle.Unit.MIN3), on_close=closed.append)
+        aggregator.update(_trade(datetime(2022, 2, 6, 9, 1, 10, tzinfo=timezone.utc), '101', '1', 1))
+        assert [datetime(2022, 2, 6, 9, 1, tzinfo=timezone.utc)] == [
+            candle.date_time for candle in aggregator.flush(datetime(2022, 2, 6, 9, 2, tzinfo=timezone.utc))
+        ]
+
+        # the closed 09:01 bar is not reopened, while the 09:00 bar of 3 minutes is still open
+        aggregator.update(_trade(datetime(2022, 2, 6, 9, 1, 50, tzinfo=timezone.utc), '102', '1', 2))
+        assert 1 == aggregator.late_trades
+        assert aggregator.current('KRW-BTC', MinCandle.Unit.MIN1) is None
+        assert Decimal('2') == aggregator.current('KRW-BTC', MinCandle.Unit.MIN3).acc_trade_volume
+
+        aggregator.update(_trade(datetime(2022, 2, 6, 9, 2, 10, tzinfo=timezone.utc), '103', '1', 3))
+        aggregator.flush(datetime(2022, 2, 6, 9, 3, tzinfo=timezone.utc))
+        assert [
+            (MinCandle.Unit.MIN1, datetime(2022, 2, 6, 9, 1, tzinfo=timezone.utc)),
+            (MinCandle.Unit.MIN1, datetime(2022, 2, 6, 9, 2, tzinfo=timezone.utc)),
+            (MinCandle.Unit.MIN3, datetime(2022, 2, 6, 9, 0, tzinfo=timezone.utc)),
+        ] == sorted((candle.unit, candle.date_time) for candle in closed)
+
+    def test_seed(self) -> None:
+        closed = []
+        aggregator = CandleAggregator((MinCandle.Unit.MIN1,), on_close=closed.append)
+        aggregator.seed(
+            MinCandle(
+                ticker='KRW-BTC',
+                date_time=datetime(2022, 2, 6, 9, 0, tzinfo=timezone.utc),
+                opening_price=Decimal('100'),
+                high_price=Decimal('105'),
+                low_price=Decimal('99'),
+                trade_price=Decimal('104'),
+                latest_tick_timestamp=datetime(2022, 2, 6, 9, 0, 20, tzinfo=timezone.utc),
+                acc_trade_price=Decimal('1000'),
+                acc_trade_volume=Decimal('10'),
+                unit=MinCandle.Unit.MIN1,
+            )
+        )
+
+        aggregator.update(_trade(datetime(2022, 2, 6, 9, 0, 10, tzinfo=timezone.utc), '90', '1', 1))
+        aggregator.update(_trade(datetime(2022, 2, 6, 9, 0, 30, tzinfo=timezone.utc), '106', '1', 2))
+        candle = aggregator.current('KRW-BTC', MinCandle.Unit.MIN1)
+        assert (Decimal('100'), Decimal('106'), Decimal('99'), Decimal('106')) == (
+            candle.opening_price,
+            candle.high_price,
+            candle.low_price,
+            candle.trade_price,
+        )
+        assert Decimal('11') == candle.acc_trade_volume
+        assert not closed
+
+    def test_periods(self) -> None:
+        aggregator = CandleAggregator(tuple(CandleAggregator.Period))
+        aggregator.update(_trade(datetime(2022, 2, 6, 9, 0, tzinfo=timezone.utc), '110', '2', 1))
+
+        day = aggregator.current('KRW-BTC', CandleAggregator.Period.DAY)
+        assert isinstance(day, DayCandle)
+        assert datetime(2022, 2, 6, tzinfo=timezone.utc) == day.date_time
+        assert (Decimal('100'), Decimal('10'), Decimal('0.1')) == (
+            day.prev_closing_price,
+            day.change_price,
+            day.change_rate,
+        )
+
+        week = aggregator.current('KRW-BTC', CandleAggregator.Period.WEEK)
+        assert isinstance(week, WeekCandle)
+        assert date(2022, 1, 31) == week.first_day_of_period
+
+        month = aggregator.current('KRW-BTC', CandleAggregator.Period.MONTH)
+        assert isinstance(month, MonthCandle)
+        assert date(2022, 2, 1) == month.first_day_of_period
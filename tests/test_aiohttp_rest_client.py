@@ -0,0 +1,302 @@
+from __future__ import annotations
+
+import asyncio
+import datetime
+import uuid
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, List, Type
+
+import aiohttp
+import pytest
+from aiohttp import web
+
+from aioupbit.v1 import (
+    AioHTTPRestClient,
+    DayCandle,
+    MinCandle,
+    MonthCandle,
+    Orderbook,
+    OrderState,
+    RateLimiter,
+    RateLimitGroup,
+    RequestMetrics,
+    ResponseCache,
+    Tick,
+    Ticker,
+    Trade,
+    WeekCandle,
+)
+from aioupbit.v1 import endpoints
+from aioupbit.v1.testing import FakeUpbitServer
+from aioupbit.v1.testing.loadtest import SCENARIOS, run_load_test
+
+
+@asynccontextmanager
+async def _serve(path: str, remaining_req: str) -> AsyncIterator[Type[AioHTTPRestClient]]:
+    """
+    Client class of a server that answers GET `path` with `[]` and the given `Remaining-Req` header.
+    """
+
+    async def handler(request: web.Request) -> web.Response:
+        return web.json_response([], headers={'Remaining-Req': remaining_req})
+
+    app = web.Application()
+    app.router.add_get(path, handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    try:
+        await web.TCPSite(runner, '127.0.0.1', 0).start()
+        host, port = runner.addresses[0][:2]
+        yield type('Client', (AioHTTPRestClient,), dict(__slots__=(), BASE_URL=f'http://{host}:{port}'))
+    finally:
+        await runner.cleanup()
+
+
+def _run_with_server(client_test, **kwargs) -> None:
+    async def main() -> None:
+        async with FakeUpbitServer(market_count=30, **kwargs) as server:
+            await client_test(server.client_class(), server)
+
+    asyncio.run(main())
+
+
+class TestQuotation:
+    def test_markets(self) -> None:
+        async def client_test(client, server) -> None:
+            markets = tuple(await client.markets())
+            assert 30 == len(markets)
+            assert all(isinstance(market, Ticker) for market in markets)
+            assert tuple(server.market_codes) == tuple(market.ticker for market in markets)
+
+        _run_with_server(client_test)
+
+    def test_candles(self) -> None:
+        to = datetime.datetime(2022, 2, 6, 9, 22, 30, tzinfo=datetime.timezone.utc)
+
+        async def client_test(client, server) -> None:
+            candles = tuple(await client.candles('KRW-C0000', MinCandle.Unit.MIN5, count=200, to=to))
+            assert 200 == len(candles)
+            assert datetime.datetime(2022, 2, 6, 9, 20, tzinfo=datetime.timezone.utc) == candles[0].date_time
+            assert all(candle.unit is MinCandle.Unit.MIN5 for candle in candles)
+
+            assert isinstance(next(iter(await client.candles_day('KRW-C0000', to=to))), DayCandle)
+            assert isinstance(next(iter(await client.candles_week('KRW-C0000', to=to))), WeekCandle)
+            assert isinstance(next(iter(await client.candles_month('KRW-C0000', to=to))), MonthCandle)
+
+        _run_with_server(client_test)
+
+    def test_latest_trades(self) -> None:
+        async def client_test(client, server) -> None:
+            trades = tuple(await client.latest_trades('KRW-C0000', count=50))
+            assert 50 == len(trades)
+            assert all(isinstance(trade, Trade) for trade in trades)
+
+            cursor = trades[-1].sequential_id
+            older = tuple(await client.latest_trades('KRW-C0000', count=50, cursor=cursor))
+            assert all(trade.sequential_id < cursor for trade in older)
+
+        _run_with_server(client_test)
+
+    def test_latest_tick_and_orderbook(self) -> None:
+        async def client_test(client, server) -> None:
+            markets = server.market_codes[:10]
+            ticks = tuple(await client.latest_tick(markets))
+            assert tuple(markets) == tuple(tick.ticker for tick in ticks)
+            assert all(isinstance(tick, Tick) for tick in ticks)
+
+            orderbooks = tuple(await client.orderbook(markets))
+            assert tuple(markets) == tuple(orderbook.ticker for orderbook in orderbooks)
+            assert all(isinstance(orderbook, Orderbook) for orderbook in orderbooks)
+            assert all(15 == len(orderbook.orderbook_units) for orderbook in orderbooks)
+
+        _run_with_server(client_test)
+
+    def test_too_many_requests(self) -> None:
+        async def client_test(client, server) -> None:
+            with pytest.raises(aiohttp.ClientResponseError) as e:
+                await client.markets()
+            assert 429 == e.value.status
+
+        _run_with_server(client_test, error_rate=1)
+
+
+class TestCandlesMany:
+    def test_stream(self) -> None:
+        async def client_test(client, server) -> None:
+            markets = server.market_codes[:12]
+            received = dict()
+            async for ticker, candles in client.candles_many(markets, MinCandle.Unit.MIN3, count=5):
+                received[ticker] = candles
+            assert set(markets) == set(received)
+            assert all(5 == len(candles) for candles in received.values())
+            assert all(candle.ticker == ticker for ticker, candles in received.items() for candle in candles)
+            assert 12 == sum(server.requests.values())
+
+        _run_with_server(client_test, enforce_rate_limit=True)
+
+    def test_batch(self) -> None:
+        async def client_test(client, server) -> None:
+            markets = server.market_codes[:3]
+            batch = await client.candles_batch(markets, count=4)
+            assert 12 == len(batch)
+            assert set(markets) == set(batch.offsets)
+            for ticker, (start, stop) in batch.offsets.items():
+                assert 4 == stop - start
+                assert all(ticker == code for code in batch.tickers[start:stop])
+                assert list(batch.timestamps[start:stop]) == sorted(batch.timestamps[start:stop])
+
+        _run_with_server(client_test)
+
+
+class TestSnapshot:
+    def test_snapshot(self) -> None:
+        async def client_test(client, server) -> None:
+            client.MAX_MARKETS_QUERY_LENGTH = 40
+            snapshot = await client.snapshot('KRW')
+            krw = [code for code in server.market_codes if code.startswith('KRW-')]
+            assert krw == list(snapshot)
+            assert all(
+                ticker == market.market.ticker == market.tick.ticker == market.orderbook.ticker
+                for ticker, market in snapshot.items()
+            )
+            # 10 KRW markets of 9 characters and a comma, 4 per request
+            assert 3 == server.requests['/v1/ticker'] == server.requests['/v1/orderbook']
+
+            assert 30 == len(await client.snapshot(None))
+            assert 1 == server.requests['/v1/market/all']
+
+        _run_with_server(client_test)
+
+    def test_class_level_cache(self) -> None:
+        async def client_test(client, server) -> None:
+            response_cache = ResponseCache()
+            await client.set_class_level_cache(response_cache)
+            # the market list of snapshot() shares the cache of markets()
+            assert 30 == len(tuple(await client.markets()))
+            assert 30 == len(await client.snapshot(None))
+            assert 30 == len(await client.snapshot(None))
+            assert 2 == response_cache.hits['markets']
+
+        _run_with_server(client_test)
+
+
+class TestInstrumentation:
+    def test_metrics(self) -> None:
+        reported: List[RequestMetrics] = []
+
+        async def client_test(client, server) -> None:
+            await client.set_class_level_instrument(reported.append)
+            try:
+                assert 30 == len(tuple(await client.markets()))
+            finally:
+                await client.set_class_level_instrument(None)
+            assert 30 == len(tuple(await client.markets()))
+
+        _run_with_server(client_test)
+
+        assert 1 == len(reported)
+        metrics = reported[0]
+        assert 'markets' == metrics.endpoint
+        assert '/v1/market/all' == metrics.path
+        assert 200 == metrics.status
+        assert metrics.bytes_received > 0
+        assert metrics.remaining_req is not None
+        assert 'market' == metrics.remaining_req.group
+        assert 100 == metrics.connection_limit
+        assert (
+            min(
+                metrics.connection_acquire,
+                metrics.time_to_first_byte,
+                metrics.body_read,
+                metrics.decode,
+                metrics.construct,
+            )
+            >= 0
+        )
+
+    def test_malformed_remaining_req(self) -> None:
+        reported: List[RequestMetrics] = []
+
+        async def main() -> None:
+            async with _serve('/v1/market/all', 'group=market; min=; sec=unknown') as client:
+                limiter = RateLimiter.for_group(RateLimitGroup.MARKET)
+                # a bad header does not fail the response
+                assert () == tuple(await client._fetch(endpoints.MARKETS, None, dict, limiter=limiter))
+                await client.set_class_level_instrument(reported.append)
+                assert () == tuple(await client.markets())
+
+        asyncio.run(main())
+        assert [None] == [metrics.remaining_req for metrics in reported]
+
+
+class TestExchange:
+    def test_orders(self) -> None:
+        order_uuids = [uuid.UUID(int=i, version=4) for i in range(3)]
+
+        async def client_test(client, server) -> None:
+            client = client('access', 'secret' * 8)
+            try:
+                orders = await client.orders(uuids=order_uuids, states=[OrderState.DONE, OrderState.CANCEL])
+            finally:
+                await client.close()
+            assert order_uuids == [order.order_uuid for order in orders]
+            assert [OrderState.DONE, OrderState.CANCEL, OrderState.DONE] == [order.state for order in orders]
+            assert 1 == server.requests['/v1/orders']
+
+        _run_with_server(client_test)
+
+    def test_account_and_order(self) -> None:
+        order_uuid = uuid.UUID(int=7, version=4)
+
+        async def client_test(client, server) -> None:
+            client = client('access', 'secret' * 8)
+            try:
+                assert ['KRW', 'BTC', 'ETH'] == [account.currency for account in await client.accounts()]
+                assert 'KRW-C0001' == (await client.market_with_account('KRW-C0001')).market.ticker
+                assert order_uuid == (await client.get_order(order_uuid=order_uuid)).order_uuid
+                assert 'my-order' == (await client.get_order(order_id='my-order')).identifier
+                await client.cancel_order(order_uuid=order_uuid)
+                with pytest.raises(TypeError):
+                    await client.cancel_order()
+            finally:
+                await client.close()
+            assert 3 == server.requests['/v1/order']
+
+        _run_with_server(client_test)
+
+    def test_exchange_rate_limiter(self) -> None:
+        async def main() -> None:
+            async with _serve('/v1/orders', 'group=default; min=0; sec=0') as client_class:
+                client = client_class('access', 'secret' * 8)
+                try:
+                    assert 30 == client.exchange_rate_limiter(RateLimitGroup.DEFAULT).available()
+                    assert () == await client.orders()
+                    # the server reported that the budget of the key is used up
+                    assert 0 == client.exchange_rate_limiter(RateLimitGroup.DEFAULT).available()
+                finally:
+                    await client.close()
+
+        asyncio.run(main())
+
+    def test_orders_limit(self) -> None:
+        async def client_test(client, server) -> None:
+            client = client('access', 'secret' * 8)
+            try:
+                assert 100 == len(await client.orders())
+                assert 7 == len(await client.orders(state=OrderState.DONE, limit=7))
+            finally:
+                await client.close()
+
+        _run_with_server(client_test)
+
+
+class TestLoadTest:
+    def test_report(self) -> None:
+        async def client_test(client, server) -> None:
+            report = await run_load_test(client, SCENARIOS['latest_tick'], server.market_codes, 4, 20)
+            assert 20 == report.requests
+            assert 0 == report.errors
+            assert 0 < report.p50 <= report.p90 <= report.p99 <= report.max
+            assert report.throughput > 0
+
+        _run_with_server(client_test)
@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import asyncio
+import datetime
+import math
+
+from aioupbit.v1 import endpoints
+from aioupbit.v1.cache import CacheEntry, DiskCacheBackend, MemoryCacheBackend, ResponseCache
+from aioupbit.v1.testing import FakeUpbitServer
+from aioupbit.v1.values import MinCandle
+
+_NOW = datetime.datetime(2022, 2, 6, 9, 22, 30, tzinfo=datetime.timezone.utc).timestamp()
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = _NOW
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestMemoryCacheBackend:
+    def test_lru(self) -> None:
+        backend = MemoryCacheBackend(max_entries=2)
+        for key in ('a', 'b'):
+            backend.set(key, CacheEntry(math.inf, key.encode(), 'utf-8'))
+        assert backend.get('a') is not None
+        backend.set('c', CacheEntry(math.inf, b'c', 'utf-8'))
+
+        assert 2 == len(backend)
+        assert 1 == backend.evictions
+        assert backend.get('b') is None
+        assert b'a' == backend.get('a').content
+
+
+class TestDiskCacheBackend:
+    def test_persistent(self, tmp_path) -> None:
+        backend = DiskCacheBackend(tmp_path, max_entries=2)
+        backend.set('/v1/ticker?markets=KRW-BTC', CacheEntry(_NOW, b'[1]', 'euc-kr'))
+        backend.set('/v1/market/all', CacheEntry(math.inf, b'[2]', 'utf-8'))
+        backend.set('/v1/market/all', CacheEntry(math.inf, b'[3]', 'utf-8'))
+
+        reopened = DiskCacheBackend(tmp_path, max_entries=2)
+        assert 2 == len(reopened)
+        assert CacheEntry(_NOW, b'[1]', 'euc-kr') == reopened.get('/v1/ticker?markets=KRW-BTC')
+        assert CacheEntry(math.inf, b'[3]', 'utf-8') == reopened.get('/v1/market/all')
+
+        reopened.set('/v1/orderbook?markets=KRW-BTC', CacheEntry(math.inf, b'[4]', 'utf-8'))
+        assert reopened.get('/v1/ticker?markets=KRW-BTC') is None
+        assert 2 == len(list(tmp_path.glob('*.cache')))
+
+        reopened.delete('/v1/market/all')
+        assert reopened.get('/v1/market/all') is None
+        assert 1 == len(list(tmp_path.glob('*.cache')))
+
+
+class TestResponseCache:
+    def test_ttl(self) -> None:
+        clock = _Clock()
+        cache = ResponseCache(ttls=dict(latest_tick=0.5), clock=clock)
+        cache.put(endpoints.MARKETS, 'isDetails=true', b'[]', 'utf-8')
+        cache.put(endpoints.TICKER, 'markets=KRW-BTC', b'[]', 'utf-8')
+        cache.put(endpoints.ORDERBOOK, 'markets=KRW-BTC', b'[]', 'utf-8')
+
+        assert cache.get(endpoints.MARKETS, 'isDetails=true') is not None
+        assert cache.get(endpoints.TICKER, 'markets=KRW-BTC') is not None
+        # not cached by default
+        assert cache.get(endpoints.ORDERBOOK, 'markets=KRW-BTC') is None
+        assert 2 == len(cache.backend)
+
+        clock.now += 1
+        assert cache.get(endpoints.MARKETS, 'isDetails=true') is not None
+        assert cache.get(endpoints.TICKER, 'markets=KRW-BTC') is None
+        assert dict(markets=2, latest_tick=1) == cache.hits
+        assert dict(latest_tick=1) == cache.misses
+        assert 0.75 == cache.hit_rate
+
+    def test_closed_candles(self) -> None:
+        clock = _Clock()
+        cache = ResponseCache(clock=clock)
+        candles = endpoints.MIN_CANDLES[MinCandle.Unit.MIN1]
+        closed = 'market=KRW-BTC&count=200&to=2022-02-06T09:00:00Z'
+        recent = 'market=KRW-BTC&count=200&to=2022-02-06T09:22:25Z'
+        latest = 'market=KRW-BTC&count=200'
+        for query in (closed, recent, latest):
+            cache.put(candles, query, b'[]', 'utf-8')
+
+        clock.now += 365 * 24 * 60 * 60
+        assert math.inf == cache.get(candles, closed).expires
+        assert cache.get(candles, recent) is None
+        assert cache.get(candles, latest) is None
+
+    def test_forming_candles(self) -> None:
+        clock = _Clock()
+        cache = ResponseCache(clock=clock)
+        # pages with `to` inside the current period include its forming candle
+        forming = (
+            (endpoints.DAY_CANDLES, '2022-02-06T09:00:00Z'),
+            (endpoints.MIN_CANDLES[MinCandle.Unit.MIN240], '2022-02-06T09:22:00Z'),
+            (endpoints.MIN_CANDLES[MinCandle.Unit.MIN5], '2022-02-06T09:22:00Z'),
+            (endpoints.WEEK_CANDLES, '2022-02-01T00:00:00Z'),
+            (endpoints.MONTH_CANDLES, '2022-02-01T00:00:01Z'),
+        )
+        closed = (
+            (endpoints.DAY_CANDLES, '2022-02-06T00:00:00Z'),
+            (endpoints.MIN_CANDLES[MinCandle.Unit.MIN240], '2022-02-06T08:00:00Z'),
+            (endpoints.MIN_CANDLES[MinCandle.Unit.MIN5], '2022-02-06T09:20:00Z'),
+            (endpoints.WEEK_CANDLES, '2022-01-31T00:00:00Z'),
+            (endpoints.MONTH_CANDLES, '2022-02-01T00:00:00Z'),
+        )
+        for endpoint, to in forming:
+            assert 1 == cache.ttl(endpoint, f'market=KRW-BTC&count=200&to={to}', clock.now)
+        for endpoint, to in closed:
+            assert math.inf == cache.ttl(endpoint, f'market=KRW-BTC&count=200&to={to}', clock.now)
+
+        # a page with a forming candle expires
+        query = 'market=KRW-BTC&count=200&to=2022-02-06T09:00:00Z'
+        cache.put(endpoints.DAY_CANDLES, query, b'[]', 'utf-8')
+        assert cache.get(endpoints.DAY_CANDLES, query) is not None
+        clock.now += 1
+        assert cache.get(endpoints.DAY_CANDLES, query) is None
+
+    def test_client(self) -> None:
+        async def main() -> None:
+            async with FakeUpbitServer(market_count=5, refresh_interval=3600) as server:
+                client = server.client_class()
+                response_cache = ResponseCache(ttls=dict(latest_tick=60))
+                await client.set_class_level_cache(response_cache)
+                codes = server.market_codes[:2]
+                to = datetime.datetime(2022, 2, 6, tzinfo=datetime.timezone.utc)
+
+                for _ in range(3):
+                    markets = tuple(await client.markets())
+                    candles = tuple(await client.candles(codes[0], count=10, to=to))
+                    ticks = tuple(await client.latest_tick(codes))
+                    assert (markets, candles, ticks) == (
+                        tuple(await client.markets()),
+                        tuple(await client.candles(codes[0], count=10, to=to)),
+                        tuple(await client.latest_tick(codes)),
+                    )
+                    tuple(await client.orderbook(codes))
+
+                assert 1 == server.requests['/v1/market/all']
+                assert 1 == server.requests['/v1/candles/minutes/1']
+                assert 1 == server.requests['/v1/ticker']
+                assert 3 == server.requests['/v1/orderbook']
+                assert dict(markets=5, candles=5, latest_tick=5) == response_cache.hits
+
+                await client.set_class_level_cache(None)
+                await client.markets()
+                assert 2 == server.requests['/v1/market/all']
+
+        asyncio.run(main())
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import math
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+import pytest
+
+from aioupbit.v1.columnar import CandleBatch
+from aioupbit.v1.values import MinCandle
+
+_START = datetime(2022, 2, 6, 9, 0, tzinfo=timezone.utc)
+_EPOCH = int(_START.timestamp())
+
+
+def _candle(ticker: str, minute: int, opening: str, high: str, low: str, close: str, volume: str) -> MinCandle:
+    return MinCandle(
+        ticker=ticker,
+        date_time=_START + timedelta(minutes=minute),
+        opening_price=Decimal(opening),
+        high_price=Decimal(high),
+        low_price=Decimal(low),
+        trade_price=Decimal(close),
+        latest_tick_timestamp=_START + timedelta(minutes=minute, seconds=59),
+        acc_trade_price=Decimal(close) * Decimal(volume),
+        acc_trade_volume=Decimal(volume),
+        unit=MinCandle.Unit.MIN1,
+    )
+
+
+def _batch() -> CandleBatch:
+    return CandleBatch.from_candles(
+        (
+            _candle('KRW-BTC', 0, '10', '12', '9', '11', '1'),
+            _candle('KRW-BTC', 1, '11', '15', '11', '14', '2'),
+            # no trades at 2, 3 and 4
+            _candle('KRW-BTC', 5, '13', '13', '8', '9', '3'),
+            _candle('KRW-ETH', 3, '100', '101', '99', '100', '1'),
+        )
+    )
+
+
+def _values(view) -> list:
+    return [None if math.isnan(value) else value for value in view]
+
+
+class TestCandleBatch:
+    def test_resample(self) -> None:
+        batch = _batch().resample(timedelta(minutes=5))
+
+        assert ('KRW-BTC', 'KRW-BTC', 'KRW-ETH') == batch.tickers
+        assert dict(zip(('KRW-BTC', 'KRW-ETH'), ((0, 2), (2, 3)))) == batch.offsets
+        assert [_EPOCH, _EPOCH + 300, _EPOCH] == list(batch.timestamps)
+        assert [10, 13, 100] == list(batch.opening_price)
+        assert [15, 13, 101] == list(batch.high_price)
+        assert [9, 8, 99] == list(batch.low_price)
+        assert [14, 9, 100] == list(batch.trade_price)
+        assert [39, 27, 100] == list(batch.acc_trade_price)
+        assert [3, 3, 1] == list(batch.acc_trade_volume)
+
+    def test_resample_hours(self) -> None:
+        batch = _batch().resample(timedelta(hours=2))
+        # aligned from the epoch in UTC
+        assert [_EPOCH - 3600] * 2 == list(batch.timestamps)
+        assert [6, 1] == list(batch.acc_trade_volume)
+
+    @pytest.mark.parametrize('interval', [timedelta(0), timedelta(seconds=90), timedelta(minutes=-1)])
+    def test_invalid_interval(self, interval) -> None:
+        with pytest.raises(ValueError):
+            _batch().resample(interval)
+
+    def test_align(self) -> None:
+        grid = _batch().align(timedelta(minutes=1))
+
+        assert ('KRW-BTC', 'KRW-ETH') == grid.tickers
+        assert (2, 6) == grid.shape
+        assert [_EPOCH + 60 * minute for minute in range(6)] == list(grid.timestamps)
+        # the previous close is carried forward with zero volume
+        assert [11, 14, 14, 14, 14, 9] == _values(grid.series('KRW-BTC'))
+        assert [10, 11, 14, 14, 14, 13] == _values(grid.series('KRW-BTC', 'opening_price'))
+        assert [1, 2, 0, 0, 0, 3] == _values(grid.series('KRW-BTC', 'acc_trade_volume'))
+        assert [None, None, None, 101, 100, 100] == _values(grid.series('KRW-ETH', 'high_price'))
+        assert [0, 0, 0, 1, 0, 0] == _values(grid.series('KRW-ETH', 'acc_trade_volume'))
+        assert grid.trade_price[6 + 3] == grid.series('KRW-ETH')[3]
+
+        with pytest.raises(ValueError):
+            grid.series('KRW-BTC', 'tickers')
+
+    def test_align_range(self) -> None:
+        grid = _batch().align(timedelta(minutes=2), _START + timedelta(minutes=2), _START + timedelta(minutes=8))
+
+        assert [_EPOCH + 120, _EPOCH + 240, _EPOCH + 360] == list(grid.timestamps)
+        # the close before the grid is carried into it
+        assert [14, 9, 9] == _values(grid.series('KRW-BTC'))
+        assert [100, 100, 100] == _values(grid.series('KRW-ETH'))
+        assert [0, 3, 0] == _values(grid.series('KRW-BTC', 'acc_trade_volume'))
+
+    def test_align_empty(self) -> None:
+        grid = CandleBatch.from_candles(()).align(timedelta(minutes=1))
+        assert (0, 0) == grid.shape
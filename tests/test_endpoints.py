@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import asyncio
+import datetime
+
+import pytest
+
+from aioupbit.v1 import AioHTTPRestClient, MinCandle, endpoints
+from aioupbit.v1.testing import FakeUpbitServer
+
+
+class TestQuery:
+    @pytest.mark.parametrize(
+        'to',
+        [
+            datetime.datetime(2022, 2, 6, 9, 22, 30, 123456, tzinfo=datetime.timezone.utc),
+            datetime.datetime(2000, 1, 1, 3, 4, 5, tzinfo=datetime.timezone(datetime.timedelta(hours=9))),
+        ],
+    )
+    def test_format_time(self, to) -> None:
+        assert to.astimezone(datetime.timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ') == endpoints.format_time(to)
+
+    def test_build_query(self) -> None:
+        assert 'market=KRW-BTC&count=200&to=09:00:00' == endpoints.build_query(
+            dict(market='KRW-BTC', count=200, to=datetime.time(9).isoformat())
+        )
+        assert 'convertingPriceUnit=K%26R%3DW%20' == endpoints.build_query(dict(convertingPriceUnit='K&R=W '))
+        assert 'states[]=done&states[]=cancel&limit=100' == endpoints.build_query(
+            dict(states=['done', 'cancel'], limit=100)
+        )
+
+    def test_markets_query_cached(self) -> None:
+        query = AioHTTPRestClient._markets_query(['KRW-BTC', 'KRW-ETH'])
+        assert 'markets=KRW-BTC,KRW-ETH' == query
+        assert query is AioHTTPRestClient._markets_query(('KRW-BTC', 'KRW-ETH'))
+
+    def test_url(self) -> None:
+        assert '/v1/candles/minutes/3?market=KRW-BTC&count=1' == endpoints.MIN_CANDLES[MinCandle.Unit.MIN3].url(
+            AioHTTPRestClient._candles_query('KRW-BTC', 1, None)
+        )
+        assert '/v1/ticker' == endpoints.TICKER.url()
+
+    def test_sent_as_built(self) -> None:
+        to = datetime.datetime(2022, 2, 6, 9, 22, 30, tzinfo=datetime.timezone.utc)
+
+        async def main() -> None:
+            async with FakeUpbitServer(market_count=3) as server:
+                client = server.client_class()
+                candles = tuple(await client.candles_day('KRW-C0000', 2, to, converting_price_unit='KRW'))
+                assert [to.date(), (to - datetime.timedelta(days=1)).date()] == [
+                    candle.date_time.date() for candle in candles
+                ]
+                assert 1 == len(tuple(await client.latest_trades('KRW-C0000', datetime.time(9), days_ago=1)))
+
+        asyncio.run(main())
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import math
+import random
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+import pytest
+
+from aioupbit.v1.columnar import CandleBatch
+from aioupbit.v1.indicators import ATR, EMA, RSI, SMA, VWAP, IndicatorEngine
+from aioupbit.v1.values import DayCandle, MinCandle
+
+_START = datetime(2022, 2, 6, 9, 0, tzinfo=timezone.utc)
+
+
+def _candle(ticker: str, minute: int, price: float, volume: float = 1, unit=MinCandle.Unit.MIN1) -> MinCandle:
+    price_ = Decimal(str(price))
+    return MinCandle(
+        ticker=ticker,
+        date_time=_START + timedelta(minutes=minute * unit.value),
+        opening_price=price_,
+        high_price=price_ + 2,
+        low_price=price_ - 1,
+        trade_price=price_,
+        latest_tick_timestamp=_START + timedelta(minutes=minute * unit.value, seconds=30),
+        acc_trade_price=price_ * Decimal(str(volume)),
+        acc_trade_volume=Decimal(str(volume)),
+        unit=unit,
+    )
+
+
+def _series(ticker: str, count: int, seed: int) -> list:
+    rng = random.Random(seed)
+    price = 100.0
+    candles = []
+    for minute in range(count):
+        price = round(max(1.0, price + rng.uniform(-3, 3)), 2)
+        candles.append(_candle(ticker, minute, price, round(rng.uniform(0.1, 5), 3)))
+    return candles
+
+
+def _values(array) -> list:
+    return [None if math.isnan(value) else value for value in array]
+
+
+class TestIndicators:
+    def test_sma(self) -> None:
+        sma = SMA(3)
+        assert [None, None, 2.0, 3.0, 4.0] == [sma.update(_candle('KRW-BTC', i, i + 1)) for i in range(5)]
+
+    def test_ema(self) -> None:
+        ema = EMA(3)
+        results = [ema.update(_candle('KRW-BTC', i, price)) for i, price in enumerate((1, 2, 3, 7))]
+        # seeded with the SMA of 1, 2, 3, then alpha = 0.5
+        assert [None, None, 2.0, 4.5] == results
+
+    def test_rsi(self) -> None:
+        rsi = RSI(2)
+        results = [rsi.update(_candle('KRW-BTC', i, price)) for i, price in enumerate((10, 12, 11, 11, 14))]
+        # averages (gain, loss): (1, 0.5), (0.5, 0.25), (1.75, 0.125)
+        assert [
+            None,
+            None,
+            pytest.approx(100 - 100 / 3),
+            pytest.approx(100 - 100 / 3),
+            pytest.approx(100 - 100 / 15),
+        ] == results
+
+    def test_atr(self) -> None:
+        atr = ATR(2)
+        results = [atr.update(_candle('KRW-BTC', i, price)) for i, price in enumerate((10, 15, 15))]
+        # true ranges: 3, max(17, 10) - min(14, 10) = 7, 3
+        assert [None, 5.0, 4.0] == results
+
+    def test_vwap(self) -> None:
+        vwap = VWAP()
+        assert 10.0 == vwap.update(_candle('KRW-BTC', 0, 10, 1))
+        assert 17.5 == vwap.update(_candle('KRW-BTC', 1, 20, 3))
+
+        rolling = VWAP(2)
+        assert [None, 17.5, 25.0] == [
+            rolling.update(_candle('KRW-BTC', i, price, volume))
+            for i, (price, volume) in enumerate(((10, 1), (20, 3), (40, 1)))
+        ]
+
+    @pytest.mark.parametrize(
+        'factory', [lambda: SMA(5), lambda: EMA(5), lambda: RSI(5), lambda: ATR(5), lambda: VWAP(5)]
+    )
+    def test_live_bar_updates(self, factory) -> None:
+        live, closed = factory(), factory()
+        for minute, candle in enumerate(_series('KRW-BTC', 20, 1)):
+            # the bar is updated a few times before it closes
+            for price in (candle.trade_price - 1, candle.trade_price + 1):
+                live.update(_candle('KRW-BTC', minute, float(price)))
+            assert live.update(candle) == closed.update(candle)
+
+
+class TestIndicatorEngine:
+    def test_batch_equals_incremental(self) -> None:
+        candles = _series('KRW-BTC', 50, 1) + _series('KRW-ETH', 30, 2)
+        factories = dict(sma=lambda: SMA(10), ema=lambda: EMA(10), rsi=RSI, atr=ATR, vwap=lambda: VWAP(20))
+
+        incremental = IndicatorEngine(factories)
+        expected = dict()
+        for candle in candles:
+            for name, value in incremental.update(candle).items():
+                expected.setdefault(candle.ticker, dict()).setdefault(name, []).append(value)
+
+        batched = IndicatorEngine(factories)
+        results = batched.batch(CandleBatch.from_candles(candles), MinCandle.Unit.MIN1)
+        assert {'KRW-BTC', 'KRW-ETH'} == set(results)
+        for ticker, columns in results.items():
+            for name, column in columns.items():
+                assert _values(column) == pytest.approx(expected[ticker][name], nan_ok=True)
+
+        # live candles continue the batch
+        live = _candle('KRW-BTC', 50, 123.45)
+        assert incremental.update(live) == batched.update(live)
+
+    def test_series_by_kind(self) -> None:
+        engine = IndicatorEngine(dict(sma=lambda: SMA(2)))
+        engine.update(_candle('KRW-BTC', 0, 10))
+        engine.update(_candle('KRW-BTC', 0, 30, unit=MinCandle.Unit.MIN5))
+        assert dict(sma=15.0) == engine.update(_candle('KRW-BTC', 1, 20))
+        assert dict(sma=None) == engine.latest('KRW-BTC', DayCandle)
+        assert dict(sma=30.0) == engine.update(_candle('KRW-BTC', 1, 30, unit=MinCandle.Unit.MIN5))
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import asyncio
+
+import aiohttp
+
+from aioupbit.v1 import ConnectionWarmer
+from aioupbit.v1.testing import FakeUpbitServer
+
+
+class _HangingServer:
+    """
+    HTTP server whose connections stop responding, without closing, once `hang()` is called.
+    """
+
+    def __init__(self) -> None:
+        self.connections = 0
+        self._generation = 0
+        self._server = None
+
+    async def start(self) -> str:
+        self._server = await asyncio.start_server(self._handle, '127.0.0.1', 0)
+        host, port = self._server.sockets[0].getsockname()[:2]
+        return f'http://{host}:{port}'
+
+    def hang(self) -> None:
+        self._generation += 1
+
+    async def close(self) -> None:
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        generation = self._generation
+        try:
+            while True:
+                await reader.readuntil(b'\r\n\r\n')
+                if generation != self._generation:
+                    await reader.read()
+                    return
+                writer.write(b'HTTP/1.1 404 Not Found\r\nContent-Length: 0\r\n\r\n')
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+
+class TestConnectionWarmer:
+    def test_warm_and_evict(self) -> None:
+        async def main() -> None:
+            server = _HangingServer()
+            url = await server.start()
+            connector = aiohttp.TCPConnector(keepalive_timeout=60)
+            try:
+                async with ConnectionWarmer(connector, url, size=3, interval=3600, timeout=0.2) as warmer:
+                    assert 3 == server.connections
+                    assert 3 == warmer.idle_connections
+
+                    # idle connections are reused
+                    assert 0 == await warmer.warm()
+                    assert 3 == server.connections
+
+                    # half-dead connections are found and replaced
+                    server.hang()
+                    assert 3 == await warmer.warm()
+                    assert 6 == server.connections
+                    assert 3 == warmer.idle_connections
+                    assert (12, 3) == (warmer.pings, warmer.failures)
+            finally:
+                await connector.close()
+                await server.close()
+
+        asyncio.run(main())
+
+    def test_prewarm(self) -> None:
+        async def main() -> None:
+            async with FakeUpbitServer(market_count=3, refresh_interval=3600) as server:
+                client = server.client_class()
+                warmer = await client.prewarm(size=2, interval=3600)
+                try:
+                    assert warmer.connector is client._connector
+                    assert 2 == warmer.idle_connections
+                    assert 3 == len(tuple(await client.markets()))
+                    assert 2 == warmer.idle_connections
+                finally:
+                    await warmer.close()
+                    await client._connector.close()
+
+        asyncio.run(main())
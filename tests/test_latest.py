@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import asyncio
+from typing import NamedTuple
+
+from aioupbit.v1 import LatestValueStore, TickPoller
+from aioupbit.v1.testing import FakeUpbitServer
+
+
+class _Tick(NamedTuple):
+    ticker: str
+    price: int
+
+
+class TestLatestValueStore:
+    def test_put(self) -> None:
+        store: LatestValueStore[_Tick] = LatestValueStore()
+        assert store.get('KRW-BTC') is None
+        assert 0 == store.version('KRW-BTC')
+
+        assert 1 == store.put(_Tick('KRW-BTC', 1))
+        assert 2 == store.put(_Tick('KRW-BTC', 2))
+        store.put_many((_Tick('KRW-ETH', 1), _Tick('KRW-BTC', 3)))
+
+        assert _Tick('KRW-BTC', 3) == store.get('KRW-BTC')
+        assert 3 == store.version('KRW-BTC')
+        assert 1 == store.version('KRW-ETH')
+        assert ('KRW-BTC', 'KRW-ETH') == store.tickers
+        assert 'KRW-ETH' in store and 2 == len(store)
+
+    def test_wait_newer(self) -> None:
+        async def main() -> None:
+            store: LatestValueStore[_Tick] = LatestValueStore()
+            store.put(_Tick('KRW-BTC', 1))
+            # already newer
+            assert (1, _Tick('KRW-BTC', 1)) == await store.wait_newer('KRW-BTC')
+
+            waiting = asyncio.ensure_future(store.wait_newer('KRW-BTC', 1))
+            other = asyncio.ensure_future(store.wait_newer('KRW-ETH'))
+            await asyncio.sleep(0)
+            assert not waiting.done()
+
+            # intermediate values are skipped
+            store.put_many((_Tick('KRW-BTC', 2), _Tick('KRW-BTC', 3)))
+            assert (3, _Tick('KRW-BTC', 3)) == await waiting
+            assert not other.done()
+
+            other.cancel()
+            await asyncio.sleep(0)
+            store.put(_Tick('KRW-ETH', 1))
+            assert (1, _Tick('KRW-ETH', 1)) == await store.wait_newer('KRW-ETH')
+
+        asyncio.run(main())
+
+    def test_tick_poller(self) -> None:
+        async def main() -> None:
+            async with FakeUpbitServer(market_count=3, refresh_interval=0) as server:
+                store = LatestValueStore()
+                poller = TickPoller(server.client_class(), server.market_codes, store.put, min_interval=0)
+
+                waiting = asyncio.ensure_future(store.wait_newer('KRW-C0000', 1))
+                await poller.poll()
+                await poller.poll()
+                version, tick = await waiting
+                assert 2 == version
+                assert tick is poller.latest('KRW-C0000')
+
+        asyncio.run(main())
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import datetime
+import uuid
+from decimal import Decimal
+
+from aioupbit.v1 import Order, OrderState, OrderTracker, OrderType, Side
+
+_NOW = datetime.datetime(2022, 2, 6, 9, 22, 30, tzinfo=datetime.timezone.utc)
+
+
+def _order(i: int, state: OrderState = OrderState.WAIT) -> Order:
+    return Order(
+        order_uuid=uuid.UUID(int=i, version=4),
+        side=Side.BID,
+        order_type=OrderType.LIMIT,
+        price=Decimal(100),
+        state=state,
+        ticker='KRW-BTC',
+        created_at=_NOW,
+        volume=Decimal(1),
+        remaining_volume=Decimal(1),
+        reserved_fee=Decimal(0),
+        remaining_fee=Decimal(0),
+        paid_fee=Decimal(0),
+        locked=Decimal(100),
+        executed_volume=Decimal(0),
+        trade_count=0,
+        identifier=f'order-{i}',
+    )
+
+
+class FakeClient:
+    """
+    Serves `orders(uuids=..., states=...)` from `self.orders_by_uuid`.
+    """
+
+    def __init__(self) -> None:
+        self.orders_by_uuid = dict()
+        self.calls = []
+
+    async def orders(self, *, uuids, states, limit):
+        assert len(uuids) <= limit
+        self.calls.append((len(uuids), tuple(states)))
+        return [
+            self.orders_by_uuid[order_uuid] for order_uuid in uuids if self.orders_by_uuid[order_uuid].state in states
+        ]
+
+
+class TestOrderTracker:
+    def test_bulk_refresh(self) -> None:
+        async def main() -> None:
+            client = FakeClient()
+            changes = []
+            tracker = OrderTracker(client, on_change=changes.append)
+            closed = []
+
+            futures = []
+            for i in range(250):
+                order = client.orders_by_uuid[uuid.UUID(int=i, version=4)] = _order(i)
+                futures.append(tracker.track(order, closed.append))
+
+            assert [] == await tracker.refresh()
+            # 250 open orders in 3 requests
+            assert [100, 100, 50] == [count for count, _ in client.calls]
+
+            partial = dataclasses.replace(_order(1), executed_volume=Decimal('0.5'), trade_count=1)
+            client.orders_by_uuid[partial.order_uuid] = partial
+            done = client.orders_by_uuid[_order(2).order_uuid] = _order(2, OrderState.DONE)
+            client.calls.clear()
+
+            assert [partial, done] == await tracker.refresh()
+            assert [partial, done] == changes
+            # closed orders are queried only when they left the open states
+            assert [(100, (OrderState.WAIT, OrderState.WATCH))] == client.calls[:1]
+            assert (1, (OrderState.DONE, OrderState.CANCEL)) == client.calls[-1]
+
+            assert done is await futures[2]
+            await asyncio.sleep(0)  # done callbacks are scheduled
+            assert [done] == closed
+            assert not futures[1].done()
+            assert 249 == len(tracker)
+            assert partial is tracker.get(identifier='order-1')
+            assert tracker.get(order_uuid=str(done.order_uuid)) is None
+
+        asyncio.run(main())
+
+    def test_apply(self) -> None:
+        async def main() -> None:
+            tracker = OrderTracker(FakeClient())
+            future = tracker.track(_order(0))
+            assert not tracker.apply(_order(1, OrderState.CANCEL))
+            assert not tracker.apply(_order(0))
+            assert tracker.apply(_order(0, OrderState.TRADE))
+            assert tracker.apply(_order(0, OrderState.CANCEL))
+            assert OrderState.CANCEL is (await future).state
+            assert 0 == len(tracker)
+
+            future = tracker.track(_order(3))
+            tracker.untrack(_order(3).order_uuid)
+            assert future.cancelled()
+            assert 0 == len(tracker)
+
+        asyncio.run(main())
+
+    def test_track_closed(self) -> None:
+        async def main() -> None:
+            tracker = OrderTracker(FakeClient())
+            closed = []
+            done = _order(0, OrderState.DONE)
+            assert done is await tracker.track(done, closed.append)
+            await asyncio.sleep(0)
+            assert [done] == closed
+            # nothing is kept for an order that is already closed
+            assert 0 == len(tracker)
+            assert {} == tracker._futures
+
+        asyncio.run(main())
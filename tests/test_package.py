@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+import importlib
+import subprocess
+import sys
+
+import aioupbit.v1
+
+
+class TestLazyImport:
+    def test_values_without_http_stack(self) -> None:
+        code = (
+            'import sys\n'
+            'from aioupbit.v1 import Tick, Change, values\n'
+            'assert not {"aiohttp", "jwt", "rapidjson", "aioupbit.v1.client"} & set(sys.modules), sorted(sys.modules)\n'
+            'from aioupbit.v1 import RestClient\n'
+            'assert "aiohttp" in sys.modules\n'
+        )
+        subprocess.run([sys.executable, '-c', code], check=True)
+
+    def test_lazy_attributes(self) -> None:
+        for name, (module, attribute) in aioupbit.v1._LAZY_ATTRIBUTES.items():
+            exported = importlib.import_module(f'aioupbit.v1.{module}')
+            assert attribute in exported.__all__
+            assert getattr(exported, attribute) is getattr(aioupbit.v1, name)
+            assert name in dir(aioupbit.v1)
+
+        for module in {module for module, _ in aioupbit.v1._LAZY_ATTRIBUTES.values()}:
+            for name in importlib.import_module(f'aioupbit.v1.{module}').__all__:
+                assert name in aioupbit.v1.__all__
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import asyncio
+from typing import NamedTuple
+
+import pytest
+
+from aioupbit.v1.pipeline import Overflow, Pipeline, Subscription, SubscriptionClosed, poll_items
+
+
+class _Tick(NamedTuple):
+    ticker: str
+    price: int
+
+
+class TestSubscription:
+    def test_drop_oldest(self) -> None:
+        subscription: Subscription[_Tick] = Subscription(maxsize=2)
+        for price in range(4):
+            assert subscription.put_nowait(_Tick('KRW-BTC', price))
+
+        assert 2 == len(subscription)
+        assert 2 == subscription.dropped
+        assert [2, 3] == [subscription.get_nowait().price for _ in range(2)]
+        assert subscription.get_nowait() is None
+
+    def test_conflate(self) -> None:
+        subscription: Subscription[_Tick] = Subscription(maxsize=2, overflow=Overflow.CONFLATE)
+        for tick in (_Tick('KRW-BTC', 1), _Tick('KRW-ETH', 1), _Tick('KRW-BTC', 2), _Tick('KRW-XRP', 1)):
+            subscription.put_nowait(tick)
+
+        # KRW-BTC is replaced in its place, then dropped as the oldest key for KRW-XRP
+        assert 2 == subscription.dropped
+        assert [_Tick('KRW-ETH', 1), _Tick('KRW-XRP', 1)] == [subscription.get_nowait() for _ in range(2)]
+
+    def test_block(self) -> None:
+        async def main() -> None:
+            subscription: Subscription[int] = Subscription(maxsize=1, overflow=Overflow.BLOCK, key=int)
+            await subscription.put(1)
+            assert not subscription.put_nowait(2)
+
+            put = asyncio.ensure_future(subscription.put(2))
+            await asyncio.sleep(0)
+            assert not put.done()
+            assert 1 == await subscription.get()
+            await put
+            assert 2 == await subscription.get()
+            assert 0 == subscription.dropped
+
+        asyncio.run(main())
+
+    def test_close(self) -> None:
+        async def main() -> None:
+            subscription: Subscription[_Tick] = Subscription()
+            get = asyncio.ensure_future(subscription.get())
+            await asyncio.sleep(0)
+            subscription.close()
+            with pytest.raises(SubscriptionClosed):
+                await get
+
+        asyncio.run(main())
+
+
+class TestPipeline:
+    def test_fan_out(self) -> None:
+        async def main() -> None:
+            pipeline: Pipeline[_Tick] = Pipeline()
+            everything = pipeline.subscribe(maxsize=100, overflow=Overflow.BLOCK)
+            latest = pipeline.subscribe(maxsize=10, overflow=Overflow.CONFLATE)
+            recent = pipeline.subscribe(maxsize=3)
+
+            ticks = [_Tick(ticker, price) for price in range(5) for ticker in ('KRW-BTC', 'KRW-ETH')]
+            await pipeline.pump(_source(ticks))
+
+            assert ticks == [tick async for tick in everything]
+            assert [_Tick('KRW-BTC', 4), _Tick('KRW-ETH', 4)] == [tick async for tick in latest]
+            assert ticks[-3:] == [tick async for tick in recent]
+            assert [] == pipeline.subscriptions
+
+        asyncio.run(main())
+
+    def test_slow_subscriber(self) -> None:
+        async def main() -> None:
+            pipeline: Pipeline[_Tick] = Pipeline()
+            blocking = pipeline.subscribe(maxsize=2, overflow=Overflow.BLOCK)
+            received = []
+
+            async def consume() -> None:
+                async for tick in blocking:
+                    received.append(tick)
+                    await asyncio.sleep(0.001)
+
+            consumer = asyncio.ensure_future(consume())
+            ticks = [_Tick('KRW-BTC', price) for price in range(20)]
+            await pipeline.publish_many(ticks)
+            # the publisher is held back to the consumer, which never has more than 2 pending
+            assert len(blocking) <= 2
+            pipeline.close()
+            await consumer
+            assert ticks == received
+
+        asyncio.run(main())
+
+    def test_unsubscribe(self) -> None:
+        async def main() -> None:
+            pipeline: Pipeline[_Tick] = Pipeline()
+            subscription = pipeline.subscribe()
+            pipeline.unsubscribe(subscription)
+            await pipeline.publish(_Tick('KRW-BTC', 1))
+            assert subscription.closed
+            assert 0 == len(subscription)
+
+        asyncio.run(main())
+
+    def test_poll_items(self) -> None:
+        async def main() -> None:
+            calls = []
+
+            async def fetch():
+                calls.append(None)
+                return [_Tick('KRW-BTC', len(calls)), _Tick('KRW-ETH', len(calls))]
+
+            items = poll_items(fetch, 0.001)
+            assert [1, 1, 2, 2, 3] == [(await items.__anext__()).price for _ in range(5)]
+            await items.aclose()
+
+        asyncio.run(main())
+
+
+async def _source(items):
+    for item in items:
+        yield item
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import asyncio
+import datetime
+
+import pytest
+import rapidjson
+
+from aioupbit.v1 import AioHTTPTransport, ReplayTransport, Response, TickPoller, TransportRestClient
+from aioupbit.v1 import endpoints
+from aioupbit.v1.testing import FakeUpbitServer, PayloadGenerator
+
+
+class TestTickPoller:
+    def test_change_detection(self) -> None:
+        async def main() -> None:
+            async with FakeUpbitServer(market_count=5, refresh_interval=3600) as server:
+                changes = []
+                poller = TickPoller(server.client_class(), server.market_codes, changes.append, min_interval=0)
+
+                first = await poller.poll()
+                assert list(server.market_codes) == [tick.ticker for tick in first]
+                assert first == changes
+
+                # unchanged ticks are neither rebuilt nor reported
+                assert [] == await poller.poll()
+                assert all(tick is poller.latest(tick.ticker) for tick in first)
+                assert 5 == len(changes)
+
+                server.refresh_interval = 0
+                assert 5 == len(await poller.poll())
+                assert all(tick is not poller.latest(tick.ticker) for tick in first)
+
+        asyncio.run(main())
+
+    def test_adaptive_interval(self) -> None:
+        async def main() -> None:
+            async with FakeUpbitServer(market_count=5, refresh_interval=3600) as server:
+                poller = TickPoller(server.client_class(), server.market_codes, min_interval=0.5, max_interval=1)
+                await poller.poll()
+                assert 0.5 == poller.interval('KRW-C0000')
+
+                # markets are skipped until they are due
+                assert [] == await poller.poll()
+                assert 1 == server.requests['/v1/ticker']
+
+                await asyncio.sleep(0.55)
+                await poller.poll()
+                assert 2 == server.requests['/v1/ticker']
+                assert pytest.approx(0.75) == poller.interval('KRW-C0000')
+
+        asyncio.run(main())
+
+    def test_transport_client(self) -> None:
+        async def main() -> None:
+            async with FakeUpbitServer(market_count=5, refresh_interval=3600) as server:
+                async with AioHTTPTransport(server.url) as transport:
+                    poller = TickPoller(TransportRestClient.using(transport), server.market_codes, min_interval=0)
+                    assert 5 == len(await poller.poll())
+                    assert [] == await poller.poll()
+
+        asyncio.run(main())
+
+    def test_missing_market(self) -> None:
+        replay = ReplayTransport()
+        client = TransportRestClient.using(replay)
+        tickers = ('KRW-BTC', 'KRW-GONE')
+        tick = PayloadGenerator().tick('KRW-BTC', datetime.datetime(2022, 2, 6, tzinfo=datetime.timezone.utc))
+        content = rapidjson.dumps([tick]).encode()
+        replay.add('GET', endpoints.TICKER.url(*client._chunk_markets(tickers)), Response(200, {}, content, 'utf-8'))
+
+        async def main() -> None:
+            poller = TickPoller(client, tickers, min_interval=1, max_interval=10)
+            assert 1 == len(await poller.poll())
+            # a market missing from the response backs off instead of staying due
+            assert 1.5 == poller.interval('KRW-GONE')
+            assert [] == await poller.poll()
+
+        asyncio.run(main())
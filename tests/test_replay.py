@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import asyncio
+import math
+
+import pytest
+
+from aioupbit.v1 import (
+    AioHTTPTransport,
+    FileRecordingTransport,
+    Record,
+    RecordFile,
+    ReplayClient,
+    ReplayFinished,
+    Response,
+    ResponseError,
+    TimedReplayTransport,
+    TransportRestClient,
+)
+from aioupbit.v1 import endpoints
+from aioupbit.v1.testing import FakeUpbitServer
+
+
+def _tick(price: int) -> Response:
+    return Response(200, {}, f'[{{"market":"KRW-BTC","trade_price":{price}}}]'.encode(), 'utf-8')
+
+
+class TestRecordFile:
+    def test_append(self, tmp_path) -> None:
+        path = tmp_path / 'market.rec'
+        records = [Record(1644139350.5 + i, '/v1/ticker?markets=KRW-BTC', _tick(i)) for i in range(3)]
+        records.append(Record(1644139360, '/v1/orderbook?markets=KRW-BTC', Response(200, {}, b'[]' * 1000, 'euc-kr')))
+
+        file = RecordFile(path)
+        file.append(records[:2])
+        file.close()
+        # appended to the existing file
+        file = RecordFile(path)
+        file.append(records[2:])
+        file.close()
+
+        assert records == list(RecordFile.read(path))
+        # the repeated body is compressed
+        assert path.stat().st_size < 1000
+
+        with path.open('ab') as f:
+            f.write(b'\x00' * 5)
+        assert records == list(RecordFile.read(path))
+
+    def test_not_a_record_file(self, tmp_path) -> None:
+        path = tmp_path / 'market.rec'
+        path.write_bytes(b'[]')
+        with pytest.raises(ValueError):
+            list(RecordFile.read(path))
+
+
+class TestReplayClient:
+    def test_record_and_replay(self, tmp_path) -> None:
+        path = tmp_path / 'market.rec'
+
+        async def main() -> None:
+            async with FakeUpbitServer(market_count=3, refresh_interval=0) as server:
+                codes = server.market_codes
+                async with FileRecordingTransport(AioHTTPTransport(server.url), RecordFile(path)) as recorder:
+                    client = TransportRestClient.using(recorder)
+                    recorded = [tuple(await client.latest_tick(codes)) for _ in range(3)]
+                    orderbook = tuple(await client.orderbook(codes))
+
+            client = ReplayClient.from_file(path, speed=math.inf)
+            assert recorded == [tuple(await client.latest_tick(codes)) for _ in range(3)]
+            assert orderbook == tuple(await client.orderbook(codes))
+            with pytest.raises(ReplayFinished):
+                await client.latest_tick(codes)
+            with pytest.raises(ResponseError):
+                await client.latest_tick(codes[:1])
+
+        asyncio.run(main())
+
+    def test_speed(self) -> None:
+        records = [Record(1000 + i, '/v1/ticker?markets=KRW-BTC', _tick(i)) for i in range(3)]
+
+        async def main() -> None:
+            transport = TimedReplayTransport(records, speed=20)
+            client = ReplayClient.using(transport)
+            loop = asyncio.get_running_loop()
+            started = loop.time()
+            prices = [
+                (await client._fetch(endpoints.TICKER, 'markets=KRW-BTC', dict))[0]['trade_price'] for _ in range(3)
+            ]
+            # 2 recorded seconds at 20x
+            assert 0.1 <= loop.time() - started < 1
+            assert [0, 1, 2] == prices
+            assert 1002 == transport.now
+            assert 0 == transport.remaining()
+
+        asyncio.run(main())
+
+    def test_exchange_api(self) -> None:
+        content = (
+            b'[{"currency":"KRW","balance":"1.0","locked":"0.0","avg_buy_price":"0",'
+            b'"avg_buy_price_modified":true,"unit_currency":"KRW"}]'
+        )
+        accounts = Response(200, {}, content, 'utf-8')
+        client = ReplayClient.from_records((Record(1000, '/v1/accounts', accounts),))('access', 'secret' * 8)
+
+        async def main() -> None:
+            assert ['KRW'] == [account.currency for account in await client.accounts()]
+            assert await client.get_order(order_id='not-recorded') is None
+            with pytest.raises(ResponseError):
+                await client.cancel_order(order_id='not-recorded')
+
+        asyncio.run(main())
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import datetime
+from decimal import Decimal
+
+import pytest
+import rapidjson
+
+from aioupbit.v1 import serialization, values
+from aioupbit.v1.testing import PayloadGenerator
+
+_NOW = datetime.datetime(2022, 2, 6, 9, 22, 30, 123000, tzinfo=datetime.timezone.utc)
+
+
+def _decode(json):
+    """
+    Decodes a generated payload like the REST client does.
+    """
+    return rapidjson.loads(
+        rapidjson.dumps(json),
+        number_mode=rapidjson.NM_NAN | rapidjson.NM_DECIMAL,
+        datetime_mode=rapidjson.DM_ISO8601 | rapidjson.DM_NAIVE_IS_UTC,
+    )
+
+
+def _samples():
+    payloads = PayloadGenerator()
+    bid_account, ask_account = payloads.accounts(('KRW', 'BTC'))
+    chance = dict(
+        bid_fee='0.0005',
+        ask_fee='0.0005',
+        market=dict(
+            id='KRW-BTC',
+            order_types=['limit'],
+            order_sides=['ask', 'bid'],
+            bid=dict(currency='KRW', price_unit=None, min_total='5000'),
+            ask=dict(currency='BTC', price_unit='1000', min_total='5000'),
+            max_total='1000000000.0',
+        ),
+        bid_account=bid_account,
+        ask_account=ask_account,
+    )
+    order = payloads.order('KRW-BTC', _NOW, state='done')
+    trade = dict(
+        market='KRW-BTC',
+        uuid='78c21436-7c2c-4d2d-8d7a-22f0bd4e5f2a',
+        price='51000000.0',
+        volume='0.1',
+        funds='5100000.0',
+        side='bid',
+        created_at=order['created_at'],
+    )
+    return (
+        (values.Ticker, payloads.markets(['KRW-BTC'])[0]),
+        (values.MinCandle, payloads.min_candles('KRW-BTC', 5, 1, _NOW)[0]),
+        (values.DayCandle, payloads.day_candles('KRW-BTC', 1, _NOW)[0]),
+        (values.WeekCandle, payloads.week_candles('KRW-BTC', 1, _NOW)[0]),
+        (values.MonthCandle, payloads.month_candles('KRW-BTC', 1, _NOW)[0]),
+        (values.Trade, payloads.trades('KRW-BTC', 1, _NOW)[0]),
+        (values.Tick, payloads.tick('KRW-BTC', _NOW)),
+        (values.Orderbook, payloads.orderbook('KRW-BTC', _NOW)),
+        (values.Account, bid_account),
+        (values.Market, chance),
+        (values.MarketWithAccount, chance),
+        (values.Order, order),
+        # market orders have no price or no volume
+        (values.Order, dict(order, ord_type='market', side='ask', price=None)),
+        (values.Order, dict(order, ord_type='price', side='bid', volume=None, remaining_volume=None)),
+        (values.OrderWithTrades, dict(order, trades=[trade])),
+    )
+
+
+@pytest.mark.parametrize(('cls', 'json'), _samples())
+class TestRoundTrip:
+    def test_bytes(self, cls, json) -> None:
+        value = cls.from_json(_decode(json))
+        assert value == cls.from_bytes(value.to_bytes())
+
+    def test_json(self, cls, json) -> None:
+        value = cls.from_json(_decode(json))
+        assert value == cls.from_json(value.to_json())
+        assert [value, value] == serialization.loads(cls, serialization.dumps([value, value]))
+
+    def test_many(self, cls, json) -> None:
+        value = cls.from_json(_decode(json))
+        assert [value] * 3 == serialization.decode_many(cls, serialization.encode_many([value] * 3))
+
+
+class TestBinaryFormat:
+    def test_decimal_precision(self) -> None:
+        unit = values.Orderbook.Unit(
+            ask_price=Decimal('12345678901234567890123456789012345678901234.5'),
+            bid_price=Decimal('-0.00000001'),
+            ask_size=Decimal('1E+3'),
+            bid_size=Decimal('0E-8'),
+        )
+        decoded = values.Orderbook.Unit.from_bytes(unit.to_bytes())
+        assert [value.as_tuple() for value in (unit.ask_price, unit.bid_price, unit.ask_size, unit.bid_size)] == [
+            value.as_tuple() for value in (decoded.ask_price, decoded.bid_price, decoded.ask_size, decoded.bid_size)
+        ]
+
+    def test_smaller_than_json(self) -> None:
+        tick = values.Tick.from_json(_decode(PayloadGenerator().tick('KRW-BTC', _NOW)))
+        assert len(tick.to_bytes()) < len(serialization.dumps([tick])) / 2
+
+    def test_errors(self) -> None:
+        data = values.RemainingReq(group='default', min=1800, sec=29).to_bytes()
+        with pytest.raises(ValueError):
+            values.RemainingReq.from_bytes(data + b'\0')
+        with pytest.raises(ValueError):
+            values.Orderbook.Unit(Decimal('NaN'), Decimal(1), Decimal(1), Decimal(1)).to_bytes()
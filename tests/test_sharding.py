@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import asyncio
+from typing import List, Tuple
+
+import pytest
+
+from aioupbit.v1 import Client, RateLimitGroup, RemainingReq, ShardedClient
+
+
+class FakeClient(Client):
+    __slots__ = ('calls',)
+
+    def __init__(self, access_key: str, secret_key: str) -> None:
+        super().__init__(access_key, secret_key)
+        self.calls: List[Tuple[str, dict]] = []
+
+    markets = candles = candles_day = candles_week = candles_month = None  # type: ignore[assignment]
+    latest_trades = latest_tick = orderbook = market_with_account = None  # type: ignore[assignment]
+
+    async def accounts(self):
+        self.calls.append(('accounts', dict()))
+        return ()
+
+    async def get_order(self, **kwargs):
+        self.calls.append(('get_order', kwargs))
+
+    async def orders(self, **kwargs):
+        self.calls.append(('orders', kwargs))
+        return ()
+
+    async def cancel_order(self, **kwargs):
+        self.calls.append(('cancel_order', kwargs))
+
+
+class TestShardedClient:
+    def test_routing(self) -> None:
+        async def main() -> None:
+            sharded = ShardedClient.from_credentials(FakeClient, [('a', 'A'), ('b', 'B'), ('c', 'C')])
+            first, second, third = sharded.clients
+
+            await asyncio.gather(*(sharded.accounts() for _ in range(10)))
+            await sharded.get_order(order_uuid='9ca023a5-851b-4fec-9f0a-48cd83c2eaae')
+            assert not first.calls
+            # queries are balanced by the remaining budget of each key
+            assert {5, 6} == {len(second.calls), len(third.calls)}
+
+            sharded.set_owner(third, order_id='my-order')
+            await sharded.cancel_order(order_id='my-order')
+            await sharded.cancel_order(order_uuid='9ca023a5-851b-4fec-9f0a-48cd83c2eaae')
+            assert ('cancel_order', dict(order_id='my-order')) == third.calls[-1]
+            assert [('cancel_order', dict(order_uuid='9ca023a5-851b-4fec-9f0a-48cd83c2eaae'))] == first.calls
+            # cancels are charged to the order group, like order placement
+            assert 7 == first.exchange_rate_limiter(RateLimitGroup.ORDER).available()
+            assert 30 == first.exchange_rate_limiter(RateLimitGroup.DEFAULT).available()
+
+            with pytest.raises(ValueError):
+                sharded.set_owner(FakeClient('d', 'D'), order_id='other')
+
+        asyncio.run(main())
+
+    def test_owner_queries(self) -> None:
+        async def main() -> None:
+            sharded = ShardedClient.from_credentials(FakeClient, [('a', 'A'), ('b', 'B'), ('c', 'C')])
+            first, second, third = sharded.clients
+            sharded.set_owner(first, order_uuid='9ca023a5-851b-4fec-9f0a-48cd83c2eaae', order_id='my-order')
+            sharded.set_owner(third, order_id='other-order')
+
+            await sharded.get_order(order_uuid='9ca023a5-851b-4fec-9f0a-48cd83c2eaae')
+            await sharded.orders(identifiers=iter(['my-order']), uuids=['9ca023a5-851b-4fec-9f0a-48cd83c2eaae'])
+            assert [
+                ('get_order', dict(order_uuid='9ca023a5-851b-4fec-9f0a-48cd83c2eaae')),
+                ('orders', dict(identifiers=('my-order',), uuids=('9ca023a5-851b-4fec-9f0a-48cd83c2eaae',))),
+            ] == first.calls
+
+            # orders of different or unknown owners are spread by budget
+            await sharded.orders(identifiers=['my-order', 'other-order'])
+            await sharded.get_order(order_id='unknown')
+            assert 2 == len(first.calls)
+            assert 2 == len(second.calls) + len(third.calls)
+
+            third.exchange_rate_limiter(RateLimitGroup.DEFAULT).update(RemainingReq('default', 0, 0))
+            await sharded.accounts()
+            await sharded.get_order(order_id='other-order')
+            assert ('accounts', dict()) == second.calls[-1]
+            assert ('get_order', dict(order_id='other-order')) == third.calls[-1]
+
+        asyncio.run(main())
+
+    def test_single_client(self) -> None:
+        async def main() -> None:
+            sharded = ShardedClient([FakeClient('a', 'A')])
+            await sharded.orders(state='done')
+            assert [('orders', dict(state='done'))] == sharded.clients[0].calls
+
+        asyncio.run(main())
@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import datetime
+import multiprocessing
+from decimal import Decimal
+from typing import Optional
+
+import pytest
+
+from aioupbit.v1 import Change, SharedMarketTable, SharedMemoryPublisher, Tick
+from aioupbit.v1.testing import FakeUpbitServer
+
+
+def _read_trade_price(name: str, ticker: str) -> Optional[Decimal]:
+    table = SharedMarketTable.attach(name)
+    try:
+        tick = table.read_tick(ticker)
+        return None if tick is None else tick.trade_price
+    finally:
+        table.close()
+
+
+class TestSharedMarketTable:
+    def test_publish_and_read(self) -> None:
+        async def main() -> None:
+            async with FakeUpbitServer(market_count=5, orderbook_depth=20) as server:
+                with SharedMarketTable.create(server.market_codes, depth=15) as table:
+                    assert table.read_tick('KRW-C0000') is None
+                    publisher = SharedMemoryPublisher(server.client_class(), table)
+                    await publisher.poll()
+
+                    ticks = tuple(await server.client_class().latest_tick(server.market_codes))
+                    reader = SharedMarketTable.attach(table.name)
+                    try:
+                        assert tuple(server.market_codes) == reader.tickers
+                        for tick in ticks:
+                            publisher.publish(tick)
+                            assert tick == reader.read_tick(tick.ticker)
+                            # same time zones as ticks of the REST client
+                            read = reader.read_tick(tick.ticker)
+                            assert tick.trade_date_time.tzinfo == read.trade_date_time.tzinfo
+                            assert tick.timestamp.tzinfo == read.timestamp.tzinfo
+                            assert 2 == reader.tick_version(tick.ticker)
+
+                        orderbook = reader.read_orderbook('KRW-C0000')
+                        assert orderbook is not None
+                        assert 15 == len(orderbook.orderbook_units)
+                        assert 1 == reader.orderbook_version('KRW-C0000')
+                    finally:
+                        reader.close()
+
+                    with multiprocessing.get_context('spawn').Pool(1) as pool:
+                        assert ticks[0].trade_price == pool.apply(_read_trade_price, (table.name, ticks[0].ticker))
+
+        asyncio.run(main())
+
+    def test_unknown_market(self) -> None:
+        async def main() -> None:
+            async with FakeUpbitServer(market_count=3) as server:
+                codes = server.market_codes
+
+                class Client(server.client_class()):
+                    # the response has a market that is not in the table
+                    __slots__ = ()
+
+                    @classmethod
+                    async def latest_tick(cls, markets):
+                        return await super().latest_tick(codes)
+
+                    @classmethod
+                    async def orderbook(cls, markets):
+                        return await super().orderbook(codes)
+
+                with SharedMarketTable.create(codes[:2]) as table:
+                    assert codes[2] not in table
+                    await SharedMemoryPublisher(Client, table).poll()
+                    assert all(table.read_tick(code) is not None for code in codes[:2])
+
+        asyncio.run(main())
+
+    def test_decimal_encoding(self) -> None:
+        at = datetime.datetime(2022, 2, 6, 18, 30, 15, 123000, tzinfo=datetime.timezone(datetime.timedelta(hours=9)))
+        prices = dict(
+            opening_price=Decimal('51000000'),
+            high_price=Decimal('1E+3'),
+            low_price=Decimal('-0.00000001'),
+            trade_price=Decimal('12345678901234567890.123456789012345678'),
+            prev_closing_price=Decimal('0.0'),
+        )
+        tick = Tick(
+            ticker='KRW-BTC',
+            trade_date_time=at,
+            change=Change.RISE,
+            change_price=Decimal('100'),
+            change_rate=Decimal('0.0123456789'),
+            signed_change_price=Decimal('-100'),
+            signed_change_rate=Decimal('-0.002'),
+            trade_volume=Decimal('0.12345678'),
+            acc_trade_price=Decimal('1'),
+            acc_trade_price_24h=Decimal('1'),
+            acc_trade_volume=Decimal('1'),
+            acc_trade_volume_24h=Decimal('1'),
+            highest_52_week_price=Decimal('1'),
+            highest_52_week_date=at.date(),
+            lowest_52_week_price=Decimal('1'),
+            lowest_52_week_date=at.date(),
+            timestamp=at,
+            **prices,
+        )
+        with SharedMarketTable.create(('KRW-BTC',)) as table:
+            table.write_tick(tick)
+            assert tick == table.read_tick('KRW-BTC')
+            read = table.read_tick('KRW-BTC')
+            assert {name: price.as_tuple() for name, price in prices.items()} == {
+                name: getattr(read, name).as_tuple() for name in prices
+            }
+
+            with pytest.raises(ValueError):
+                table.write_tick(dataclasses.replace(tick, trade_price=Decimal('NaN')))
+
+            # a writer that died in the middle of a write leaves the sequence odd
+            table._buffer[table._tick_offset('KRW-BTC')] += 1
+            with pytest.raises(RuntimeError):
+                table.read_tick('KRW-BTC')
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError
+
+import pytest
+
+from aioupbit.v1 import SyncRestClient, Tick
+from aioupbit.v1.testing import FakeUpbitServer
+
+
+@pytest.fixture
+def server():
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    server = FakeUpbitServer(market_count=10)
+    asyncio.run_coroutine_threadsafe(server.start(), loop).result()
+    yield server
+    asyncio.run_coroutine_threadsafe(server.close(), loop).result()
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join()
+    loop.close()
+
+
+class TestSyncRestClient:
+    def test_calls_from_threads(self, server) -> None:
+        with SyncRestClient(client_class=server.client_class(), limit=4) as client:
+            markets = client.markets()
+            assert 10 == len(markets)
+
+            with ThreadPoolExecutor(8) as executor:
+                results = list(executor.map(lambda _: client.latest_tick(markets), range(32)))
+            assert all(10 == len(ticks) for ticks in results)
+            assert all(isinstance(tick, Tick) for ticks in results for tick in ticks)
+
+            assert 4 == len(client.candles_batch(server.market_codes[:2], count=2))
+
+        with pytest.raises(RuntimeError):
+            client.markets()
+
+    def test_timeout(self, server) -> None:
+        cancelled = threading.Event()
+
+        async def hang(client) -> None:
+            try:
+                await asyncio.sleep(3600)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        with SyncRestClient('access', 'secret' * 8, server.client_class(), timeout=0.05) as client:
+            with pytest.raises(TimeoutError):
+                client.run(hang)
+            # the call does not keep running in the background
+            assert cancelled.wait(1)
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+from aioupbit.v1.constants import Side
+from aioupbit.v1.trade_tape import FileTradeStore, MemoryTradeStore, TradeTapeSyncer
+from aioupbit.v1.values import Trade
+
+_NOW = datetime(2022, 2, 6, 9, 0, tzinfo=timezone.utc)
+
+
+def _trade(days_ago: int, i: int) -> Trade:
+    timestamp = _NOW - timedelta(days=days_ago, seconds=1000 - i)
+    return Trade(
+        ticker='KRW-BTC',
+        timestamp=timestamp,
+        trade_price=Decimal(100 + i),
+        trade_volume=Decimal('0.5'),
+        prev_closing_price=Decimal('100'),
+        change_price=Decimal(i),
+        side=Side.ASK if i % 2 else Side.BID,
+        sequential_id=int(timestamp.timestamp() * 1000) * 10000 + i,
+    )
+
+
+class FakeClient:
+    def __init__(self) -> None:
+        self.tape = {days_ago: [_trade(days_ago, i) for i in range(23)] for days_ago in range(8)}
+        self.calls = 0
+
+    async def latest_trades(self, ticker, to=None, count=1, cursor=None, days_ago=0):
+        self.calls += 1
+        trades = sorted(self.tape[days_ago], key=lambda trade: -trade.sequential_id)
+        if cursor is not None:
+            trades = [trade for trade in trades if trade.sequential_id < cursor]
+        return iter(trades[:count])
+
+
+class TestTradeTapeSyncer:
+    def test_backfill_and_poll(self) -> None:
+        client = FakeClient()
+        store = MemoryTradeStore()
+        syncer = TradeTapeSyncer(client, 'KRW-BTC', store, count=5)
+
+        assert 8 * 23 == asyncio.run(syncer.backfill())
+        assert 8 * 23 == len({trade.sequential_id for trade in store})
+        assert [] == asyncio.run(syncer.poll())
+
+        client.tape[0].extend(_trade(0, i) for i in range(23, 35))
+        client.calls = 0
+        new = asyncio.run(syncer.poll())
+        assert [_trade(0, i) for i in range(23, 35)] == new
+        assert 3 == client.calls
+        assert 8 * 23 + 12 == len(store.trades)
+
+    def test_file_store(self, tmp_path) -> None:
+        trades = [_trade(0, i) for i in range(3)]
+        store = FileTradeStore(tmp_path / 'trades.tsv')
+        try:
+            store.append(trades[:2])
+            store.append(trades[2:])
+        finally:
+            store.close()
+
+        store = FileTradeStore(tmp_path / 'trades.tsv')
+        try:
+            assert trades == list(store)
+        finally:
+            store.close()
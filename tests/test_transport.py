@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import asyncio
+import datetime
+
+import pytest
+
+from aioupbit.v1 import (
+    AioHTTPTransport,
+    HTTPXTransport,
+    MinCandle,
+    RateLimitGroup,
+    RateLimiter,
+    RecordingTransport,
+    ReplayTransport,
+    Response,
+    ResponseCache,
+    ResponseError,
+    TransportRestClient,
+)
+from aioupbit.v1 import endpoints
+from aioupbit.v1.testing import FakeUpbitServer
+
+_TO = datetime.datetime(2022, 2, 6, 9, 22, 30, tzinfo=datetime.timezone.utc)
+
+
+async def _quotations(client):
+    markets = tuple(await client.markets())
+    codes = [market.ticker for market in markets[:3]]
+    return (
+        markets,
+        # candles and trades are generated per request
+        tuple(candle.date_time for candle in await client.candles(codes[0], MinCandle.Unit.MIN5, count=10, to=_TO)),
+        tuple(candle.date_time for candle in await client.candles_day(codes[0], count=3, to=_TO)),
+        len(tuple(await client.latest_trades(codes[0], count=5))),
+        tuple(await client.latest_tick(codes)),
+        tuple(await client.orderbook(codes)),
+    )
+
+
+class TestTransportRestClient:
+    @pytest.mark.parametrize('backend', ['aiohttp', 'httpx'])
+    def test_same_as_aiohttp_client(self, backend) -> None:
+        if backend == 'httpx':
+            pytest.importorskip('httpx')
+
+        async def main() -> None:
+            async with FakeUpbitServer(market_count=5, refresh_interval=3600) as server:
+                if backend == 'httpx':
+                    transport = HTTPXTransport(server.url, http2=False)
+                else:
+                    transport = AioHTTPTransport(server.url)
+                async with transport as bound:
+                    expected = await _quotations(server.client_class())
+                    assert expected == await _quotations(TransportRestClient.using(bound))
+
+        asyncio.run(main())
+
+    def test_replay(self) -> None:
+        async def main() -> None:
+            async with FakeUpbitServer(market_count=5, refresh_interval=3600) as server:
+                recording = RecordingTransport(AioHTTPTransport(server.url))
+                async with recording:
+                    expected = await _quotations(TransportRestClient.using(recording))
+
+            replay = ReplayTransport(recording.records)
+            assert expected == await _quotations(TransportRestClient.using(replay))
+
+            with pytest.raises(ResponseError) as info:
+                await TransportRestClient.using(replay).latest_tick(['KRW-NOTHING'])
+            assert 404 == info.value.status
+
+        asyncio.run(main())
+
+    def test_replay_in_order(self) -> None:
+        replay = ReplayTransport()
+        for price in ('1', '2'):
+            content = f'[{{"market":"KRW-BTC","trade_price":{price}}}]'.encode()
+            replay.add('GET', '/v1/ticker?markets=KRW-BTC', Response(200, {}, content, 'utf-8'))
+
+        async def main() -> None:
+            client = TransportRestClient.using(replay)
+            # the last response is repeated
+            return [(await client._fetch(endpoints.TICKER, 'markets=KRW-BTC', dict))[0] for _ in range(3)]
+
+        assert [1, 2, 2] == [json['trade_price'] for json in asyncio.run(main())]
+
+    def test_cache_limiter_and_instrument(self) -> None:
+        replay = ReplayTransport()
+        for price in ('1', '2'):
+            content = f'[{{"market":"KRW-BTC","trade_price":{price}}}]'.encode()
+            headers = {'Remaining-Req': 'group=ticker; min=600; sec=0'}
+            replay.add('GET', '/v1/ticker?markets=KRW-BTC', Response(200, headers, content, 'utf-8'))
+        reported = []
+
+        async def main() -> None:
+            client = TransportRestClient.using(replay)
+            await client.set_class_level_cache(ResponseCache(ttls=dict(latest_tick=60)))
+            await client.set_class_level_instrument(reported.append)
+            limiter = RateLimiter.for_group(RateLimitGroup.TICKER)
+            ticks = [
+                (await client._fetch(endpoints.TICKER, 'markets=KRW-BTC', dict, limiter=limiter))[0] for _ in range(2)
+            ]
+            # the second request is served from the cache
+            assert [1, 1] == [json['trade_price'] for json in ticks]
+            # the exhausted budget reported by the server holds further requests
+            assert 0 == limiter.available()
+
+        asyncio.run(main())
+        assert ['/v1/ticker'] == [metrics.path for metrics in reported]
+        assert 'ticker' == reported[0].remaining_req.group
+
+    def test_exchange(self) -> None:
+        async def main() -> None:
+            async with FakeUpbitServer(market_count=5, refresh_interval=3600) as server:
+                async with AioHTTPTransport(server.url) as transport:
+                    client = TransportRestClient.using(transport)('access', 'secret' * 8)
+                    assert 3 == len(await client.accounts())
+                    assert 'KRW-C0001' == (await client.market_with_account('KRW-C0001')).market.ticker
+                    assert 'my-order' == (await client.get_order(order_id='my-order')).identifier
+                    await client.cancel_order(order_id='my-order')
+                assert 2 == server.requests['/v1/order']
+
+            # an order that does not exist
+            assert (
+                await TransportRestClient.using(ReplayTransport())('access', 'secret' * 8).get_order(order_id='x')
+                is None
+            )
+
+        asyncio.run(main())
+
+    def test_unbound(self) -> None:
+        with pytest.raises(RuntimeError):
+            asyncio.run(TransportRestClient.markets())
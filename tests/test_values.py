@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import dataclasses
 from datetime import date, datetime, time, timezone
 from decimal import Decimal
 
@@ -10,8 +11,20 @@ try:
 except ImportError:
     from backports.zoneinfo import ZoneInfo  # type: ignore[import]
 
-from aioupbit.v1.constants import Change, MarketWarning, Side
-from aioupbit.v1.values import DayCandle, MinCandle, MonthCandle, Orderbook, Tick, Ticker, Trade, WeekCandle
+from aioupbit.v1.constants import Change, MarketWarning, OrderType, Side
+from aioupbit.v1.values import (
+    DayCandle,
+    MinCandle,
+    MonthCandle,
+    Order,
+    OrderConfig,
+    Orderbook,
+    RemainingReq,
+    Tick,
+    Ticker,
+    Trade,
+    WeekCandle,
+)
 
 
 class TestTicker:
@@ -600,3 +613,84 @@ class TestOrderbook:
     )
     def test_from_json(self, json, expected) -> None:
         assert expected == Orderbook.from_json(json)
+
+
+class TestOrder:
+    _JSON = dict(
+        uuid='9ca023a5-851b-4fec-9f0a-48cd83c2eaae',
+        side='ask',
+        ord_type='limit',
+        price='4280000.0',
+        state='done',
+        market='KRW-BTC',
+        created_at=datetime(2019, 1, 4, 1, 35, 3, tzinfo=timezone.utc),
+        volume='1.0',
+        remaining_volume='0.0',
+        reserved_fee='0.0',
+        remaining_fee='0.0',
+        paid_fee='2140.0',
+        locked='0.0',
+        executed_volume='1.0',
+        trades_count=1,
+    )
+
+    def test_from_json(self) -> None:
+        order = Order.from_json(self._JSON)
+        assert (Decimal('4280000.0'), Decimal('1.0'), Decimal('0.0')) == (
+            order.price,
+            order.volume,
+            order.remaining_volume,
+        )
+
+    def test_market_orders(self) -> None:
+        # a market sell has no price, and a market buy (`price` type) has no volume
+        sell = Order.from_json(dict(self._JSON, ord_type='market', price=None))
+        assert OrderType.MARKET is sell.order_type and sell.price is None
+        buy = Order.from_json(dict(self._JSON, side='bid', ord_type='price', volume=None, remaining_volume=None))
+        assert buy.volume is None and buy.remaining_volume is None
+        assert Decimal('4280000.0') == buy.price
+
+    def test_identifier_optional(self) -> None:
+        order = Order.from_json(self._JSON)
+        assert order.identifier is None
+        fields = {field.name: getattr(order, field.name) for field in dataclasses.fields(order)}
+        del fields['identifier']
+        # constructing without an identifier keeps working
+        assert order == Order(**fields)
+        assert 'order-1' == Order.from_json(dict(self._JSON, identifier='order-1')).identifier
+
+    def test_no_unit_price(self) -> None:
+        json = dict(currency='KRW', price_unit=None, min_total='5000')
+        assert OrderConfig.from_json(json, '0.0005', '1000000000.0').unit_price is None
+        assert Decimal('1000') == OrderConfig.from_json(dict(json, price_unit='1000'), '0', '1').unit_price
+
+
+class TestRemainingReq:
+    @pytest.mark.parametrize(
+        ('header', 'expected'),
+        (
+            ('group=default; min=1800; sec=29', RemainingReq(group='default', min=1800, sec=29)),
+            ('group=candles; min=599; sec=9', RemainingReq(group='candles', min=599, sec=9)),
+            ('group=market; sec=9', RemainingReq(group='market', min=0, sec=9)),
+        ),
+    )
+    def test_from_header(self, header, expected) -> None:
+        assert expected == RemainingReq.from_header(header)
+
+    @pytest.mark.parametrize('header', ('', 'group=default; min=1800', 'sec=29', 'group=default; sec=', 'group; sec=x'))
+    def test_malformed_header(self, header) -> None:
+        assert RemainingReq.from_header(header) is None
+
+
+class TestParsing:
+    def test_interned_tickers(self) -> None:
+        json = dict(
+            market=''.join(('KRW-', 'BTC')), korean_name='비트코인', english_name='Bitcoin', market_warning='NONE'
+        )
+        assert Ticker.from_json(json).ticker is Ticker.from_json(dict(json, market='KRW-' + 'BTC')).ticker
+
+    def test_enum_lookup(self) -> None:
+        json = dict(market='KRW-BTC', korean_name='비트코인', english_name='Bitcoin', market_warning='CAUTION')
+        assert MarketWarning.CAUTION is Ticker.from_json(json).warning
+        with pytest.raises(ValueError):
+            Ticker.from_json(dict(json, market_warning='UNKNOWN'))
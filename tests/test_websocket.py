@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import asyncio
+import datetime
+from decimal import Decimal
+
+import pytest
+
+from aioupbit.v1 import Account, ExchangeStream, Order, OrderState, Side, StreamError
+from aioupbit.v1.testing import FakeUpbitServer, PayloadGenerator
+
+_NOW = datetime.datetime(2022, 2, 6, 9, 22, 30, tzinfo=datetime.timezone.utc)
+
+
+class TestExchangeStream:
+    def test_events(self) -> None:
+        payloads = PayloadGenerator()
+        order_event = payloads.my_order('KRW-C0000', _NOW, state='trade', identifier='my-order')
+        asset_event = payloads.my_asset(('KRW', 'C0000'), _NOW)
+        known = Account('KRW', Decimal(1), Decimal(0), Decimal(0), True, 'KRW')
+
+        async def main() -> None:
+            async with FakeUpbitServer(market_count=3) as server:
+                client = server.client_class()('access', 'secret' * 8)
+                try:
+                    stream = ExchangeStream(client, ['KRW-C0000'], [known], url=server.websocket_url)
+                    async with stream:
+                        while not server.subscriptions:
+                            await asyncio.sleep(0.01)
+                        request = server.subscriptions[0]
+                        assert dict(type='myOrder', codes=['KRW-C0000']) == request[1]
+                        assert dict(type='myAsset') == request[2]
+
+                        await server.publish(order_event)
+                        await server.publish(asset_event)
+                        events = []
+                        async for event in stream:
+                            events.append(event)
+                            if len(events) == 3:
+                                break
+                finally:
+                    await client.close()
+
+            order, krw, coin = events
+            assert isinstance(order, Order)
+            assert OrderState.TRADE is order.state
+            assert str(order.order_uuid) == order_event['uuid']
+            assert Side[order_event['ask_bid']] is order.side
+            assert _NOW == order.created_at
+            assert Decimal(str(order_event['executed_volume'])) == order.executed_volume
+
+            # fields missing from `myAsset` are kept from the known account
+            assert Decimal(str(asset_event['assets'][0]['balance'])) == krw.balance
+            assert known.avg_buy_price_modified is krw.avg_buy_price_modified
+            assert Account('C0000', coin.balance, coin.locked, Decimal(0), False, 'KRW') == coin
+            assert {'KRW': krw, 'C0000': coin} == stream.accounts
+
+        asyncio.run(main())
+
+    def test_parse_error(self) -> None:
+        stream = ExchangeStream(None)  # type: ignore[arg-type]
+        assert [] == stream.parse(b'{"status":"UP"}')
+        with pytest.raises(StreamError) as info:
+            stream.parse(b'{"error":{"name":"INVALID_AUTH","message":"Invalid authorization"}}')
+        assert 'INVALID_AUTH' == info.value.name